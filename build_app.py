@@ -2,10 +2,11 @@
 """
 Build script to create a macOS .app bundle for Screenshot Tool
 """
+import io
 import os
 import sys
 import shutil
-import subprocess
+import struct
 from pathlib import Path
 
 # Paths
@@ -16,6 +17,29 @@ CONTENTS = APP_BUNDLE / "Contents"
 MACOS = CONTENTS / "MacOS"
 RESOURCES = CONTENTS / "Resources"
 
+# .icns entry types and their PNG pixel sizes
+ICNS_TYPES = {
+    b'icp4': 16,
+    b'icp5': 32,
+    b'icp6': 64,
+    b'ic07': 128,
+    b'ic08': 256,
+    b'ic09': 512,
+    b'ic10': 1024,  # 512x512@2x
+    b'ic11': 32,    # 16x16@2x
+    b'ic12': 64,    # 32x32@2x
+    b'ic13': 256,   # 128x128@2x
+    b'ic14': 512,   # 256x256@2x
+}
+
+def link_or_copy(src, dst):
+    """Hardlink a file, copying it if linking fails (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
 def create_app_structure():
     """Create the .app bundle directory structure."""
     print("Creating app structure...")
@@ -28,12 +52,12 @@ def create_app_structure():
     MACOS.mkdir(parents=True)
     RESOURCES.mkdir(parents=True)
 
-    # Copy source files
+    # Hardlink source files (falls back to copying)
     src_dest = RESOURCES / "src"
-    shutil.copytree(PROJECT_DIR / "src", src_dest)
+    shutil.copytree(PROJECT_DIR / "src", src_dest, copy_function=link_or_copy)
 
-    # Copy main.py
-    shutil.copy(PROJECT_DIR / "main.py", RESOURCES / "main.py")
+    # Link main.py
+    link_or_copy(PROJECT_DIR / "main.py", RESOURCES / "main.py")
 
 def create_launcher():
     """Create the launcher script."""
@@ -63,7 +87,7 @@ export PYTHONPATH="$APP_DIR"
 
 # Run the app
 cd "$APP_DIR"
-exec "$VENV_PYTHON" "$APP_DIR/main.py"
+exec "$VENV_PYTHON" -m main
 '''
 
     launcher_path.write_text(launcher_content)
@@ -127,54 +151,51 @@ def create_icon():
     try:
         from PIL import Image, ImageDraw, ImageFont
 
-        # Create icon at multiple sizes
-        sizes = [16, 32, 64, 128, 256, 512, 1024]
-
-        iconset_path = RESOURCES / "AppIcon.iconset"
-        iconset_path.mkdir(exist_ok=True)
-
-        for size in sizes:
-            img = Image.new('RGBA', (size, size), (45, 45, 48, 255))
-            draw = ImageDraw.Draw(img)
-
-            # Draw a camera/frame icon shape
-            margin = size // 8
-            rect_bounds = [margin, margin, size - margin, size - margin]
-
-            # Outer rectangle (frame)
-            draw.rounded_rectangle(rect_bounds, radius=size//10,
-                                   outline=(76, 175, 80, 255), width=max(1, size//20))
-
-            # Inner play/capture symbol
-            center = size // 2
-            triangle_size = size // 4
-            points = [
-                (center - triangle_size//2, center - triangle_size//2),
-                (center - triangle_size//2, center + triangle_size//2),
-                (center + triangle_size//2, center)
-            ]
-            draw.polygon(points, fill=(76, 175, 80, 255))
-
-            # Save different sizes
-            img.save(iconset_path / f"icon_{size}x{size}.png")
-            if size <= 512:
-                img_2x = img.resize((size*2, size*2), Image.Resampling.LANCZOS)
-                img_2x.save(iconset_path / f"icon_{size}x{size}@2x.png")
-
-        # Convert iconset to icns using iconutil
-        icns_path = RESOURCES / "AppIcon.icns"
-        subprocess.run(['iconutil', '-c', 'icns', str(iconset_path), '-o', str(icns_path)],
-                      check=True, capture_output=True)
-
-        # Clean up iconset
-        shutil.rmtree(iconset_path)
+        # Draw the icon once at full resolution
+        size = 1024
+        master = Image.new('RGBA', (size, size), (45, 45, 48, 255))
+        draw = ImageDraw.Draw(master)
+
+        # Draw a camera/frame icon shape
+        margin = size // 8
+        rect_bounds = [margin, margin, size - margin, size - margin]
+
+        # Outer rectangle (frame)
+        draw.rounded_rectangle(rect_bounds, radius=size//10,
+                               outline=(76, 175, 80, 255), width=max(1, size//20))
+
+        # Inner play/capture symbol
+        center = size // 2
+        triangle_size = size // 4
+        points = [
+            (center - triangle_size//2, center - triangle_size//2),
+            (center - triangle_size//2, center + triangle_size//2),
+            (center + triangle_size//2, center)
+        ]
+        draw.polygon(points, fill=(76, 175, 80, 255))
+
+        # Downsample to every pixel size used by the .icns entries
+        png_data = {}
+        for pixels in sorted(set(ICNS_TYPES.values())):
+            img = master if pixels == size else master.resize(
+                (pixels, pixels), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, format='PNG')
+            png_data[pixels] = buffer.getvalue()
+
+        # Write the .icns container directly: header, then one
+        # (type, length, PNG data) block per entry, lengths big-endian
+        blocks = b''.join(
+            icns_type + struct.pack('>I', 8 + len(png_data[pixels])) + png_data[pixels]
+            for icns_type, pixels in ICNS_TYPES.items()
+        )
+        icns = b'icns' + struct.pack('>I', 8 + len(blocks)) + blocks
+        (RESOURCES / "AppIcon.icns").write_bytes(icns)
 
         print("  Icon created successfully")
 
     except ImportError:
         print("  Pillow not available, skipping icon creation")
-    except subprocess.CalledProcessError:
-        print("  iconutil failed, skipping icon creation")
     except Exception as e:
         print(f"  Icon creation failed: {e}")
 
@@ -13,17 +13,11 @@ Funktionen:
 
 Verwendung:
     python main.py
+    python -m main
 
 Autor: Podcast Screenshot Tool
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
 from src.gui.main_window import run_app
 
 
@@ -1,6 +1,7 @@
 from .video_analyzer import VideoAnalyzer
 from .face_detector import FaceDetector
 from .motion_analyzer import MotionAnalyzer
-from .frame_scorer import FrameScorer
+from .frame_scorer import FrameScorer, FrameScores, get_scorer
 from .screenshot_exporter import ScreenshotExporter
 from .project_types import ProjectTypes, ProjectTypeSettings
+from .pyav_reader import PyAVReader
@@ -2,36 +2,53 @@
 Face Detector - Detects faces in video frames using OpenCV
 Optimized for fast detection on long videos
 """
+import threading
 import cv2
 import numpy as np
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+# YuNet ONNX model from the OpenCV model zoo. If present, a single DNN pass
+# replaces the Haar cascade stack; otherwise we fall back to the cascades.
+YUNET_MODEL_PATH = Path(__file__).parent / "models" / "face_detection_yunet_2023mar.onnx"
+
+
+# Parsed cascades, cached per thread (a classifier must not be shared between
+# threads, but detectors re-created in the same thread can reuse it)
+_cascade_cache = threading.local()
+
+
+def _load_cascade(filename: str) -> cv2.CascadeClassifier:
+    """Load a Haar cascade from OpenCV's data dir, parsing the XML only once."""
+    cache = getattr(_cascade_cache, 'classifiers', None)
+    if cache is None:
+        cache = _cascade_cache.classifiers = {}
+    if filename not in cache:
+        cache[filename] = cv2.CascadeClassifier(cv2.data.haarcascades + filename)
+    return cache[filename]
+
 
 class FaceDetector:
-    """Detects faces in images using OpenCV Haar Cascades."""
+    """Detects faces in images using OpenCV YuNet (DNN) or Haar Cascades."""
 
-    def __init__(self, fast_mode: bool = True):
+    def __init__(
+        self,
+        fast_mode: bool = True,
+        model_path: Optional[str] = None,
+        use_opencl: bool = True
+    ):
         """
         Initialize face detector.
 
         Args:
             fast_mode: If True, uses faster detection with lower accuracy
+            model_path: Optional path to a YuNet .onnx model
+            use_opencl: Run detection on the GPU via OpenCL if available
         """
-        # Load Haar Cascade classifiers
-        cv2_data_path = cv2.data.haarcascades
-
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2_data_path + 'haarcascade_frontalface_default.xml'
-        )
-        self.eye_cascade = cv2.CascadeClassifier(
-            cv2_data_path + 'haarcascade_eye.xml'
-        )
-        self.profile_cascade = cv2.CascadeClassifier(
-            cv2_data_path + 'haarcascade_profileface.xml'
-        )
-
         self.fast_mode = fast_mode
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
         # Detection parameters based on mode
         if fast_mode:
             self.scale_factor = 1.2  # Faster but less accurate
@@ -42,12 +59,42 @@ class FaceDetector:
             self.min_neighbors = 5
             self.detection_width = 640
 
-    def _prepare_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
+        self.dnn_detector = self._create_dnn_detector(model_path or YUNET_MODEL_PATH)
+
+        self.face_cascade = None
+        self.eye_cascade = None
+        self.profile_cascade = None
+        if self.dnn_detector is None:
+            # Load Haar Cascade classifiers
+            self.face_cascade = _load_cascade('haarcascade_frontalface_default.xml')
+            self.eye_cascade = _load_cascade('haarcascade_eye.xml')
+            self.profile_cascade = _load_cascade('haarcascade_profileface.xml')
+
+    def _create_dnn_detector(self, model_path) -> Optional["cv2.FaceDetectorYN"]:
+        """Create the YuNet detector, or None if the model is unavailable."""
+        if not hasattr(cv2, 'FaceDetectorYN_create') or not Path(model_path).exists():
+            return None
+
+        target = cv2.dnn.DNN_TARGET_OPENCL if self.use_opencl else cv2.dnn.DNN_TARGET_CPU
+        try:
+            return cv2.FaceDetectorYN_create(
+                str(model_path),
+                "",
+                (self.detection_width, self.detection_width),
+                score_threshold=0.7,
+                nms_threshold=0.3,
+                target_id=target
+            )
+        except cv2.error as e:
+            print(f"Error loading face model: {e}")
+            return None
+
+    def _resize_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
         """
-        Prepare frame for detection (resize for speed).
+        Resize frame to the detection width.
 
         Returns:
-            Tuple of (resized_gray_frame, scale_factor)
+            Tuple of (resized_bgr_frame, scale_factor)
         """
         h, w = frame.shape[:2]
         scale = self.detection_width / w if w > self.detection_width else 1.0
@@ -55,27 +102,80 @@ class FaceDetector:
         if scale < 1.0:
             new_w = int(w * scale)
             new_h = int(h * scale)
-            resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
+            # Bilinear is much cheaper than area averaging and good enough
+            # for the fast mode detector
+            interpolation = cv2.INTER_LINEAR if self.fast_mode else cv2.INTER_AREA
+            resized = cv2.resize(frame, (new_w, new_h), interpolation=interpolation)
         else:
             resized = frame
             scale = 1.0
 
+        return resized, scale
+
+    def _prepare_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Prepare frame for detection (resize for speed).
+
+        Returns:
+            Tuple of (resized_gray_frame, scale_factor)
+        """
+        resized, scale = self._resize_frame(frame)
         gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY)
         return gray, scale
 
-    def detect_faces(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    def _detect_dnn(
+        self,
+        small: np.ndarray,
+        scale: float,
+        min_face: int
+    ) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
         """
-        Detect faces in a frame.
+        Detect faces with YuNet (frontal and profile in one pass).
 
         Args:
-            frame: BGR image as numpy array
+            small: Resized BGR frame
+            scale: Scale factor of the resized frame
+            min_face: Minimum face size in original pixels
 
         Returns:
-            List of face rectangles (x, y, w, h)
+            Tuple of (face rectangles, detection confidences)
         """
-        gray, scale = self._prepare_frame(frame)
+        h, w = small.shape[:2]
+        min_size = min_face * scale
+
+        self.dnn_detector.setInputSize((w, h))
+        _, detections = self.dnn_detector.detect(small)
+
+        faces = []
+        confidences = []
+        if detections is not None:
+            for det in detections:
+                x, y, fw, fh = det[:4]
+                if fw < min_size or fh < min_size:
+                    continue
+                faces.append((
+                    int(x / scale),
+                    int(y / scale),
+                    int(fw / scale),
+                    int(fh / scale)
+                ))
+                confidences.append(float(det[14]))
+
+        return faces, confidences
+
+    def _detect_haar(
+        self,
+        gray: np.ndarray,
+        scale: float
+    ) -> List[Tuple[int, int, int, int]]:
+        """Detect faces with the Haar cascades on a prepared gray frame."""
         min_size = int(40 * scale) if self.fast_mode else int(60 * scale)
 
+        # Upload once as UMat: runs the cascades through OpenCL when available,
+        # and in accurate mode lets both cascades share the same buffer
+        if self.use_opencl or not self.fast_mode:
+            gray = cv2.UMat(gray)
+
         # Detect frontal faces
         faces = self.face_cascade.detectMultiScale(
             gray,
@@ -116,6 +216,62 @@ class FaceDetector:
 
         return all_faces
 
+    def _detect_prepared(
+        self,
+        gray: Optional[np.ndarray],
+        scale: float,
+        small: Optional[np.ndarray] = None
+    ) -> Tuple[List[Tuple[int, int, int, int]], Optional[List[float]]]:
+        """
+        Detect faces on an already resized frame.
+
+        Returns:
+            Tuple of (face rectangles, DNN confidences or None for Haar)
+        """
+        if self.dnn_detector is not None:
+            if small is None:
+                small = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+            return self._detect_dnn(small, scale, 40 if self.fast_mode else 60)
+
+        return self._detect_haar(gray, scale), None
+
+    def detect_faces(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """
+        Detect faces in a frame.
+
+        Args:
+            frame: BGR image as numpy array
+
+        Returns:
+            List of face rectangles (x, y, w, h)
+        """
+        small, scale = self._resize_frame(frame)
+        gray = None
+        if self.dnn_detector is None:
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        return self.detect_faces_gray(gray, scale, small)
+
+    def detect_faces_gray(
+        self,
+        gray: Optional[np.ndarray],
+        scale: float,
+        small: Optional[np.ndarray] = None
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        Detect faces in a frame that was already resized and grayscaled.
+
+        Args:
+            gray: Resized grayscale frame (may be None with the DNN detector)
+            scale: Scale factor used for resizing
+            small: Resized BGR frame (used by the DNN detector if given)
+
+        Returns:
+            List of face rectangles (x, y, w, h) in original coordinates
+        """
+        faces, _ = self._detect_prepared(gray, scale, small)
+        return faces
+
     def detect_faces_fast(self, frame: np.ndarray) -> bool:
         """
         Quick check if any faces are present.
@@ -126,8 +282,15 @@ class FaceDetector:
         Returns:
             True if at least one face detected
         """
+        if self.dnn_detector is not None:
+            small, scale = self._resize_frame(frame)
+            faces, _ = self._detect_dnn(small, scale, 40)
+            return len(faces) > 0
+
         gray, scale = self._prepare_frame(frame)
         min_size = int(40 * scale)
+        if self.use_opencl:
+            gray = cv2.UMat(gray)
 
         faces = self.face_cascade.detectMultiScale(
             gray,
@@ -146,17 +309,17 @@ class FaceDetector:
         threshold: float = 0.5
     ) -> bool:
         """Check if a rectangle overlaps significantly with any in the list."""
+        if len(rects) == 0:
+            return False
+
+        # IoU against all rectangles at once
+        r = np.asarray(rects, dtype=np.int64).reshape(-1, 4)
         x1, y1, w1, h1 = rect
-        for x2, y2, w2, h2 in rects:
-            ix = max(0, min(x1 + w1, x2 + w2) - max(x1, x2))
-            iy = max(0, min(y1 + h1, y2 + h2) - max(y1, y2))
-            intersection = ix * iy
-            area1 = w1 * h1
-            area2 = w2 * h2
-            union = area1 + area2 - intersection
-            if union > 0 and intersection / union > threshold:
-                return True
-        return False
+        ix = np.maximum(0, np.minimum(x1 + w1, r[:, 0] + r[:, 2]) - np.maximum(x1, r[:, 0]))
+        iy = np.maximum(0, np.minimum(y1 + h1, r[:, 1] + r[:, 3]) - np.maximum(y1, r[:, 1]))
+        intersection = ix * iy
+        union = w1 * h1 + r[:, 2] * r[:, 3] - intersection
+        return bool(np.any((union > 0) & (intersection > threshold * union)))
 
     def calculate_face_score(self, frame: np.ndarray, skip_eyes: bool = True) -> float:
         """
@@ -169,42 +332,69 @@ class FaceDetector:
         Returns:
             Score between 0 and 1
         """
-        faces = self.detect_faces(frame)
+        small, scale = self._resize_frame(frame)
+        gray = None
+        if self.dnn_detector is None:
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        return self.calculate_face_score_gray(frame, gray, scale, small, skip_eyes)
+
+    def calculate_face_score_gray(
+        self,
+        frame: np.ndarray,
+        gray: Optional[np.ndarray],
+        scale: float,
+        small: Optional[np.ndarray] = None,
+        skip_eyes: bool = True
+    ) -> float:
+        """
+        Calculate the face quality score from an already prepared frame.
+
+        Args:
+            frame: Original BGR image (used for frame size and eye detection)
+            gray: Resized grayscale frame (may be None with the DNN detector)
+            scale: Scale factor used for resizing
+            small: Resized BGR frame
+            skip_eyes: Skip eye detection for speed
+
+        Returns:
+            Score between 0 and 1
+        """
+        faces, confidences = self._detect_prepared(gray, scale, small)
 
         if len(faces) == 0:
             return 0.0
 
         height, width = frame.shape[:2]
         frame_area = width * height
-        frame_center_x = width / 2
-        frame_center_y = height / 2
-
-        max_score = 0.0
-
-        for face in faces:
-            x, y, w, h = face
-            face_area = w * h
-
-            # Size score (larger faces are better, up to a point)
-            size_ratio = face_area / frame_area
-            size_score = min(1.0, size_ratio * 10)
-
-            # Position score (centered is better)
-            face_center_x = x + w / 2
-            face_center_y = y + h / 2
-            dist_x = abs(face_center_x - frame_center_x) / (width / 2)
-            dist_y = abs(face_center_y - frame_center_y) / (height / 2)
-            position_score = 1.0 - (dist_x * 0.5 + dist_y * 0.5)
-
-            # Skip eye detection in fast mode
-            if skip_eyes:
-                eye_score = 0.5  # Assume average
-            else:
-                eyes = self._detect_eyes_in_face(frame, face)
-                eye_score = min(1.0, len(eyes) / 2)
-
-            face_score = (size_score * 0.35 + position_score * 0.35 + eye_score * 0.3)
-            max_score = max(max_score, face_score)
+        half_w = width / 2
+        half_h = height / 2
+
+        # Score all faces at once on an (N, 4) array
+        rects = np.asarray(faces, dtype=np.float64).reshape(-1, 4)
+        x, y, w, h = rects.T
+
+        # Size score (larger faces are better, up to a point)
+        size_score = np.minimum(1.0, (w * h) / frame_area * 10)
+
+        # Position score (centered is better)
+        dist_x = np.abs(x + w / 2 - half_w) / half_w
+        dist_y = np.abs(y + h / 2 - half_h) / half_h
+        position_score = 1.0 - (dist_x * 0.5 + dist_y * 0.5)
+
+        # DNN confidence (landmark-backed) replaces the eye cascade
+        if confidences is not None:
+            eye_score = np.asarray(confidences, dtype=np.float64)
+        elif skip_eyes:
+            eye_score = 0.5  # Assume average
+        else:
+            eye_score = np.array([
+                min(1.0, len(self._detect_eyes_in_face(frame, face)) / 2)
+                for face in faces
+            ])
+
+        face_scores = size_score * 0.35 + position_score * 0.35 + eye_score * 0.3
+        max_score = max(0.0, float(face_scores.max()))
 
         # Bonus for multiple faces (podcast with multiple hosts)
         multi_face_bonus = min(0.15, (len(faces) - 1) * 0.075)
@@ -2,12 +2,29 @@
 Frame Scorer - Combines face detection and motion analysis for frame scoring
 Optimized for fast scoring on long videos
 """
+import os
+import bisect
+import heapq
+import threading
+import functools
+import itertools
+import cv2
 import numpy as np
-from typing import List, Tuple, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Iterable, Generator, Optional, Callable, NamedTuple
 from .face_detector import FaceDetector
 from .motion_analyzer import MotionAnalyzer
 
 
+class FrameScores(NamedTuple):
+    """Individual and weighted total scores of a frame."""
+    face_score: float
+    sharpness: float
+    stability: float
+    total_score: float
+
+
 class FrameScorer:
     """
     Scores video frames based on multiple quality criteria.
@@ -36,14 +53,49 @@ class FrameScorer:
         self.face_detector = FaceDetector(fast_mode=fast_mode)
         self.motion_analyzer = MotionAnalyzer(fast_mode=fast_mode)
         self.fast_mode = fast_mode
+        # Shared resolution so the frame is resized and grayscaled only once
+        self.analysis_width = max(
+            self.face_detector.detection_width,
+            self.motion_analyzer.analysis_width
+        )
 
-        # Normalize weights
-        total = face_weight + sharpness_weight + stability_weight
-        self.face_weight = face_weight / total
-        self.sharpness_weight = sharpness_weight / total
-        self.stability_weight = stability_weight / total
+        self.set_weights(face_weight, sharpness_weight, stability_weight)
+
+        # Per-thread face detectors for parallel scoring (cascades/DNN
+        # instances must not be shared between threads)
+        self._local = threading.local()
+
+    def _get_thread_face_detector(self) -> FaceDetector:
+        """Get the face detector owned by the current thread."""
+        detector = getattr(self._local, 'face_detector', None)
+        if detector is None:
+            detector = FaceDetector(fast_mode=self.fast_mode)
+            self._local.face_detector = detector
+        return detector
 
-    def score_frame(self, frame: np.ndarray) -> Dict[str, float]:
+    def _prepare_once(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Resize and grayscale a frame once for all scorers.
+
+        Returns:
+            Tuple of (resized_bgr_frame, resized_gray_frame, scale_factor)
+        """
+        h, w = frame.shape[:2]
+        if w > self.analysis_width:
+            scale = self.analysis_width / w
+            small = cv2.resize(
+                frame,
+                (int(w * scale), int(h * scale)),
+                interpolation=cv2.INTER_AREA
+            )
+        else:
+            scale = 1.0
+            small = frame
+
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small, gray, scale
+
+    def score_frame(self, frame: np.ndarray) -> FrameScores:
         """
         Calculate comprehensive score for a single frame.
 
@@ -51,11 +103,19 @@ class FrameScorer:
             frame: BGR image as numpy array
 
         Returns:
-            Dictionary with individual scores and total score
+            FrameScores with individual scores and total score
         """
+        return self._score_with(frame, self.face_detector)
+
+    def _score_with(self, frame: np.ndarray, face_detector: FaceDetector) -> FrameScores:
+        """Score a frame using the given face detector."""
+        small, gray, scale = self._prepare_once(frame)
+
         # Calculate individual scores
-        face_score = self.face_detector.calculate_face_score(frame, skip_eyes=self.fast_mode)
-        sharpness = self.motion_analyzer.calculate_sharpness(frame)
+        face_score = face_detector.calculate_face_score_gray(
+            frame, gray, scale, small, skip_eyes=self.fast_mode
+        )
+        sharpness = self.motion_analyzer.calculate_sharpness_gray(gray)
 
         if self.fast_mode:
             # In fast mode, use sharpness as stability proxy
@@ -64,18 +124,38 @@ class FrameScorer:
             stability = self.motion_analyzer.calculate_stability_score(frame)
 
         # Calculate weighted total
+        face_w, sharpness_w, stability_w = self._weights
         total_score = (
-            face_score * self.face_weight +
-            sharpness * self.sharpness_weight +
-            stability * self.stability_weight
+            face_score * face_w +
+            sharpness * sharpness_w +
+            stability * stability_w
         )
 
-        return {
-            'face_score': face_score,
-            'sharpness': sharpness,
-            'stability': stability,
-            'total_score': total_score
-        }
+        return FrameScores(face_score, sharpness, stability, total_score)
+
+    def score_batch(
+        self,
+        frames: Iterable[np.ndarray],
+        num_workers: Optional[int] = None
+    ) -> List[FrameScores]:
+        """
+        Score many frames at once.
+
+        In fast mode the batch is spread over a thread pool; accurate mode
+        scores serially because stability depends on frame order.
+
+        Args:
+            frames: BGR images
+            num_workers: Scoring threads (default: CPU count)
+
+        Returns:
+            FrameScores per frame, in input order
+        """
+        if self.fast_mode:
+            scored = self._score_parallel(enumerate(frames), num_workers or os.cpu_count() or 1)
+            return [details for _, _, details in scored]
+
+        return [self.score_frame(frame) for frame in frames]
 
     def score_frame_fast(self, frame: np.ndarray) -> float:
         """
@@ -96,53 +176,182 @@ class FrameScorer:
         else:
             return sharpness * 0.3
 
+    @staticmethod
+    def iter_sampled(
+        cap: cv2.VideoCapture,
+        stride: int,
+        total: Optional[int] = None
+    ) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """
+        Iterate over every n-th frame of an opened capture without seeking.
+
+        Skipped frames are only grabbed (demuxed), the YUV->BGR conversion
+        runs for sampled frames only via retrieve().
+
+        Args:
+            cap: Opened VideoCapture, positioned at the first frame to read
+            stride: Yield every `stride`-th frame
+            total: Number of frames to step through (default: frame count)
+
+        Yields:
+            (frame_number, frame_image) tuples relative to the start position
+        """
+        if total is None:
+            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        stride = max(1, stride)
+
+        for i in range(total):
+            if not cap.grab():
+                break
+            if i % stride == 0:
+                ret, frame = cap.retrieve()
+                if ret:
+                    yield i, frame
+
+    def _refine_coarse(
+        self,
+        coarse_iter: Iterable[Tuple[int, np.ndarray]],
+        num_candidates: int,
+        refine: Optional[Callable[[int], Iterable[Tuple[int, np.ndarray]]]]
+    ) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """
+        Pre-filter coarse frames (e.g. keyframes) with the fast scorer.
+
+        Yields the top candidates, or their neighborhoods if `refine` is given.
+        Only the current top candidates are kept in memory.
+        """
+        # Min-heap of (score, -order, frame_number, frame); -order breaks ties
+        # in favor of earlier frames and keeps frames out of comparisons
+        top = []
+        for order, (frame_num, frame) in enumerate(coarse_iter):
+            item = (self.score_frame_fast(frame), -order, frame_num, frame)
+            if len(top) < num_candidates:
+                heapq.heappush(top, item)
+            elif item > top[0]:
+                heapq.heapreplace(top, item)
+
+        for _, _, frame_num, frame in sorted(top, reverse=True):
+            if refine is None:
+                yield frame_num, frame
+            else:
+                yield from refine(frame_num)
+
     def find_best_frames(
         self,
-        frames: List[Tuple[int, np.ndarray]],
+        frames: Optional[Iterable[Tuple[int, np.ndarray]]] = None,
         num_frames: int = 5,
-        min_interval: int = 30
-    ) -> List[Tuple[int, float, Dict[str, float]]]:
+        min_interval: int = 30,
+        coarse_iter: Optional[Iterable[Tuple[int, np.ndarray]]] = None,
+        refine: Optional[Callable[[int], Iterable[Tuple[int, np.ndarray]]]] = None,
+        num_workers: Optional[int] = None
+    ) -> List[Tuple[int, float, FrameScores]]:
         """
         Find the best frames from a list.
 
         Args:
-            frames: List of (frame_number, frame_image) tuples
+            frames: Iterable of (frame_number, frame_image) tuples,
+                e.g. from iter_sampled()
             num_frames: Number of best frames to return
             min_interval: Minimum frame interval between selected frames
+            coarse_iter: Optional coarse frames (e.g. PyAVReader.iter_keyframes())
+                used instead of `frames`; only the best ones get full scoring
+            refine: Optional callback(frame_number) yielding the neighborhood
+                of a coarse candidate (e.g. PyAVReader.iter_neighborhood)
+            num_workers: Scoring threads (default: CPU count). Only used in
+                fast mode, accurate mode depends on frame order.
 
         Returns:
             List of (frame_number, total_score, score_details) tuples
         """
+        if coarse_iter is not None:
+            frames = self._refine_coarse(coarse_iter, num_frames * 3, refine)
+
         # Score all frames
-        scored_frames = []
-        for frame_num, frame in frames:
-            scores = self.score_frame(frame)
-            scored_frames.append((frame_num, scores['total_score'], scores))
+        if self.fast_mode:
+            scored_frames = self._score_parallel(frames, num_workers or os.cpu_count() or 1)
+        else:
+            scored_frames = []
+            for frame_num, frame in frames:
+                scores = self.score_frame(frame)
+                scored_frames.append((frame_num, scores.total_score, scores))
 
         # Sort by score descending
         scored_frames.sort(key=lambda x: x[1], reverse=True)
 
         # Select best frames with minimum interval
+        selected = self.select_spaced(scored_frames, num_frames, min_interval)
+
+        # Sort by frame number for chronological order
+        selected.sort(key=lambda x: x[0])
+
+        return selected
+
+    @staticmethod
+    def select_spaced(scored_frames: Iterable[tuple], num_frames: int, min_interval: int) -> list:
+        """
+        Greedily pick frames that are at least `min_interval` frames apart.
+
+        Args:
+            scored_frames: Tuples starting with the frame number, best first
+            num_frames: Maximum number of frames to pick
+            min_interval: Minimum frame distance between picked frames
+
+        Returns:
+            Picked tuples in input (score) order
+        """
         selected = []
-        for frame_num, score, details in scored_frames:
+        selected_nums = []  # kept sorted for bisect
+        for item in scored_frames:
             if len(selected) >= num_frames:
                 break
+            frame_num = item[0]
 
-            # Check interval constraint
-            too_close = False
-            for selected_num, _, _ in selected:
-                if abs(frame_num - selected_num) < min_interval:
-                    too_close = True
-                    break
+            # Check interval constraint against the nearest neighbors only
+            idx = bisect.bisect_left(selected_nums, frame_num)
+            too_close = (
+                (idx > 0 and frame_num - selected_nums[idx - 1] < min_interval) or
+                (idx < len(selected_nums) and selected_nums[idx] - frame_num < min_interval)
+            )
 
             if not too_close:
-                selected.append((frame_num, score, details))
-
-        # Sort by frame number for chronological order
-        selected.sort(key=lambda x: x[0])
+                selected.append(item)
+                selected_nums.insert(idx, frame_num)
 
         return selected
 
+    def _score_parallel(
+        self,
+        frames: Iterable[Tuple[int, np.ndarray]],
+        num_workers: int
+    ) -> List[Tuple[int, float, FrameScores]]:
+        """
+        Score frames on a thread pool.
+
+        OpenCV releases the GIL in its kernels, so threads scale with cores.
+        The pool is shared and long-lived, so its threads keep their face
+        detectors across batches; OpenCV's process-wide thread setting is
+        left alone (other threads, e.g. exports, keep using it meanwhile).
+        """
+        def score_one(item):
+            frame_num, frame = item
+            scores = self._score_with(frame, self._get_thread_face_detector())
+            return frame_num, scores.total_score, scores
+
+        pool = _scoring_pool(num_workers)
+        frames = iter(frames)
+        results = []
+        pending = deque()
+        # Keep a couple of frames per worker in flight, so a lazy source
+        # (e.g. iter_sampled) isn't decoded into memory all at once
+        for item in itertools.islice(frames, 2 * num_workers):
+            pending.append(pool.submit(score_one, item))
+        while pending:
+            results.append(pending.popleft().result())
+            for item in itertools.islice(frames, 1):
+                pending.append(pool.submit(score_one, item))
+
+        return results
+
     def reset(self):
         """Reset analyzer state for new video."""
         self.motion_analyzer.reset()
@@ -153,8 +362,39 @@ class FrameScorer:
         sharpness_weight: float,
         stability_weight: float
     ):
-        """Update scoring weights."""
+        """Update scoring weights (normalized to sum to 1)."""
         total = face_weight + sharpness_weight + stability_weight
         self.face_weight = face_weight / total
         self.sharpness_weight = sharpness_weight / total
         self.stability_weight = stability_weight / total
+        self._weights = (self.face_weight, self.sharpness_weight, self.stability_weight)
+
+
+@functools.lru_cache(maxsize=None)
+def _scoring_pool(num_workers: int) -> ThreadPoolExecutor:
+    """Get the scoring thread pool for a worker count (created once, cached)."""
+    return ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix='frame-scorer')
+
+
+@functools.lru_cache(maxsize=2)
+def _shared_scorer(fast_mode: bool) -> FrameScorer:
+    """Create the shared scorer for a mode (cached)."""
+    return FrameScorer(fast_mode=fast_mode)
+
+
+def get_scorer(fast_mode: bool = True) -> FrameScorer:
+    """
+    Get the shared FrameScorer for a mode.
+
+    Keeps detectors and analyzer buffers alive across project changes;
+    reconfigure it with set_weights() instead of creating a new scorer.
+    Not meant for concurrent analyses with different weights.
+
+    Args:
+        fast_mode: Use fast detection algorithms
+
+    Returns:
+        Shared FrameScorer instance
+    """
+    # Normalize the key so get_scorer() and get_scorer(True) hit the same entry
+    return _shared_scorer(bool(fast_mode))
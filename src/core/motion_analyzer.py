@@ -10,14 +10,19 @@ from typing import Optional, Tuple
 class MotionAnalyzer:
     """Analyzes frames for sharpness and motion blur."""
 
-    def __init__(self, fast_mode: bool = True):
+    def __init__(self, fast_mode: bool = True, use_opencl: bool = True):
         """
         Initialize motion analyzer.
 
         Args:
             fast_mode: If True, uses faster analysis with lower accuracy
+            use_opencl: Run filter kernels on the GPU via OpenCL if available
         """
-        self.previous_frame = None
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        # Perceptual hash of the previous frame
+        self._prev_hash = None
         self.fast_mode = fast_mode
         # Analysis resolution
         self.analysis_width = 320 if fast_mode else 640
@@ -32,6 +37,18 @@ class MotionAnalyzer:
             return cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
         return frame
 
+    def _laplacian_variance(self, gray: np.ndarray) -> float:
+        """Variance of the Laplacian (int16 output, single-pass variance)."""
+        if self.use_opencl:
+            gray = cv2.UMat(gray)
+
+        laplacian = cv2.Laplacian(gray, cv2.CV_16S)
+        _, std = cv2.meanStdDev(laplacian)
+        if isinstance(std, cv2.UMat):
+            std = std.get()
+
+        return float(std[0, 0]) ** 2
+
     def calculate_sharpness(self, frame: np.ndarray) -> float:
         """
         Calculate sharpness score using Laplacian variance.
@@ -46,9 +63,19 @@ class MotionAnalyzer:
         small = self._prepare_frame(frame)
         gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
 
-        # Calculate Laplacian variance
-        laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-        variance = laplacian.var()
+        return self.calculate_sharpness_gray(gray)
+
+    def calculate_sharpness_gray(self, gray: np.ndarray) -> float:
+        """
+        Calculate sharpness score on an already resized grayscale frame.
+
+        Args:
+            gray: Grayscale image at analysis resolution
+
+        Returns:
+            Sharpness score (normalized 0-1)
+        """
+        variance = self._laplacian_variance(gray)
 
         # Normalize to 0-1 range
         normalized = min(1.0, variance / 500.0)
@@ -60,18 +87,24 @@ class MotionAnalyzer:
         Ultra-fast sharpness check for pre-filtering.
 
         Args:
-            frame: BGR image
+            frame: BGR image, or an already converted grayscale image
 
         Returns:
             Sharpness score (normalized 0-1)
         """
-        # Very small image for quick check
+        # Very small image for quick check: decimate by an integer stride
+        # (~160px wide), only the sampled pixels get converted. INTER_NEAREST
+        # with an integer ratio is a plain strided copy in a single C pass.
         h, w = frame.shape[:2]
-        small = cv2.resize(frame, (160, int(160 * h / w)), interpolation=cv2.INTER_AREA)
-        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        stride = max(1, w // 160)
+        small = cv2.resize(
+            frame,
+            (max(1, w // stride), max(1, h // stride)),
+            interpolation=cv2.INTER_NEAREST
+        )
+        gray = small if small.ndim == 2 else cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
 
-        laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-        variance = laplacian.var()
+        variance = self._laplacian_variance(gray)
 
         return min(1.0, variance / 500.0)
 
@@ -92,20 +125,18 @@ class MotionAnalyzer:
         small = self._prepare_frame(frame)
         gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
 
-        # Apply FFT
-        f = np.fft.fft2(gray)
-        fshift = np.fft.fftshift(f)
-        magnitude = np.log(np.abs(fshift) + 1)
-
-        rows, cols = magnitude.shape
-        center_row, center_col = rows // 2, cols // 2
-
-        h_profile = magnitude[center_row, :]
-        v_profile = magnitude[:, center_col]
+        # Only the zero-frequency row and column of the spectrum are used (the
+        # center row/column after fftshift, whose variance the shift doesn't
+        # change). They are the 1D DFTs of the column and row sums, at the
+        # exact frame size, so no 2D transform or padding is needed
+        h_profile = np.abs(np.fft.fft(gray.sum(axis=0, dtype=np.float64)))
+        v_profile = np.abs(np.fft.fft(gray.sum(axis=1, dtype=np.float64)))
+        np.log1p(h_profile, out=h_profile)
+        np.log1p(v_profile, out=v_profile)
 
         h_var = np.var(h_profile)
         v_var = np.var(v_profile)
-        avg_var = (h_var + v_var) / 2
+        avg_var = float(h_var + v_var) / 2
 
         blur_score = 1.0 - min(1.0, avg_var / 10.0)
 
@@ -115,13 +146,18 @@ class MotionAnalyzer:
         """Simple blur detection using edge strength."""
         small = self._prepare_frame(frame)
         gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        num_pixels = gray.size
+        if self.use_opencl:
+            gray = cv2.UMat(gray)
 
-        # Sobel edge detection
-        sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+        # Sobel edge detection (int16 is exact for 8-bit input)
+        sobelx = cv2.Sobel(gray, cv2.CV_16S, 1, 0, ksize=3)
+        sobely = cv2.Sobel(gray, cv2.CV_16S, 0, 1, ksize=3)
 
-        # Edge magnitude
-        edge_strength = np.mean(np.abs(sobelx) + np.abs(sobely))
+        # Edge magnitude (L1 norm sums |x| without float temporaries)
+        edge_strength = (
+            cv2.norm(sobelx, cv2.NORM_L1) + cv2.norm(sobely, cv2.NORM_L1)
+        ) / num_pixels
 
         # Higher edge strength = less blur
         # Normalize (typical values 10-100)
@@ -144,34 +180,35 @@ class MotionAnalyzer:
         Returns:
             Difference score (0 = identical, 1 = very different)
         """
-        small = self._prepare_frame(frame)
+        current_hash = self._dhash(frame)
 
         if reference_frame is None:
-            if self.previous_frame is None:
-                self.previous_frame = small.copy()
-                return 0.0
-            reference_frame = self.previous_frame
+            previous_hash = self._prev_hash
         else:
-            reference_frame = self._prepare_frame(reference_frame)
-
-        # Ensure same size
-        if small.shape != reference_frame.shape:
-            reference_frame = cv2.resize(
-                reference_frame,
-                (small.shape[1], small.shape[0])
-            )
+            previous_hash = self._dhash(reference_frame)
+        self._prev_hash = current_hash
 
-        gray1 = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
-        gray2 = cv2.cvtColor(reference_frame, cv2.COLOR_BGR2GRAY)
+        if previous_hash is None:
+            return 0.0
 
-        diff = cv2.absdiff(gray1, gray2)
-        mean_diff = np.mean(diff)
+        # Hamming distance between the two 64-bit hashes
+        return bin(current_hash ^ previous_hash).count('1') / 64.0
 
-        normalized = min(1.0, mean_diff / 50.0)
+    @staticmethod
+    def _dhash(frame: np.ndarray) -> int:
+        """
+        Compute a 64-bit difference hash of a frame.
 
-        self.previous_frame = small.copy()
+        Args:
+            frame: BGR image
 
-        return normalized
+        Returns:
+            Hash with one bit per horizontal brightness gradient of a 9x8 thumbnail
+        """
+        tiny = cv2.resize(frame, (9, 8), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(tiny, cv2.COLOR_BGR2GRAY)
+        bits = gray[:, 1:] > gray[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
 
     def calculate_stability_score(self, frame: np.ndarray) -> float:
         """
@@ -201,4 +238,4 @@ class MotionAnalyzer:
 
     def reset(self):
         """Reset the analyzer state."""
-        self.previous_frame = None
+        self._prev_hash = None
@@ -1,13 +1,13 @@
 """
 Project Types - Defines different project types with their analysis settings
 """
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProjectTypeSettings:
-    """Settings for a specific project type."""
+    """Settings for a specific project type (immutable)."""
     name: str
     description: str
     # Scoring weights
@@ -19,6 +19,15 @@ class ProjectTypeSettings:
     motion_blur_penalty: float  # 0.0 = no penalty, 1.0 = heavy penalty
     # Sampling adjustments
     min_sharpness_threshold: float
+    # (face, sharpness, stability) weights, precomputed for FrameScorer
+    weights: Tuple[float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            'weights',
+            (self.face_weight, self.sharpness_weight, self.stability_weight)
+        )
 
 
 class ProjectTypes:
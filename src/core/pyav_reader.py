@@ -0,0 +1,149 @@
+"""
+PyAV Reader - Keyframe-only decoding for the coarse analysis pass
+Requires the optional PyAV package (pip install av); uses hardware
+decoding (VideoToolbox / NVDEC) with PyAV >= 14 when available
+"""
+import sys
+import ctypes.util
+import numpy as np
+from typing import Generator, Optional, Tuple
+
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    from av.codec.hwaccel import HWAccel  # PyAV >= 14
+except ImportError:
+    HWAccel = None
+
+
+class PyAVReader:
+    """
+    Reads video frames directly through PyAV.
+
+    The coarse pass decodes keyframes only (skip_frame="NONKEY"), the
+    refinement pass seeks to a keyframe and decodes a small neighborhood.
+    """
+
+    def __init__(self, video_path: str, hwaccel: Optional[str] = 'auto'):
+        """
+        Initialize the reader.
+
+        Args:
+            video_path: Path to the video file
+            hwaccel: Hardware decoder device type ('videotoolbox', 'cuda', ...),
+                'auto' to detect one, or None for software decoding
+        """
+        if av is None:
+            raise ImportError("PyAV is not installed")
+
+        self.video_path = video_path
+        self.hwaccel = self.detect_hwaccel() if hwaccel == 'auto' else hwaccel
+        self._container = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check if PyAV can be used."""
+        return av is not None
+
+    @staticmethod
+    def detect_hwaccel() -> Optional[str]:
+        """Pick a hardware decoder for this machine, or None."""
+        if HWAccel is None:
+            return None
+        if sys.platform == 'darwin':
+            return 'videotoolbox'
+        if ctypes.util.find_library('nvcuvid'):
+            return 'cuda'
+        return None
+
+    def _open(self):
+        """Open the container, with hardware decoding if configured."""
+        if self.hwaccel is not None and HWAccel is not None:
+            try:
+                return av.open(
+                    self.video_path,
+                    hwaccel=HWAccel(device_type=self.hwaccel, allow_software_fallback=True)
+                )
+            except Exception as e:
+                print(f"Hardware decoding unavailable ({self.hwaccel}): {e}")
+                self.hwaccel = None
+
+        return av.open(self.video_path)
+
+    @staticmethod
+    def _get_fps(stream) -> float:
+        """Get the stream frame rate, defaulting to 30 fps."""
+        rate = stream.average_rate or stream.guessed_rate
+        return float(rate) if rate else 30.0
+
+    @staticmethod
+    def _frame_number(frame, fps: float) -> Optional[int]:
+        """Convert a decoded frame's timestamp to a frame number."""
+        if frame.time is None:
+            return None
+        return int(round(frame.time * fps))
+
+    def iter_keyframes(self) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """
+        Iterate over the keyframes of the video.
+
+        Yields:
+            (frame_number, bgr_image) tuples
+        """
+        container = self._open()
+        try:
+            stream = container.streams.video[0]
+            stream.codec_context.skip_frame = "NONKEY"
+            fps = self._get_fps(stream)
+
+            for frame in container.decode(stream):
+                frame_number = self._frame_number(frame, fps)
+                if frame_number is None:
+                    continue
+                yield frame_number, frame.to_ndarray(format='bgr24')
+        finally:
+            container.close()
+
+    def iter_neighborhood(
+        self,
+        frame_number: int,
+        radius: int = 15
+    ) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """
+        Decode all frames within +-radius of a frame number.
+
+        Args:
+            frame_number: Center frame
+            radius: Number of frames before and after the center (the
+                default suits FrameScorer.find_best_frames' refine callback)
+
+        Yields:
+            (frame_number, bgr_image) tuples
+        """
+        if self._container is None:
+            self._container = self._open()
+
+        stream = self._container.streams.video[0]
+        fps = self._get_fps(stream)
+        first = max(0, frame_number - radius)
+        last = frame_number + radius
+
+        # Seek lands on the keyframe at or before the target timestamp
+        self._container.seek(int(first / fps / stream.time_base), stream=stream)
+
+        for frame in self._container.decode(stream):
+            current = self._frame_number(frame, fps)
+            if current is None or current < first:
+                continue
+            if current > last:
+                break
+            yield current, frame.to_ndarray(format='bgr24')
+
+    def close(self):
+        """Release the refinement container."""
+        if self._container is not None:
+            self._container.close()
+            self._container = None
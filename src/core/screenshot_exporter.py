@@ -1,16 +1,23 @@
 """
 Screenshot Exporter - Exports selected frames as image files
 """
-import cv2
+import os
+import queue
+import threading
 import numpy as np
-from PIL import Image
 from pathlib import Path
 from typing import List, Optional, Callable
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from .video_analyzer import SelectedFrame
+from .video_analyzer import SelectedFrame, warm_up
 from ..utils.lut_processor import LUTProcessor
 from ..utils.image_formats import ImageFormats
+from ..utils.uring_writer import UringWriter
+
+# From this many frames on, the LUT is baked up front (~8 frames of work)
+# so every frame gets the GIL-free gather and threads scale across cores
+BAKE_MIN_FRAMES = 8
 
 
 @dataclass
@@ -21,6 +28,8 @@ class ExportSettings:
     quality: int = 95
     prefix: str = 'screenshot'
     apply_lut: bool = False
+    num_workers: Optional[int] = None  # Encoding threads (default: CPU count)
+    fast: bool = False  # Quicker encodes, larger files (e.g. drafts)
 
 
 class ScreenshotExporter:
@@ -34,20 +43,25 @@ class ScreenshotExporter:
             lut_processor: Optional LUT processor for color grading
         """
         self.lut_processor = lut_processor or LUTProcessor()
+        warm_up()
 
     def export_frames(
         self,
         frames: List[SelectedFrame],
         settings: ExportSettings,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> List[str]:
         """
         Export a list of frames to image files.
 
+        Frames are encoded and written in parallel, one task per frame.
+
         Args:
             frames: List of SelectedFrame objects
             settings: Export settings
             progress_callback: Callback(current, total, filename) for progress
+            cancel_event: When set, frames not yet started are skipped
 
         Returns:
             List of exported file paths
@@ -56,37 +70,87 @@ class ScreenshotExporter:
         output_path.mkdir(parents=True, exist_ok=True)
 
         extension = ImageFormats.get_extension(settings.format_name)
-        exported_files = []
+        apply_lut = settings.apply_lut and self.lut_processor.is_loaded()
+        if apply_lut and len(frames) >= BAKE_MIN_FRAMES:
+            self.lut_processor.bake_now()
+
+        def encode_one(i: int, frame: SelectedFrame):
+            if cancel_event is not None and cancel_event.is_set():
+                return i, None, None, None
 
-        for i, frame in enumerate(frames):
             # Generate filename
             timestamp_str = self._format_timestamp_filename(frame.timestamp)
             filename = f"{settings.prefix}_{i+1:02d}_{timestamp_str}{extension}"
             filepath = output_path / filename
 
-            # Convert BGR to RGB
-            rgb_image = cv2.cvtColor(frame.image, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(rgb_image)
+            # Apply LUT if enabled (directly on BGR)
+            image = frame.image
+            if apply_lut:
+                image = self.lut_processor.apply_to_bgr_image(image)
 
-            # Apply LUT if enabled
-            if settings.apply_lut and self.lut_processor.is_loaded():
-                pil_image = self.lut_processor.apply_to_pil_image(pil_image)
-
-            # Save image
-            success = ImageFormats.save_image(
-                pil_image,
-                str(filepath),
+            # Encode in memory (OpenCV's encoders release the GIL)
+            buffer = ImageFormats.encode_bgr_image(
+                image,
                 settings.format_name,
-                settings.quality
+                settings.quality,
+                settings.fast
             )
-
-            if success:
-                exported_files.append(str(filepath))
-
-            if progress_callback:
-                progress_callback(i + 1, len(frames), filename)
-
-        return exported_files
+            return i, filename, str(filepath), buffer
+
+        def export_one(i: int, frame: SelectedFrame):
+            # Every frame has its own file, so tasks never contend
+            i, filename, filepath, buffer = encode_one(i, frame)
+            success = (
+                buffer is not None and
+                ImageFormats.write_encoded(buffer, filepath, settings.format_name)
+            )
+            return i, filename, filepath if success else None
+
+        num_workers = settings.num_workers or os.cpu_count() or 1
+        total = len(frames)
+        # Indexed by frame position, so the original order needs no sort
+        results: List[Optional[str]] = [None] * total
+        done = 0
+
+        def report(i: int, filename: Optional[str], filepath: Optional[str]):
+            nonlocal done
+            results[i] = filepath
+            done += 1
+            if progress_callback and filename is not None:
+                progress_callback(done, total, filename)
+
+        writer = UringWriter.create()
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            if writer is None:
+                futures = [executor.submit(export_one, i, frame) for i, frame in enumerate(frames)]
+                for future in as_completed(futures):
+                    report(*future.result())
+            else:
+                # Tasks only encode; whatever has finished is written with one submission
+                completed = queue.Queue()
+                for i, frame in enumerate(frames):
+                    executor.submit(encode_one, i, frame).add_done_callback(completed.put)
+
+                with writer:
+                    remaining = total
+                    while remaining:
+                        batch = [completed.get()]
+                        while len(batch) < writer.queue_depth:
+                            try:
+                                batch.append(completed.get_nowait())
+                            except queue.Empty:
+                                break
+                        remaining -= len(batch)
+
+                        encoded = [future.result() for future in batch]
+                        written = writer.write_files(
+                            [(filepath, buffer) for _, _, filepath, buffer in encoded]
+                        )
+                        for (i, filename, filepath, _), success in zip(encoded, written):
+                            report(i, filename, filepath if success else None)
+
+        return [filepath for filepath in results if filepath is not None]
 
     def export_single_frame(
         self,
@@ -109,15 +173,12 @@ class ScreenshotExporter:
         Returns:
             True if export successful
         """
-        # Convert BGR to RGB
-        rgb_image = cv2.cvtColor(frame.image, cv2.COLOR_BGR2RGB)
-        pil_image = Image.fromarray(rgb_image)
-
-        # Apply LUT if enabled
+        # Apply LUT if enabled (directly on BGR)
+        image = frame.image
         if apply_lut and self.lut_processor.is_loaded():
-            pil_image = self.lut_processor.apply_to_pil_image(pil_image)
+            image = self.lut_processor.apply_to_bgr_image(image)
 
-        return ImageFormats.save_image(pil_image, filepath, format_name, quality)
+        return ImageFormats.save_bgr_image(image, filepath, format_name, quality)
 
     def preview_with_lut(self, frame: np.ndarray) -> np.ndarray:
         """
@@ -132,14 +193,8 @@ class ScreenshotExporter:
         if not self.lut_processor.is_loaded():
             return frame
 
-        # Convert BGR to RGB for LUT processing
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Apply LUT
-        rgb_result = self.lut_processor.apply_to_image(rgb)
-
-        # Convert back to BGR
-        return cv2.cvtColor(rgb_result, cv2.COLOR_RGB2BGR)
+        # Apply the BGR-ordered LUT, no color conversion needed
+        return self.lut_processor.apply_to_bgr_image(frame)
 
     def load_lut(self, filepath: str) -> bool:
         """Load a LUT file."""
@@ -159,9 +214,9 @@ class ScreenshotExporter:
 
     def _format_timestamp_filename(self, seconds: float) -> str:
         """Format timestamp for use in filename."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        ms = int((seconds % 1) * 100)
+        # Integer centiseconds, then integer divmod only
+        minutes, rem = divmod(int(seconds * 100), 6000)
+        secs, ms = divmod(rem, 100)
         return f"{minutes:02d}m{secs:02d}s{ms:02d}"
 
     @staticmethod
@@ -2,16 +2,74 @@
 Video Analyzer - Main engine for analyzing video files and extracting frames
 Optimized for long videos (3h+) with intelligent sampling
 """
+import os
+import bisect
+import hashlib
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple, Optional, Callable, Generator
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, List, Tuple, Optional, Callable, Generator
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, wait
+import multiprocessing
+import queue
 import threading
 
-from .frame_scorer import FrameScorer
+from .frame_scorer import FrameScorer, FrameScores
 from .motion_analyzer import MotionAnalyzer
+from .pyav_reader import PyAVReader
+
+
+_warmed = False
+
+# Decode through the GPU video engine (VA-API, CUDA, D3D11, ...) where FFmpeg
+# offers one; opt-in since the converted frames can differ slightly
+HW_DECODE = os.environ.get('SCREENSHOT_TOOL_HW_DECODE') == '1'
+
+# Rank keyframes through PyAV instead of sampling at fixed positions, then
+# fully score around the best ones; opt-in since the picks differ
+KEYFRAME_ANALYSIS = os.environ.get('SCREENSHOT_TOOL_KEYFRAME_ANALYSIS') == '1'
+
+
+def open_capture(path: str) -> cv2.VideoCapture:
+    """
+    Open a video for reading, hardware accelerated if HW_DECODE is set.
+
+    OpenCV decodes in software when no accelerator is available; if the
+    accelerated FFmpeg capture can't open the file at all, the default
+    backend is used.
+    """
+    if HW_DECODE:
+        cap = cv2.VideoCapture(
+            path, cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        )
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(path)
+
+
+def warm_up():
+    """
+    Run each lazily initialized OpenCV path once on a tiny image, so its
+    one-time setup (thread pool, codec plugins) is not paid on the first
+    real frame. Safe to call repeatedly; only the first call does work.
+    """
+    global _warmed
+    if _warmed:
+        return
+    _warmed = True
+
+    try:
+        tiny = np.zeros((8, 8, 3), dtype=np.uint8)
+        gray = cv2.cvtColor(tiny, cv2.COLOR_BGR2GRAY)
+        cv2.Laplacian(gray, cv2.CV_16S)
+        cv2.resize(tiny, (4, 4), interpolation=cv2.INTER_AREA)
+        for extension in ('.png', '.jpg'):
+            cv2.imencode(extension, tiny)
+    except cv2.error as e:
+        print(f"Warm-up failed: {e}")
 
 
 @dataclass
@@ -33,8 +91,71 @@ class SelectedFrame:
     timestamp: float  # in seconds
     image: np.ndarray
     score: float
-    score_details: dict
+    score_details: FrameScores
     is_manual: bool = False
+    # Identifies the source video across runs (VideoAnalyzer.video_id)
+    video_id: Optional[str] = None
+    # Rendered GUI thumbnail (QPixmap), cached so widgets can be rebuilt cheaply
+    thumbnail_pixmap: Optional[Any] = field(default=None, repr=False, compare=False)
+    # Preformatted timestamp for display, see VideoAnalyzer.format_timestamps()
+    timestamp_str: Optional[str] = field(default=None, repr=False, compare=False)
+
+
+def _analyze_chunk(
+    video_path: str,
+    positions: List[int],
+    weights: Tuple[float, float, float],
+    progress_queue
+) -> List[Tuple[int, float, FrameScores]]:
+    """
+    Score a run of positions in a worker process.
+
+    Runs at module level so it can be pickled for ProcessPoolExecutor.
+    Returns (frame_number, total_score, score_details) without the images.
+    """
+    analyzer = VideoAnalyzer(FrameScorer(*weights, fast_mode=True))
+    if analyzer.load_video(video_path) is None:
+        progress_queue.put(len(positions))
+        return []
+
+    motion_analyzer = MotionAnalyzer(fast_mode=True)
+    chunk_results = []
+    read = 0
+
+    for frame_num, frame in analyzer.iter_frames_at(positions):
+        read += 1
+
+        # Quick sharpness check
+        sharpness = motion_analyzer.calculate_sharpness_fast(frame)
+        if sharpness > 0.15:
+            scores = analyzer.frame_scorer.score_frame(frame)
+            chunk_results.append((frame_num, scores.total_score, scores))
+
+        progress_queue.put(1)
+
+    # Account for frames that could not be read
+    if read < len(positions):
+        progress_queue.put(len(positions) - read)
+
+    analyzer.close()
+    return chunk_results
+
+
+class _Capture:
+    """A VideoCapture plus the lock held while reading through it."""
+
+    __slots__ = ('cap', 'lock', 'released')
+
+    def __init__(self, cap: cv2.VideoCapture):
+        self.cap = cap
+        self.lock = threading.Lock()
+        self.released = False
+
+    def release(self):
+        """Release the capture once no read is using it."""
+        with self.lock:
+            self.released = True
+            self.cap.release()
 
 
 class VideoAnalyzer:
@@ -44,23 +165,54 @@ class VideoAnalyzer:
     """
 
     SUPPORTED_FORMATS = ['.mp4', '.mov', '.mkv', '.avi', '.webm', '.m4v']
+    _SUPPORTED_SUFFIXES = frozenset(SUPPORTED_FORMATS)
+
+    # Sampling configuration based on video length: sorted upper duration
+    # bounds (seconds) and the matching (target_samples, min_interval_seconds)
+    SAMPLING_MAX_DURATIONS = (300, 1800, 7200, 14400)
+    SAMPLING_CONFIG = (
+        (500, 2),    # < 5 min: 500 samples, min 2s apart
+        (400, 5),    # < 30 min: 400 samples, min 5s apart
+        (300, 15),   # < 2h: 300 samples, min 15s apart
+        (250, 30),   # < 4h: 250 samples, min 30s apart
+        (200, 60),   # > 4h: 200 samples, min 60s apart
+    )
+
+    # Gaps up to this many frames are decoded forward with grab() instead of
+    # seeking; a seek decodes from the previous keyframe anyway (~1 GOP)
+    MAX_GRAB_GAP = 250
+
+    # Width candidate frames are kept at between the pre-filter and scoring
+    CANDIDATE_WIDTH = 960
+
+    # Captures handed back by finished threads that stay open for the next one
+    MAX_IDLE_CAPTURES = 2
+
+    def __init__(self, frame_scorer: Optional[FrameScorer] = None):
+        """
+        Initialize the analyzer.
 
-    # Sampling configuration based on video length
-    SAMPLING_CONFIG = {
-        # (max_duration_seconds, target_samples, min_interval_seconds)
-        300: (500, 2),       # < 5 min: 500 samples, min 2s apart
-        1800: (400, 5),      # < 30 min: 400 samples, min 5s apart
-        7200: (300, 15),     # < 2h: 300 samples, min 15s apart
-        14400: (250, 30),    # < 4h: 250 samples, min 30s apart
-        float('inf'): (200, 60),  # > 4h: 200 samples, min 60s apart
-    }
-
-    def __init__(self):
+        Args:
+            frame_scorer: Scorer to use, e.g. the shared one from get_scorer()
+                (default: a new fast mode scorer)
+        """
         self.video_path: Optional[str] = None
+        # Stable id of the loaded file, e.g. for on-disk thumbnail caches
+        self.video_id: Optional[str] = None
         self.video_capture: Optional[cv2.VideoCapture] = None
         self.video_info: Optional[VideoInfo] = None
-        self.frame_scorer = FrameScorer(fast_mode=True)
-        self._lock = threading.Lock()
+        self.frame_scorer = frame_scorer or FrameScorer(fast_mode=True)
+        # One capture per reading thread, so seeks never contend; threads
+        # hand theirs back with release_thread_capture() for reuse
+        self._thread_caps = threading.local()
+        # Every open capture (for close) and those not bound to a thread
+        self._caps: List[_Capture] = []
+        self._idle_caps: List[_Capture] = []
+        self._caps_lock = threading.Lock()
+        self._generation = 0
+        warm_up()
+        # Raw descriptor of the video file, only used for page cache hints
+        self._video_fd: Optional[int] = None
 
     def load_video(self, filepath: str) -> Optional[VideoInfo]:
         """Load a video file and extract metadata."""
@@ -68,12 +220,12 @@ class VideoAnalyzer:
         if not path.exists():
             return None
 
-        if path.suffix.lower() not in self.SUPPORTED_FORMATS:
+        if path.suffix.lower() not in self._SUPPORTED_SUFFIXES:
             return None
 
         self.close()
 
-        cap = cv2.VideoCapture(str(filepath))
+        cap = open_capture(str(filepath))
         if not cap.isOpened():
             return None
 
@@ -89,6 +241,8 @@ class VideoAnalyzer:
 
         self.video_capture = cap
         self.video_path = filepath
+        self.video_id = self.compute_video_id(filepath)
+        self._advise_sequential(filepath)
         self.video_info = VideoInfo(
             path=filepath,
             width=width,
@@ -99,6 +253,12 @@ class VideoAnalyzer:
             codec=codec
         )
 
+        # The first reading thread takes over the metadata capture
+        with self._caps_lock:
+            entry = _Capture(cap)
+            self._caps.append(entry)
+            self._idle_caps.append(entry)
+
         self.frame_scorer.reset()
 
         return self.video_info
@@ -108,12 +268,9 @@ class VideoAnalyzer:
         if self.video_info is None:
             return (300, 10)
 
-        duration = self.video_info.duration
-        for max_duration, (target_samples, min_interval) in self.SAMPLING_CONFIG.items():
-            if duration <= max_duration:
-                return (target_samples, min_interval)
-
-        return (200, 60)
+        # First bucket whose upper bound is >= duration
+        index = bisect.bisect_left(self.SAMPLING_MAX_DURATIONS, self.video_info.duration)
+        return self.SAMPLING_CONFIG[index]
 
     def _calculate_sample_positions(self, num_samples: int, min_interval_sec: float) -> List[int]:
         """
@@ -140,22 +297,133 @@ class VideoAnalyzer:
 
         return positions
 
+    def _get_capture(self) -> Optional[_Capture]:
+        """
+        Get the calling thread's capture: an idle one, or a new one on
+        first use.
+
+        Returns:
+            The capture (read it under its lock and check released), or
+            None if no video is loaded
+        """
+        local = self._thread_caps
+        if getattr(local, 'generation', None) == self._generation and local.entry is not None:
+            return local.entry
+
+        with self._caps_lock:
+            generation = self._generation
+            entry = self._idle_caps.pop() if self._idle_caps else None
+            video_path = self.video_path
+        if entry is None:
+            if video_path is None:
+                return None
+            entry = _Capture(open_capture(video_path))
+            with self._caps_lock:
+                # close() ran meanwhile: the capture belongs to no video
+                stale = generation != self._generation
+                if not stale:
+                    self._caps.append(entry)
+            if stale:
+                entry.release()
+                return None
+
+        local.entry = entry
+        local.generation = generation
+        return entry
+
+    def release_thread_capture(self):
+        """
+        Hand back the calling thread's capture, e.g. when a worker thread
+        finishes; it is kept open for the next thread (up to
+        MAX_IDLE_CAPTURES) or released.
+        """
+        local = self._thread_caps
+        entry = getattr(local, 'entry', None)
+        local.entry = None
+        if entry is None:
+            return
+        with self._caps_lock:
+            if local.generation != self._generation:
+                return  # Already released by close()
+            if len(self._idle_caps) < self.MAX_IDLE_CAPTURES:
+                self._idle_caps.append(entry)
+                return
+            self._caps.remove(entry)
+        entry.release()
+
     def get_frame_at_position(self, frame_number: int) -> Optional[np.ndarray]:
         """Get a specific frame by frame number (thread-safe)."""
-        if self.video_capture is None:
+        info = self.video_info
+        if info is None:
             return None
 
-        if frame_number < 0 or frame_number >= self.video_info.frame_count:
+        if frame_number < 0 or frame_number >= info.frame_count:
             return None
 
-        with self._lock:
-            self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            ret, frame = self.video_capture.read()
+        entry = self._get_capture()
+        if entry is None:
+            return None
+        with entry.lock:
+            if entry.released:
+                return None
+            entry.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            ret, frame = entry.cap.read()
 
         if ret:
             return frame
         return None
 
+    def iter_frames_at(
+        self,
+        frame_numbers: List[int]
+    ) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """
+        Read many frames in ascending order (thread-safe).
+
+        Small gaps are bridged with grab(), which skips the color conversion;
+        only large gaps trigger a seek. Only target frames are retrieved.
+
+        Args:
+            frame_numbers: Frame numbers to read (any order)
+
+        Yields:
+            (frame_number, frame_image) tuples in ascending frame order
+        """
+        info = self.video_info
+        if info is None:
+            return
+
+        entry = self._get_capture()
+        if entry is None:
+            return
+        cap = entry.cap
+        for frame_number in sorted(set(frame_numbers)):
+            if frame_number < 0 or frame_number >= info.frame_count:
+                continue
+
+            # Locked per frame, not across the yield, so close() never waits
+            # for a consumer
+            with entry.lock:
+                if entry.released:
+                    return
+
+                position = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+                gap = frame_number - position
+                if gap < 0 or gap > self.MAX_GRAB_GAP:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                    gap = 0
+
+                ok = True
+                for _ in range(gap):
+                    if not cap.grab():
+                        ok = False
+                        break
+
+                ret, frame = cap.read() if ok else (False, None)
+
+            if ret:
+                yield frame_number, frame
+
     def get_frame_at_time(self, timestamp: float) -> Optional[np.ndarray]:
         """Get a frame at a specific timestamp."""
         if self.video_info is None:
@@ -187,6 +455,16 @@ class VideoAnalyzer:
 
         self.frame_scorer.reset()
 
+        # Minimum interval between selected frames (in frames)
+        min_frame_interval = max(
+            int(self.video_info.fps * 30),  # At least 30 seconds apart
+            self.video_info.frame_count // (num_frames * 2)
+        )
+
+        if KEYFRAME_ANALYSIS and PyAVReader.is_available():
+            selected = self._find_best_keyframes(num_frames, min_frame_interval, progress_callback)
+            return self._to_selected_frames(selected)
+
         # Get optimal sampling configuration
         target_samples, min_interval_sec = self._get_sampling_config()
         sample_positions = self._calculate_sample_positions(target_samples, min_interval_sec)
@@ -200,65 +478,121 @@ class VideoAnalyzer:
         motion_analyzer = MotionAnalyzer(fast_mode=True)
         candidates = []
 
-        for i, frame_num in enumerate(sample_positions):
-            frame = self.get_frame_at_position(frame_num)
-            if frame is None:
-                continue
-
+        for i, (frame_num, frame) in enumerate(self.iter_frames_at(sample_positions)):
             # Ultra-fast sharpness check
             sharpness = motion_analyzer.calculate_sharpness_fast(frame)
 
-            # Only keep reasonably sharp frames
+            # Only keep reasonably sharp frames, downscaled to bound memory;
+            # full-resolution frames are re-read for the final selection only
             if sharpness > 0.15:
+                h, w = frame.shape[:2]
+                if w > self.CANDIDATE_WIDTH:
+                    frame = cv2.resize(
+                        frame,
+                        (self.CANDIDATE_WIDTH, int(h * self.CANDIDATE_WIDTH / w)),
+                        interpolation=cv2.INTER_AREA
+                    )
                 candidates.append((frame_num, frame, sharpness))
 
             if progress_callback:
                 progress_callback(i + 1, total_samples)
 
         # Phase 2: Full scoring on candidates only
-        scored_frames = []
-        for frame_num, frame, sharpness in candidates:
-            scores = self.frame_scorer.score_frame(frame)
-            scored_frames.append((frame_num, scores['total_score'], scores, frame))
+        batch_scores = self.frame_scorer.score_batch(frame for _, frame, _ in candidates)
+        scored_frames = [
+            (frame_num, scores.total_score, scores, frame)
+            for (frame_num, frame, _), scores in zip(candidates, batch_scores)
+        ]
 
         # Sort by score and select best with minimum interval
         scored_frames.sort(key=lambda x: x[1], reverse=True)
 
-        # Minimum interval between selected frames (in frames)
-        min_frame_interval = max(
-            int(self.video_info.fps * 30),  # At least 30 seconds apart
-            self.video_info.frame_count // (num_frames * 2)
-        )
+        selected = FrameScorer.select_spaced(scored_frames, num_frames, min_frame_interval)
 
-        selected = []
-        for frame_num, score, details, frame in scored_frames:
-            if len(selected) >= num_frames:
-                break
+        # Sort by timestamp for chronological order
+        selected.sort(key=lambda x: x[0])
 
-            # Check interval constraint
-            too_close = False
-            for sel_frame_num, _, _, _ in selected:
-                if abs(frame_num - sel_frame_num) < min_frame_interval:
-                    too_close = True
-                    break
+        return self._to_selected_frames(selected)
 
-            if not too_close:
-                selected.append((frame_num, score, details, frame))
+    def _find_best_keyframes(
+        self,
+        num_frames: int,
+        min_interval: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Tuple[int, float, FrameScores]]:
+        """
+        Rank the keyframes with the fast scorer (decoded through PyAV) and
+        fully score the neighborhoods of the best ones.
 
-        # Sort by timestamp for chronological order
-        selected.sort(key=lambda x: x[0])
+        Args:
+            num_frames: Number of best frames to find
+            min_interval: Minimum frame interval between selected frames
+            progress_callback: Callback function(current, total) for progress
+                updates, by frame position during the keyframe pass
+
+        Returns:
+            List of (frame_number, total_score, score_details) tuples in
+            chronological order
+        """
+        info = self.video_info
+        # Skip intro and outro like the sampled analysis
+        first = int(info.fps * 5)
+        last = info.frame_count - int(info.fps * 5)
+
+        reader = PyAVReader(info.path)
+
+        def keyframes():
+            for frame_num, frame in reader.iter_keyframes():
+                if progress_callback:
+                    progress_callback(min(frame_num, info.frame_count), info.frame_count)
+                if first <= frame_num < last:
+                    yield frame_num, frame
+
+        def neighborhood(frame_num):
+            for neighbor_num, frame in reader.iter_neighborhood(frame_num):
+                if first <= neighbor_num < last:
+                    yield neighbor_num, frame
+
+        try:
+            return self.frame_scorer.find_best_frames(
+                num_frames=num_frames,
+                min_interval=min_interval,
+                coarse_iter=keyframes(),
+                refine=neighborhood
+            )
+        finally:
+            reader.close()
+
+    def _to_selected_frames(self, selected: List[tuple]) -> List[SelectedFrame]:
+        """
+        Re-read selected frames at full resolution as SelectedFrame objects.
+
+        Args:
+            selected: (frame_number, total_score, score_details, ...) tuples
+                in chronological order
+
+        Returns:
+            List of SelectedFrame objects
+        """
+        full_frames = dict(self.iter_frames_at([item[0] for item in selected]))
 
         # Convert to SelectedFrame objects
         result = []
-        for frame_num, score, details, frame in selected:
+        for frame_num, score, details, *_ in selected:
+            image = full_frames.get(frame_num)
+            if image is None:
+                # The candidate copy is downscaled; never export it as a screenshot
+                print(f"Could not re-read frame {frame_num} at full resolution, skipping it")
+                continue
             timestamp = frame_num / self.video_info.fps
             result.append(SelectedFrame(
                 frame_number=frame_num,
                 timestamp=timestamp,
-                image=frame,
+                image=image,
                 score=score,
                 score_details=details,
-                is_manual=False
+                is_manual=False,
+                video_id=self.video_id
             ))
 
         return result
@@ -272,7 +606,7 @@ class VideoAnalyzer:
         """
         Analyze video using parallel processing for even faster results.
 
-        Note: Requires creating separate VideoCapture for each thread.
+        Note: Each worker process opens its own VideoCapture.
         """
         if self.video_info is None:
             return []
@@ -282,49 +616,43 @@ class VideoAnalyzer:
         sample_positions = self._calculate_sample_positions(target_samples, min_interval_sec)
         total_samples = len(sample_positions)
 
-        # Split positions among workers
-        chunks = [sample_positions[i::num_workers] for i in range(num_workers)]
+        # Split positions into contiguous runs so each worker reads forward
+        chunk_size = -(-total_samples // num_workers)
+        chunks = [
+            sample_positions[i:i + chunk_size]
+            for i in range(0, total_samples, chunk_size)
+        ]
+        weights = (
+            self.frame_scorer.face_weight,
+            self.frame_scorer.sharpness_weight,
+            self.frame_scorer.stability_weight
+        )
 
         results = []
-        completed = [0]
-        lock = threading.Lock()
-
-        def analyze_chunk(positions: List[int], video_path: str) -> List[Tuple]:
-            """Analyze a chunk of positions with own VideoCapture."""
-            cap = cv2.VideoCapture(video_path)
-            motion_analyzer = MotionAnalyzer(fast_mode=True)
-            frame_scorer = FrameScorer(fast_mode=True)
-            chunk_results = []
-
-            for frame_num in positions:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-                ret, frame = cap.read()
-                if not ret:
-                    continue
-
-                # Quick sharpness check
-                sharpness = motion_analyzer.calculate_sharpness_fast(frame)
-                if sharpness > 0.15:
-                    scores = frame_scorer.score_frame(frame)
-                    chunk_results.append((frame_num, scores['total_score'], scores, frame))
-
-                with lock:
-                    completed[0] += 1
-                    if progress_callback:
-                        progress_callback(completed[0], total_samples)
-
-            cap.release()
-            return chunk_results
-
-        # Run analysis in parallel
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            futures = [
-                executor.submit(analyze_chunk, chunk, self.video_path)
-                for chunk in chunks if chunk
-            ]
-
-            for future in as_completed(futures):
-                results.extend(future.result())
+        completed = 0
+
+        # Run analysis in worker processes; progress arrives through a queue
+        with multiprocessing.Manager() as manager:
+            progress_queue = manager.Queue()
+
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                pending = {
+                    executor.submit(_analyze_chunk, self.video_path, chunk, weights, progress_queue)
+                    for chunk in chunks
+                }
+
+                while pending:
+                    done, pending = wait(pending, timeout=0.1)
+                    for future in done:
+                        results.extend(future.result())
+
+                    while True:
+                        try:
+                            completed += progress_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if progress_callback:
+                            progress_callback(completed, total_samples)
 
         # Sort and select best frames
         results.sort(key=lambda x: x[1], reverse=True)
@@ -334,31 +662,23 @@ class VideoAnalyzer:
             self.video_info.frame_count // (num_frames * 2)
         )
 
-        selected = []
-        for frame_num, score, details, frame in results:
-            if len(selected) >= num_frames:
-                break
+        selected = FrameScorer.select_spaced(results, num_frames, min_frame_interval)
 
-            too_close = any(
-                abs(frame_num - sel[0]) < min_frame_interval
-                for sel in selected
-            )
-
-            if not too_close:
-                selected.append((frame_num, score, details, frame))
-
-        selected.sort(key=lambda x: x[0])
+        # Frames stay in the workers; decode only the survivors here
+        images = dict(self.iter_frames_at([fn for fn, _, _ in selected]))
 
         return [
             SelectedFrame(
                 frame_number=fn,
                 timestamp=fn / self.video_info.fps,
-                image=img,
+                image=images[fn],
                 score=sc,
                 score_details=det,
-                is_manual=False
+                is_manual=False,
+                video_id=self.video_id
             )
-            for fn, sc, det, img in selected
+            for fn, sc, det in sorted(selected, key=lambda x: x[0])
+            if fn in images
         ]
 
     def create_manual_frame(self, frame_number: int) -> Optional[SelectedFrame]:
@@ -374,23 +694,40 @@ class VideoAnalyzer:
             frame_number=frame_number,
             timestamp=timestamp,
             image=frame,
-            score=scores['total_score'],
+            score=scores.total_score,
             score_details=scores,
-            is_manual=True
+            is_manual=True,
+            video_id=self.video_id
         )
 
     def get_thumbnail(
         self,
         frame: np.ndarray,
-        max_size: Tuple[int, int] = (200, 150)
+        max_size: Tuple[int, int] = (200, 150),
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
-        """Create a thumbnail from a frame."""
+        """
+        Create a thumbnail from a frame.
+
+        Args:
+            frame: BGR image
+            max_size: Maximum (width, height)
+            out: Optional reusable buffer of at least max_size; the thumbnail
+                is written into its top-left corner and returned as a view
+
+        Returns:
+            Thumbnail image
+        """
         h, w = frame.shape[:2]
         scale = min(max_size[0] / w, max_size[1] / h)
         new_w = int(w * scale)
         new_h = int(h * scale)
 
-        return cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        dst = None
+        if out is not None and out.shape[0] >= new_h and out.shape[1] >= new_w:
+            dst = out[:new_h, :new_w]
+
+        return cv2.resize(frame, (new_w, new_h), dst=dst, interpolation=cv2.INTER_AREA)
 
     def frame_iterator(
         self,
@@ -398,42 +735,112 @@ class VideoAnalyzer:
         end: Optional[int] = None,
         step: int = 1
     ) -> Generator[Tuple[int, np.ndarray], None, None]:
-        """Iterate over frames in the video."""
+        """
+        Iterate over frames in the video.
+
+        Uses its own VideoCapture and decodes sequentially (one seek to
+        `start`, then grab/retrieve) instead of seeking for every frame.
+        """
         if self.video_capture is None:
             return
 
         if end is None:
             end = self.video_info.frame_count
 
-        for frame_num in range(start, end, step):
-            frame = self.get_frame_at_position(frame_num)
-            if frame is not None:
-                yield frame_num, frame
+        cap = open_capture(self.video_path)
+        try:
+            if start > 0:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+            for offset, frame in FrameScorer.iter_sampled(cap, step, end - start):
+                yield start + offset, frame
+        finally:
+            cap.release()
+
+    def _advise_sequential(self, filepath: str):
+        """Ask the kernel for aggressive read-ahead on the video (POSIX only)."""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+
+        try:
+            self._video_fd = os.open(filepath, os.O_RDONLY)
+            os.posix_fadvise(self._video_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError as e:
+            print(f"posix_fadvise failed: {e}")
+
+    def _release_page_cache(self):
+        """Drop the video's pages from the page cache and close the descriptor."""
+        if self._video_fd is None:
+            return
+
+        try:
+            os.posix_fadvise(self._video_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(self._video_fd)
+            self._video_fd = None
 
     def close(self):
         """Release video resources."""
-        if self.video_capture is not None:
-            self.video_capture.release()
-            self.video_capture = None
+        # Invalidate every thread's capture, then release them all; each
+        # release waits for a read in progress on that capture
+        with self._caps_lock:
+            self._generation += 1
+            caps, self._caps = self._caps, []
+            self._idle_caps = []
+        for entry in caps:
+            entry.release()
+        self.video_capture = None
+        self._release_page_cache()
         self.video_info = None
         self.video_path = None
+        self.video_id = None
 
     def __del__(self):
         self.close()
 
+    @staticmethod
+    def compute_video_id(filepath: str) -> str:
+        """Id for a video file from its path, size and modification time."""
+        stat = os.stat(filepath)
+        key = f"{os.path.abspath(filepath)}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
     @staticmethod
     def is_supported_format(filepath: str) -> bool:
         """Check if a file format is supported."""
-        return Path(filepath).suffix.lower() in VideoAnalyzer.SUPPORTED_FORMATS
+        # splitext avoids building a Path object per file on directory scans
+        return os.path.splitext(filepath)[1].lower() in VideoAnalyzer._SUPPORTED_SUFFIXES
 
     @staticmethod
     def format_timestamp(seconds: float) -> str:
         """Format seconds as HH:MM:SS.ms string."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        ms = int((seconds % 1) * 100)
+        # Integer centiseconds, then integer divmod only
+        hours, rem = divmod(int(seconds * 100), 360000)
+        minutes, rem = divmod(rem, 6000)
+        secs, ms = divmod(rem, 100)
 
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:02d}"
         return f"{minutes:02d}:{secs:02d}.{ms:02d}"
+
+    @staticmethod
+    def format_timestamps(timestamps) -> List[str]:
+        """
+        Format many timestamps at once, same output as format_timestamp().
+
+        Args:
+            timestamps: Sequence or array of seconds
+
+        Returns:
+            List of formatted strings
+        """
+        centiseconds = (np.asarray(timestamps, dtype=np.float64) * 100).astype(np.int64)
+        hours, rem = np.divmod(centiseconds, 360000)
+        minutes, rem = np.divmod(rem, 6000)
+        secs, ms = np.divmod(rem, 100)
+
+        return [
+            f"{h:02d}:{m:02d}:{s:02d}.{c:02d}" if h > 0 else f"{m:02d}:{s:02d}.{c:02d}"
+            for h, m, s, c in zip(hours.tolist(), minutes.tolist(), secs.tolist(), ms.tolist())
+        ]
@@ -2,6 +2,7 @@
 Apple Style - macOS-inspired stylesheet for the application
 Responsive design with proper scaling for different screen sizes
 """
+from pathlib import Path
 
 # Apple-inspired color palette
 COLORS = {
@@ -30,29 +31,28 @@ COLORS = {
 }
 
 
-def get_stylesheet():
-    """Return the complete Apple-style stylesheet with responsive sizing."""
-    return f'''
+# Placeholders name COLORS keys, substituted once below
+_STYLESHEET_TEMPLATE = '''
     /* ===== GLOBAL ===== */
     QMainWindow {{
-        background-color: {COLORS['bg_secondary']};
+        background-color: {bg_secondary};
     }}
 
     QWidget {{
         font-family: -apple-system, BlinkMacSystemFont, "SF Pro Text", "Helvetica Neue", Arial, sans-serif;
         font-size: 14px;
-        color: {COLORS['text_primary']};
+        color: {text_primary};
     }}
 
     /* ===== LABELS ===== */
     QLabel {{
-        color: {COLORS['text_primary']};
+        color: {text_primary};
         font-size: 14px;
         padding: 2px;
     }}
 
     QLabel[class="secondary"] {{
-        color: {COLORS['text_secondary']};
+        color: {text_secondary};
         font-size: 13px;
     }}
 
@@ -64,39 +64,39 @@ def get_stylesheet():
 
     QLabel[class="small"] {{
         font-size: 12px;
-        color: {COLORS['text_secondary']};
+        color: {text_secondary};
     }}
 
     /* ===== BUTTONS ===== */
     QPushButton {{
-        background-color: {COLORS['bg_primary']};
-        border: 1px solid {COLORS['border_light']};
+        background-color: {bg_primary};
+        border: 1px solid {border_light};
         border-radius: 8px;
         padding: 10px 20px;
         font-size: 14px;
         font-weight: 500;
-        color: {COLORS['text_primary']};
+        color: {text_primary};
         min-height: 32px;
     }}
 
     QPushButton:hover {{
-        background-color: {COLORS['bg_tertiary']};
-        border-color: {COLORS['border_medium']};
+        background-color: {bg_tertiary};
+        border-color: {border_medium};
     }}
 
     QPushButton:pressed {{
-        background-color: {COLORS['border_light']};
+        background-color: {border_light};
     }}
 
     QPushButton:disabled {{
-        background-color: {COLORS['bg_secondary']};
-        color: {COLORS['text_tertiary']};
-        border-color: {COLORS['bg_tertiary']};
+        background-color: {bg_secondary};
+        color: {text_tertiary};
+        border-color: {bg_tertiary};
     }}
 
     /* Primary Button (accent) */
     QPushButton[class="primary"] {{
-        background-color: {COLORS['accent_blue']};
+        background-color: {accent_blue};
         border: none;
         color: white;
         font-weight: 600;
@@ -104,49 +104,49 @@ def get_stylesheet():
     }}
 
     QPushButton[class="primary"]:hover {{
-        background-color: {COLORS['accent_blue_hover']};
+        background-color: {accent_blue_hover};
     }}
 
     QPushButton[class="primary"]:pressed {{
-        background-color: {COLORS['accent_blue_pressed']};
+        background-color: {accent_blue_pressed};
     }}
 
     QPushButton[class="primary"]:disabled {{
-        background-color: {COLORS['border_light']};
-        color: {COLORS['text_tertiary']};
+        background-color: {border_light};
+        color: {text_tertiary};
     }}
 
     /* ===== INPUT FIELDS ===== */
     QLineEdit {{
-        background-color: {COLORS['bg_primary']};
-        border: 1px solid {COLORS['border_light']};
+        background-color: {bg_primary};
+        border: 1px solid {border_light};
         border-radius: 8px;
         padding: 10px 14px;
         font-size: 14px;
         min-height: 20px;
-        selection-background-color: {COLORS['accent_blue']};
+        selection-background-color: {accent_blue};
     }}
 
     QLineEdit:focus {{
-        border-color: {COLORS['accent_blue']};
+        border-color: {accent_blue};
         border-width: 2px;
         padding: 9px 13px;
     }}
 
     QLineEdit:disabled {{
-        background-color: {COLORS['bg_secondary']};
-        color: {COLORS['text_tertiary']};
+        background-color: {bg_secondary};
+        color: {text_tertiary};
     }}
 
     QLineEdit[readOnly="true"] {{
-        background-color: {COLORS['bg_tertiary']};
-        color: {COLORS['text_secondary']};
+        background-color: {bg_tertiary};
+        color: {text_secondary};
     }}
 
     /* ===== SPINBOX ===== */
     QSpinBox {{
-        background-color: {COLORS['bg_primary']};
-        border: 1px solid {COLORS['border_light']};
+        background-color: {bg_primary};
+        border: 1px solid {border_light};
         border-radius: 8px;
         padding: 8px 12px;
         font-size: 14px;
@@ -155,7 +155,7 @@ def get_stylesheet():
     }}
 
     QSpinBox:focus {{
-        border-color: {COLORS['accent_blue']};
+        border-color: {accent_blue};
         border-width: 2px;
     }}
 
@@ -169,7 +169,7 @@ def get_stylesheet():
         image: none;
         border-left: 5px solid transparent;
         border-right: 5px solid transparent;
-        border-bottom: 6px solid {COLORS['text_secondary']};
+        border-bottom: 6px solid {text_secondary};
         width: 0;
         height: 0;
     }}
@@ -178,15 +178,15 @@ def get_stylesheet():
         image: none;
         border-left: 5px solid transparent;
         border-right: 5px solid transparent;
-        border-top: 6px solid {COLORS['text_secondary']};
+        border-top: 6px solid {text_secondary};
         width: 0;
         height: 0;
     }}
 
     /* ===== COMBOBOX ===== */
     QComboBox {{
-        background-color: {COLORS['bg_primary']};
-        border: 1px solid {COLORS['border_light']};
+        background-color: {bg_primary};
+        border: 1px solid {border_light};
         border-radius: 8px;
         padding: 10px 14px;
         padding-right: 36px;
@@ -196,11 +196,11 @@ def get_stylesheet():
     }}
 
     QComboBox:hover {{
-        border-color: {COLORS['border_medium']};
+        border-color: {border_medium};
     }}
 
     QComboBox:focus {{
-        border-color: {COLORS['accent_blue']};
+        border-color: {accent_blue};
     }}
 
     QComboBox::drop-down {{
@@ -212,18 +212,18 @@ def get_stylesheet():
         image: none;
         border-left: 6px solid transparent;
         border-right: 6px solid transparent;
-        border-top: 7px solid {COLORS['text_secondary']};
+        border-top: 7px solid {text_secondary};
         width: 0;
         height: 0;
         margin-right: 10px;
     }}
 
     QComboBox QAbstractItemView {{
-        background-color: {COLORS['bg_primary']};
-        border: 1px solid {COLORS['border_light']};
+        background-color: {bg_primary};
+        border: 1px solid {border_light};
         border-radius: 10px;
         padding: 6px;
-        selection-background-color: {COLORS['accent_blue']};
+        selection-background-color: {accent_blue};
         selection-color: white;
         outline: none;
     }}
@@ -235,7 +235,7 @@ def get_stylesheet():
     }}
 
     QComboBox QAbstractItemView::item:hover {{
-        background-color: {COLORS['bg_tertiary']};
+        background-color: {bg_tertiary};
     }}
 
     /* ===== CHECKBOX ===== */
@@ -248,29 +248,29 @@ def get_stylesheet():
         width: 22px;
         height: 22px;
         border-radius: 6px;
-        border: 2px solid {COLORS['border_medium']};
-        background-color: {COLORS['bg_primary']};
+        border: 2px solid {border_medium};
+        background-color: {bg_primary};
     }}
 
     QCheckBox::indicator:hover {{
-        border-color: {COLORS['accent_blue']};
+        border-color: {accent_blue};
     }}
 
     QCheckBox::indicator:checked {{
-        background-color: {COLORS['accent_blue']};
-        border-color: {COLORS['accent_blue']};
-        image: url(data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMiIgaGVpZ2h0PSIxMiIgdmlld0JveD0iMCAwIDEyIDEyIj48cGF0aCBmaWxsPSJ3aGl0ZSIgZD0iTTEwIDNMNC41IDguNSAyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgZmlsbD0ibm9uZSIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+PC9zdmc+);
+        background-color: {accent_blue};
+        border-color: {accent_blue};
+        image: url("{check_icon}");
     }}
 
     QCheckBox::indicator:disabled {{
-        background-color: {COLORS['bg_tertiary']};
-        border-color: {COLORS['border_light']};
+        background-color: {bg_tertiary};
+        border-color: {border_light};
     }}
 
     /* ===== SLIDER ===== */
     QSlider::groove:horizontal {{
         height: 6px;
-        background-color: {COLORS['bg_tertiary']};
+        background-color: {bg_tertiary};
         border-radius: 3px;
     }}
 
@@ -278,17 +278,17 @@ def get_stylesheet():
         width: 22px;
         height: 22px;
         margin: -8px 0;
-        background-color: {COLORS['bg_primary']};
-        border: 2px solid {COLORS['border_light']};
+        background-color: {bg_primary};
+        border: 2px solid {border_light};
         border-radius: 11px;
     }}
 
     QSlider::handle:horizontal:hover {{
-        border-color: {COLORS['accent_blue']};
+        border-color: {accent_blue};
     }}
 
     QSlider::sub-page:horizontal {{
-        background-color: {COLORS['accent_blue']};
+        background-color: {accent_blue};
         border-radius: 3px;
     }}
 
@@ -313,13 +313,13 @@ def get_stylesheet():
     }}
 
     QScrollBar::handle:horizontal {{
-        background-color: {COLORS['border_medium']};
+        background-color: {border_medium};
         border-radius: 5px;
         min-width: 40px;
     }}
 
     QScrollBar::handle:horizontal:hover {{
-        background-color: {COLORS['text_tertiary']};
+        background-color: {text_tertiary};
     }}
 
     QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
@@ -333,13 +333,13 @@ def get_stylesheet():
     }}
 
     QScrollBar::handle:vertical {{
-        background-color: {COLORS['border_medium']};
+        background-color: {border_medium};
         border-radius: 5px;
         min-height: 40px;
     }}
 
     QScrollBar::handle:vertical:hover {{
-        background-color: {COLORS['text_tertiary']};
+        background-color: {text_tertiary};
     }}
 
     QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
@@ -348,7 +348,7 @@ def get_stylesheet():
 
     /* ===== PROGRESS BAR ===== */
     QProgressBar {{
-        background-color: {COLORS['bg_tertiary']};
+        background-color: {bg_tertiary};
         border: none;
         border-radius: 5px;
         height: 10px;
@@ -356,26 +356,77 @@ def get_stylesheet():
     }}
 
     QProgressBar::chunk {{
-        background-color: {COLORS['accent_blue']};
+        background-color: {accent_blue};
         border-radius: 5px;
     }}
 
     /* ===== STATUS BAR ===== */
     QStatusBar {{
-        background-color: {COLORS['bg_secondary']};
-        border-top: 1px solid {COLORS['border_light']};
+        background-color: {bg_secondary};
+        border-top: 1px solid {border_light};
         padding: 8px 16px;
         font-size: 13px;
-        color: {COLORS['text_secondary']};
+        color: {text_secondary};
     }}
 
     /* ===== FRAME (for cards) ===== */
     QFrame[class="card"] {{
-        background-color: {COLORS['bg_primary']};
-        border: 1px solid {COLORS['border_light']};
+        background-color: {bg_primary};
+        border: 1px solid {border_light};
         border-radius: 12px;
     }}
 
+    QFrame[class="separator"] {{
+        background-color: #E0E0E0;
+        max-height: 1px;
+    }}
+
+    /* ===== FRAME LIST ===== */
+    QLabel[class="frame-list-title"] {{
+        font-size: 13px;
+        font-weight: 600;
+        color: {text_primary};
+    }}
+
+    QLabel[class="count-badge-inactive"],
+    QLabel[class="count-badge-active"] {{
+        font-size: 11px;
+        font-weight: 600;
+        color: {bg_primary};
+        background-color: {text_tertiary};
+        padding: 2px 8px;
+        border-radius: 10px;
+        min-width: 20px;
+    }}
+
+    QLabel[class="count-badge-active"] {{
+        background-color: {accent_blue};
+    }}
+
+    QPushButton[class="clear-link"] {{
+        background-color: transparent;
+        border: none;
+        font-size: 12px;
+        color: {accent_red};
+        padding: 4px 8px;
+    }}
+
+    QPushButton[class="clear-link"]:hover {{
+        text-decoration: underline;
+    }}
+
+    QListView[class="frame-strip"] {{
+        background-color: {bg_secondary};
+        border: 1px solid {border_light};
+        border-radius: 10px;
+    }}
+
+    QLabel[class="frame-list-empty"] {{
+        color: {text_tertiary};
+        font-size: 13px;
+        padding: 40px;
+    }}
+
     /* ===== SPLITTER ===== */
     QSplitter::handle {{
         background-color: transparent;
@@ -391,8 +442,8 @@ def get_stylesheet():
 
     /* ===== TOOLTIP ===== */
     QToolTip {{
-        background-color: {COLORS['text_primary']};
-        color: {COLORS['bg_primary']};
+        background-color: {text_primary};
+        color: {bg_primary};
         border: none;
         border-radius: 8px;
         padding: 8px 12px;
@@ -401,30 +452,30 @@ def get_stylesheet():
 
     /* ===== DIALOG ===== */
     QDialog {{
-        background-color: {COLORS['bg_secondary']};
+        background-color: {bg_secondary};
     }}
 
     /* ===== MESSAGE BOX ===== */
     QMessageBox {{
-        background-color: {COLORS['bg_secondary']};
+        background-color: {bg_secondary};
     }}
 
     QMessageBox QLabel {{
         font-size: 14px;
-        color: {COLORS['text_primary']};
+        color: {text_primary};
     }}
 
     /* ===== TAB WIDGET ===== */
     QTabWidget::pane {{
-        border: 1px solid {COLORS['border_light']};
+        border: 1px solid {border_light};
         border-radius: 8px;
-        background-color: {COLORS['bg_primary']};
+        background-color: {bg_primary};
         padding: 8px;
     }}
 
     QTabBar::tab {{
-        background-color: {COLORS['bg_tertiary']};
-        border: 1px solid {COLORS['border_light']};
+        background-color: {bg_tertiary};
+        border: 1px solid {border_light};
         border-bottom: none;
         border-top-left-radius: 8px;
         border-top-right-radius: 8px;
@@ -434,11 +485,49 @@ def get_stylesheet():
     }}
 
     QTabBar::tab:selected {{
-        background-color: {COLORS['bg_primary']};
-        border-bottom: 1px solid {COLORS['bg_primary']};
+        background-color: {bg_primary};
+        border-bottom: 1px solid {bg_primary};
     }}
 
     QTabBar::tab:hover {{
-        background-color: {COLORS['bg_secondary']};
+        background-color: {bg_secondary};
     }}
     '''
+
+
+# Icons are plain files next to this module; Qt loads and caches them
+# like any other image instead of decoding inline data
+RESOURCES_DIR = Path(__file__).parent / 'resources'
+
+# The palette is constant, so the sheet is built once at import
+STYLESHEET = _STYLESHEET_TEMPLATE.format(
+    check_icon=(RESOURCES_DIR / 'check.svg').as_posix(),
+    **COLORS
+)
+
+
+def get_stylesheet():
+    """Return the complete Apple-style stylesheet with responsive sizing."""
+    return STYLESHEET
+
+
+_qcolors = None
+
+
+def get_qcolors() -> dict:
+    """
+    COLORS as QColor objects, for code that paints with QPainter.
+
+    Built on first use (after the QApplication exists) and shared after.
+    """
+    global _qcolors
+    if _qcolors is None:
+        from PyQt6.QtGui import QColor
+        _qcolors = {key: QColor(value) for key, value in COLORS.items()}
+    return _qcolors
+
+
+def repolish(widget):
+    """Re-apply the stylesheet after changing a property used in a selector."""
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
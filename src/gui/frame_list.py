@@ -1,163 +1,366 @@
 """
 Frame List Widget - Displays selected frames with Apple-style design
 """
+import threading
+from collections import Counter
 import cv2
+import numpy as np
+from PyQt6 import sip
 from PyQt6.QtWidgets import (
-    QWidget, QScrollArea, QHBoxLayout, QVBoxLayout,
-    QLabel, QPushButton, QFrame, QSizePolicy
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
+    QListView, QStyledItemDelegate, QStyle, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QMimeData
-from PyQt6.QtGui import QImage, QPixmap, QDrag
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QEvent, QRect, QRectF, QSize, QPoint
+)
+from PyQt6.QtGui import QImage, QPixmap, QColor, QPen, QFont, QFontMetrics, QPainter
 
 from ..core.video_analyzer import SelectedFrame, VideoAnalyzer
-from .apple_style import COLORS
+from ..utils.thumbnail_cache import ThumbnailCache
+from .apple_style import get_qcolors, repolish
+
+
+THUMBNAIL_SIZE = (164, 92)
+
+# Per pool thread scratch buffer for the final resize
+_scratch = threading.local()
+
+
+def render_thumbnail(image: np.ndarray) -> np.ndarray:
+    """
+    Downscale a BGR frame to thumbnail size (safe to call off the GUI thread).
+
+    Args:
+        image: BGR frame
+
+    Returns:
+        BGR thumbnail; a view of this thread's scratch buffer, valid until
+        the thread renders its next thumbnail
+    """
+    max_w, max_h = THUMBNAIL_SIZE
+    h, w = image.shape[:2]
+    scale = min(max_w / w, max_h / h)
+    new_w, new_h = int(w * scale), int(h * scale)
+
+    # Decimate large frames to about twice the thumbnail size first,
+    # so INTER_AREA doesn't have to read every source pixel
+    k = max(1, min(h // max_h, w // max_w) // 2)
+    if k > 1:
+        image = cv2.resize(image, (w // k, h // k), interpolation=cv2.INTER_NEAREST)
+
+    scratch = getattr(_scratch, 'buffer', None)
+    if scratch is None:
+        scratch = _scratch.buffer = np.empty((max_h, max_w, 3), dtype=np.uint8)
+
+    return cv2.resize(
+        image, (new_w, new_h),
+        dst=scratch[:new_h, :new_w],
+        interpolation=cv2.INTER_AREA
+    )
+
+
+def thumbnail_to_qimage(thumbnail: np.ndarray) -> QImage:
+    """Wrap a BGR thumbnail as a QImage that owns a copy of the pixels."""
+    h, w = thumbnail.shape[:2]
+    # Pixels stay BGR, Qt reads them as Format_BGR888; rows keep the
+    # array's stride, and copy() detaches from the (scratch) buffer
+    return QImage(
+        sip.voidptr(thumbnail.ctypes.data),
+        w, h,
+        thumbnail.strides[0],
+        QImage.Format.Format_BGR888
+    ).copy()
+
+
+_thumbnail_cache = None
+_thumbnail_cache_lock = threading.Lock()
 
 
-class FrameThumbnail(QFrame):
-    """Single frame thumbnail widget with Apple-style design."""
+def get_thumbnail_cache() -> ThumbnailCache:
+    """Shared on-disk thumbnail cache, pruned once per session."""
+    global _thumbnail_cache
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None:
+            _thumbnail_cache = ThumbnailCache()
+            _thumbnail_cache.prune()
+        return _thumbnail_cache
+
+
+class ThumbnailSignals(QObject):
+    """Signals for ThumbnailWorker (QRunnable is not a QObject)."""
+
+    finished = pyqtSignal(object, QImage)
+
+
+class ThumbnailWorker(QRunnable):
+    """Loads or renders one frame's thumbnail on the global thread pool."""
+
+    def __init__(self, frame: SelectedFrame, signals: ThumbnailSignals):
+        super().__init__()
+        self.frame = frame
+        self.signals = signals
+
+    def run(self):
+        frame = self.frame
+        # Frames without a video id (e.g. built by hand) skip the disk cache
+        cache = get_thumbnail_cache() if frame.video_id else None
+
+        thumbnail = cache.load(frame.video_id, frame.frame_number) if cache else None
+        if thumbnail is None:
+            thumbnail = render_thumbnail(frame.image)
+            if cache:
+                cache.save(frame.video_id, frame.frame_number, thumbnail)
+
+        self.signals.finished.emit(frame, thumbnail_to_qimage(thumbnail))
+
+
+class FrameListModel(QAbstractListModel):
+    """List model over the selected frames."""
+
+    FrameRole = Qt.ItemDataRole.UserRole + 1
+    SelectedRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, frames: list, parent=None):
+        super().__init__(parent)
+        self.frames = frames
+        self.selected_row = -1
+        # ids of frames whose thumbnail is being rendered
+        self._pending = set()
+        # One signals object shared by all workers, connected once
+        self._thumbnail_signals = ThumbnailSignals(self)
+        self._thumbnail_signals.finished.connect(self._on_thumbnail_ready)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.frames)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        frame = self.frames[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if frame.timestamp_str is None:
+                frame.timestamp_str = VideoAnalyzer.format_timestamp(frame.timestamp)
+            return frame.timestamp_str
+
+        if role == Qt.ItemDataRole.DecorationRole:
+            # Only visible items are painted, so thumbnails scrolled out
+            # of view are not rendered until the user gets to them
+            if frame.thumbnail_pixmap is None:
+                self._request_thumbnail(frame)
+            return frame.thumbnail_pixmap
+
+        if role == self.FrameRole:
+            return frame
+
+        if role == self.SelectedRole:
+            return index.row() == self.selected_row
+
+        return None
+
+    def _request_thumbnail(self, frame: SelectedFrame):
+        """Render a frame's thumbnail in the background."""
+        if id(frame) in self._pending:
+            return
+
+        self._pending.add(id(frame))
+        QThreadPool.globalInstance().start(ThumbnailWorker(frame, self._thumbnail_signals))
+
+    def _on_thumbnail_ready(self, frame: SelectedFrame, qimage: QImage):
+        """Store a finished thumbnail and repaint its item (GUI thread)."""
+        self._pending.discard(id(frame))
+        frame.thumbnail_pixmap = QPixmap.fromImage(qimage)
+
+        for row, other in enumerate(self.frames):
+            if other is frame:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+                break
+
+    def append_frames(self, frames: list):
+        """Append frames as new rows."""
+        if not frames:
+            return
+
+        first = len(self.frames)
+        self.beginInsertRows(QModelIndex(), first, first + len(frames) - 1)
+        self.frames.extend(frames)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> SelectedFrame:
+        """Remove one row and return its frame."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        frame = self.frames.pop(row)
+
+        # Keep selected_row pointing at the same frame
+        if row == self.selected_row:
+            self.selected_row = -1
+        elif row < self.selected_row:
+            self.selected_row -= 1
+
+        self.endRemoveRows()
+        return frame
+
+    def clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self.frames.clear()
+        self.selected_row = -1
+        self.endResetModel()
+
+    def set_selected_row(self, row: int):
+        """Select a row (-1 for none) and repaint the affected items."""
+        previous = self.selected_row
+        self.selected_row = row
+
+        for changed in (previous, row):
+            if 0 <= changed < len(self.frames):
+                index = self.index(changed)
+                self.dataChanged.emit(index, index, [self.SelectedRole])
+
+
+class FrameThumbnailDelegate(QStyledItemDelegate):
+    """Paints a frame card: thumbnail, type badge, timestamp, remove button."""
 
     clicked = pyqtSignal(int)
     remove_requested = pyqtSignal(int)
 
-    def __init__(self, frame: SelectedFrame, index: int, parent=None):
+    CARD_SIZE = QSize(184, 138)
+    MARGIN = 8
+    SPACING = 6
+    REMOVE_SIZE = 22
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.frame = frame
-        self.index = index
-        self.selected = False
+        # Everything paint() needs is built once here, not per item
+        self._colors = get_qcolors()
+        self._tints = {
+            key: self._tint(self._colors[key])
+            for key in ('accent_blue', 'accent_green', 'accent_red')
+        }
+        self._pens = {
+            'selected': QPen(self._colors['accent_blue'], 2),
+            'hovered': QPen(self._colors['border_medium'], 1),
+            'normal': QPen(self._colors['border_light'], 1),
+        }
+        self._image_background = QColor('#000000')
+
+    @staticmethod
+    def _tint(color: QColor) -> QColor:
+        """Color at 1/8 opacity, for badge and hover backgrounds."""
+        tint = QColor(color)
+        tint.setAlpha(0x20)
+        return tint
+
+    def sizeHint(self, option, index) -> QSize:
+        return self.CARD_SIZE
+
+    def image_rect(self, rect: QRect) -> QRect:
+        """Area of the thumbnail image inside a card."""
+        return QRect(
+            rect.x() + self.MARGIN, rect.y() + self.MARGIN,
+            rect.width() - 2 * self.MARGIN, THUMBNAIL_SIZE[1]
+        )
 
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setMinimumSize(180, 140)
-        self.setMaximumSize(220, 170)
+    def remove_rect(self, rect: QRect) -> QRect:
+        """Area of the remove button inside a card."""
+        return QRect(
+            rect.right() - self.MARGIN - self.REMOVE_SIZE + 1,
+            rect.bottom() - self.MARGIN - self.REMOVE_SIZE + 1,
+            self.REMOVE_SIZE, self.REMOVE_SIZE
+        )
 
-        self._setup_ui()
-        self._update_style()
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        frame = index.data(FrameListModel.FrameRole)
+        selected = index.data(FrameListModel.SelectedRole)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
 
-    def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(6)
-
-        # Thumbnail image container
-        image_container = QFrame()
-        image_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: #000;
-                border-radius: 6px;
-            }}
-        """)
-        image_layout = QVBoxLayout(image_container)
-        image_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setMinimumSize(164, 92)
-        image_layout.addWidget(self.image_label)
-        layout.addWidget(image_container)
-
-        self._update_thumbnail()
-
-        # Info row
-        info_layout = QHBoxLayout()
-        info_layout.setSpacing(6)
-
-        # Frame type indicator
-        type_text = "Manuell" if self.frame.is_manual else "Auto"
-        type_color = COLORS['accent_green'] if self.frame.is_manual else COLORS['accent_blue']
-        type_label = QLabel(type_text)
-        type_label.setStyleSheet(f"""
-            font-size: 10px;
-            font-weight: 600;
-            color: {type_color};
-            background-color: {type_color}20;
-            padding: 2px 6px;
-            border-radius: 4px;
-        """)
-        info_layout.addWidget(type_label)
-
-        # Timestamp
-        timestamp_str = VideoAnalyzer.format_timestamp(self.frame.timestamp)
-        time_label = QLabel(timestamp_str)
-        time_label.setStyleSheet(f"font-size: 11px; color: {COLORS['text_secondary']};")
-        info_layout.addWidget(time_label)
-
-        info_layout.addStretch()
-
-        # Remove button
-        remove_btn = QPushButton("✕")
-        remove_btn.setFixedSize(22, 22)
-        remove_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 11px;
-                font-size: 12px;
-                font-weight: 600;
-                color: {COLORS['text_tertiary']};
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['accent_red']}20;
-                color: {COLORS['accent_red']};
-            }}
-        """)
-        remove_btn.clicked.connect(lambda: self.remove_requested.emit(self.index))
-        info_layout.addWidget(remove_btn)
-
-        layout.addLayout(info_layout)
-
-    def _update_thumbnail(self):
-        """Update the thumbnail image."""
-        frame_rgb = cv2.cvtColor(self.frame.image, cv2.COLOR_BGR2RGB)
-
-        h, w = frame_rgb.shape[:2]
-        scale = min(164 / w, 92 / h)
-        new_w = int(w * scale)
-        new_h = int(h * scale)
-        scaled = cv2.resize(frame_rgb, (new_w, new_h), interpolation=cv2.INTER_AREA)
-
-        qimage = QImage(
-            scaled.data,
-            new_w, new_h,
-            new_w * 3,
-            QImage.Format.Format_RGB888
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card
+        if selected:
+            painter.setPen(self._pens['selected'])
+        elif hovered:
+            painter.setPen(self._pens['hovered'])
+        else:
+            painter.setPen(self._pens['normal'])
+        painter.setBrush(self._colors['bg_primary'])
+        painter.drawRoundedRect(QRectF(option.rect).adjusted(1, 1, -1, -1), 10, 10)
+
+        # Thumbnail on black
+        image_rect = self.image_rect(option.rect)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._image_background)
+        painter.drawRoundedRect(QRectF(image_rect), 6, 6)
+
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is not None:
+            target = QRect(QPoint(0, 0), pixmap.size())
+            target.moveCenter(image_rect.center())
+            painter.drawPixmap(target, pixmap)
+
+        # Info row: type badge, timestamp, remove button
+        remove_rect = self.remove_rect(option.rect)
+        row_center = remove_rect.center().y()
+        font = QFont(option.font)
+
+        font.setPixelSize(10)
+        font.setWeight(QFont.Weight.DemiBold)
+        painter.setFont(font)
+        type_text = "Manuell" if frame.is_manual else "Auto"
+        type_key = 'accent_green' if frame.is_manual else 'accent_blue'
+        metrics = QFontMetrics(font)
+        badge_rect = QRect(0, 0, metrics.horizontalAdvance(type_text) + 12, metrics.height() + 4)
+        badge_rect.moveTo(image_rect.left(), row_center - badge_rect.height() // 2)
+        painter.setBrush(self._tints[type_key])
+        painter.drawRoundedRect(QRectF(badge_rect), 4, 4)
+        painter.setPen(self._colors[type_key])
+        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, type_text)
+
+        font.setPixelSize(11)
+        font.setWeight(QFont.Weight.Normal)
+        painter.setFont(font)
+        painter.setPen(self._colors['text_secondary'])
+        time_rect = QRect(
+            badge_rect.right() + 1 + self.SPACING, remove_rect.top(),
+            remove_rect.left() - badge_rect.right() - 2 * self.SPACING, self.REMOVE_SIZE
+        )
+        painter.drawText(
+            time_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            index.data(Qt.ItemDataRole.DisplayRole)
         )
-        self.image_label.setPixmap(QPixmap.fromImage(qimage))
-
-    def _update_style(self):
-        """Update frame style."""
-        if self.selected:
-            self.setStyleSheet(f"""
-                FrameThumbnail {{
-                    background-color: {COLORS['bg_primary']};
-                    border: 2px solid {COLORS['accent_blue']};
-                    border-radius: 10px;
-                }}
-            """)
+
+        font.setPixelSize(12)
+        font.setWeight(QFont.Weight.DemiBold)
+        painter.setFont(font)
+        if hovered:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._tints['accent_red'])
+            painter.drawEllipse(QRectF(remove_rect))
+            painter.setPen(self._colors['accent_red'])
         else:
-            self.setStyleSheet(f"""
-                FrameThumbnail {{
-                    background-color: {COLORS['bg_primary']};
-                    border: 1px solid {COLORS['border_light']};
-                    border-radius: 10px;
-                }}
-                FrameThumbnail:hover {{
-                    border-color: {COLORS['border_medium']};
-                }}
-            """)
-
-    def set_selected(self, selected: bool):
-        """Set selection state."""
-        self.selected = selected
-        self._update_style()
-
-    def mousePressEvent(self, event):
-        """Handle mouse press."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.index)
-        super().mousePressEvent(event)
-
-    def update_index(self, new_index: int):
-        """Update the frame index."""
-        self.index = new_index
+            painter.setPen(self._colors['text_tertiary'])
+        painter.drawText(remove_rect, Qt.AlignmentFlag.AlignCenter, "✕")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        """Turn left clicks into clicked / remove_requested."""
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease and
+            event.button() == Qt.MouseButton.LeftButton
+        ):
+            if self.remove_rect(option.rect).contains(event.position().toPoint()):
+                self.remove_requested.emit(index.row())
+            else:
+                self.clicked.emit(index.row())
+            return True
+
+        return super().editorEvent(event, model, option, index)
 
 
 class FrameListWidget(QWidget):
@@ -166,15 +369,21 @@ class FrameListWidget(QWidget):
     frame_removed = pyqtSignal(int)
     frame_selected = pyqtSignal(int)
     frames_reordered = pyqtSignal()
+    frames_cleared = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.frames = []
-        self.thumbnails = []
-        self.selected_index = -1
+        # How often each frame number is in the list, for O(1) lookups
+        self._frame_numbers = Counter()
 
         self._setup_ui()
 
+    @property
+    def selected_index(self) -> int:
+        """Index of the selected frame, -1 if none."""
+        return self.model.selected_row
+
     def _setup_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -183,115 +392,89 @@ class FrameListWidget(QWidget):
         # Header
         header_layout = QHBoxLayout()
         self.count_label = QLabel("Ausgewählte Frames")
-        self.count_label.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-        """)
+        self.count_label.setProperty("class", "frame-list-title")
         header_layout.addWidget(self.count_label)
 
         self.count_badge = QLabel("0")
-        self.count_badge.setStyleSheet(f"""
-            font-size: 11px;
-            font-weight: 600;
-            color: {COLORS['bg_primary']};
-            background-color: {COLORS['text_tertiary']};
-            padding: 2px 8px;
-            border-radius: 10px;
-            min-width: 20px;
-        """)
+        self.count_badge.setProperty("class", "count-badge-inactive")
         self.count_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(self.count_badge)
 
         header_layout.addStretch()
 
         self.clear_btn = QPushButton("Alle entfernen")
-        self.clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                font-size: 12px;
-                color: {COLORS['accent_red']};
-                padding: 4px 8px;
-            }}
-            QPushButton:hover {{
-                text-decoration: underline;
-            }}
-        """)
+        self.clear_btn.setProperty("class", "clear-link")
         self.clear_btn.clicked.connect(self.clear_all)
         header_layout.addWidget(self.clear_btn)
 
         main_layout.addLayout(header_layout)
 
-        # Scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setMinimumHeight(190)
-        scroll_area.setMaximumHeight(210)
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border_light']};
-                border-radius: 10px;
-            }}
-        """)
-
-        # Container
-        self.container = QWidget()
-        self.container.setStyleSheet(f"background-color: {COLORS['bg_secondary']};")
-        self.container_layout = QHBoxLayout(self.container)
-        self.container_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.container_layout.setContentsMargins(12, 12, 12, 12)
-        self.container_layout.setSpacing(12)
-
-        # Empty placeholder
+        # Model/view strip: one delegate paints every card, and only
+        # the cards inside the viewport are ever painted
+        self.model = FrameListModel(self.frames, self)
+        self.delegate = FrameThumbnailDelegate(self)
+        self.delegate.clicked.connect(self._on_thumbnail_clicked)
+        # Queued, so rows are not removed while the view handles the click
+        self.delegate.remove_requested.connect(
+            self._on_remove_requested, Qt.ConnectionType.QueuedConnection
+        )
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setFlow(QListView.Flow.LeftToRight)
+        self.list_view.setWrapping(False)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(6)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.list_view.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.setMouseTracking(True)
+        self.list_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.list_view.setMinimumHeight(190)
+        self.list_view.setMaximumHeight(210)
+        self.list_view.setProperty("class", "frame-strip")
+
+        # Empty placeholder, laid over the empty viewport
         self.empty_label = QLabel(
             "Keine Frames ausgewählt\n"
             "Klicke auf 'Analysieren' oder füge manuell Frames hinzu"
         )
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setStyleSheet(f"""
-            color: {COLORS['text_tertiary']};
-            font-size: 13px;
-            padding: 40px;
-        """)
-        self.container_layout.addWidget(self.empty_label)
+        self.empty_label.setProperty("class", "frame-list-empty")
+        empty_layout = QVBoxLayout(self.list_view.viewport())
+        empty_layout.addWidget(self.empty_label)
 
-        scroll_area.setWidget(self.container)
-        main_layout.addWidget(scroll_area)
+        main_layout.addWidget(self.list_view)
 
     def add_frame(self, frame: SelectedFrame):
         """Add a frame to the list."""
-        self.empty_label.hide()
+        self.add_frames([frame])
 
-        index = len(self.frames)
-        thumbnail = FrameThumbnail(frame, index)
-        thumbnail.clicked.connect(self._on_thumbnail_clicked)
-        thumbnail.remove_requested.connect(self._on_remove_requested)
+    def add_frames(self, frames: list):
+        """Add multiple frames."""
+        if not frames:
+            return
 
-        self.frames.append(frame)
-        self.thumbnails.append(thumbnail)
-        self.container_layout.addWidget(thumbnail)
+        # Format all timestamps in one vectorized pass
+        timestamp_strs = VideoAnalyzer.format_timestamps([f.timestamp for f in frames])
+        for frame, timestamp_str in zip(frames, timestamp_strs):
+            frame.timestamp_str = timestamp_str
+            self._frame_numbers[frame.frame_number] += 1
 
+        self.empty_label.hide()
+        self.model.append_frames(frames)
         self._update_count()
 
-    def add_frames(self, frames: list):
-        """Add multiple frames."""
-        for frame in frames:
-            self.add_frame(frame)
-
     def remove_frame(self, index: int):
         """Remove a frame by index."""
         if 0 <= index < len(self.frames):
-            self.frames.pop(index)
-            thumbnail = self.thumbnails.pop(index)
-            self.container_layout.removeWidget(thumbnail)
-            thumbnail.deleteLater()
-
-            for i, thumb in enumerate(self.thumbnails):
-                thumb.update_index(i)
+            frame = self.model.remove_row(index)
+            self._frame_numbers[frame.frame_number] -= 1
+            if self._frame_numbers[frame.frame_number] <= 0:
+                del self._frame_numbers[frame.frame_number]
 
             self._update_count()
             self.frame_removed.emit(index)
@@ -300,9 +483,16 @@ class FrameListWidget(QWidget):
                 self.empty_label.show()
 
     def clear_all(self):
-        """Remove all frames."""
-        while self.frames:
-            self.remove_frame(0)
+        """Remove all frames at once (one signal instead of one per frame)."""
+        if not self.frames:
+            return
+
+        self.model.clear()
+        self._frame_numbers.clear()
+
+        self._update_count()
+        self.empty_label.show()
+        self.frames_cleared.emit()
 
     def get_frames(self) -> list:
         """Get all selected frames."""
@@ -314,13 +504,11 @@ class FrameListWidget(QWidget):
 
     def _on_thumbnail_clicked(self, index: int):
         """Handle thumbnail click."""
-        if self.selected_index >= 0 and self.selected_index < len(self.thumbnails):
-            self.thumbnails[self.selected_index].set_selected(False)
-
-        self.selected_index = index
-        if index < len(self.thumbnails):
-            self.thumbnails[index].set_selected(True)
+        # Re-clicking the selected thumbnail changes nothing
+        if index == self.selected_index:
+            return
 
+        self.model.set_selected_row(index)
         self.frame_selected.emit(index)
 
     def _on_remove_requested(self, index: int):
@@ -332,30 +520,11 @@ class FrameListWidget(QWidget):
         count = len(self.frames)
         self.count_badge.setText(str(count))
 
-        if count > 0:
-            self.count_badge.setStyleSheet(f"""
-                font-size: 11px;
-                font-weight: 600;
-                color: {COLORS['bg_primary']};
-                background-color: {COLORS['accent_blue']};
-                padding: 2px 8px;
-                border-radius: 10px;
-                min-width: 20px;
-            """)
-        else:
-            self.count_badge.setStyleSheet(f"""
-                font-size: 11px;
-                font-weight: 600;
-                color: {COLORS['bg_primary']};
-                background-color: {COLORS['text_tertiary']};
-                padding: 2px 8px;
-                border-radius: 10px;
-                min-width: 20px;
-            """)
+        badge_class = "count-badge-active" if count > 0 else "count-badge-inactive"
+        if self.count_badge.property("class") != badge_class:
+            self.count_badge.setProperty("class", badge_class)
+            repolish(self.count_badge)
 
     def is_frame_already_added(self, frame_number: int) -> bool:
         """Check if a frame number is already in the list."""
-        for frame in self.frames:
-            if frame.frame_number == frame_number:
-                return True
-        return False
+        return frame_number in self._frame_numbers
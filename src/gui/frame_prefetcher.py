@@ -0,0 +1,130 @@
+"""
+Frame Prefetcher - Decodes the frames around the preview position in the background
+"""
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QThread
+
+from ..core.video_analyzer import open_capture
+
+
+class FramePrefetcher(QThread):
+    """
+    Speculatively decodes the neighbours of the shown frame, so stepping
+    with ◀/▶ or slow scrubbing copies a ready frame instead of seeking.
+
+    Reads through its own VideoCapture. Frames live in an LRU cache; evicted
+    frames become the decode targets for the next reads, so steady-state
+    prefetching allocates nothing.
+    """
+
+    # Frames decoded on each side of the current position
+    RADIUS = 4
+    # Cached frames: the current neighbourhood plus a little history
+    CAPACITY = 2 * RADIUS + 4
+
+    def __init__(self, video_path: str, frame_count: int):
+        """
+        Args:
+            video_path: Video file to read
+            frame_count: Number of frames in the video
+        """
+        super().__init__()
+        self.video_path = video_path
+        self.frame_count = frame_count
+        self._cache: 'OrderedDict[int, np.ndarray]' = OrderedDict()
+        # Evicted frames, reused as decode buffers
+        self._spare: List[np.ndarray] = []
+        self._center: Optional[int] = None
+        self._running = True
+        self._cond = threading.Condition()
+
+    def get(self, frame_number: int) -> Optional[np.ndarray]:
+        """
+        Get a prefetched frame.
+
+        Returns:
+            A copy of the frame (the cached one stays for stepping back),
+            or None if it isn't decoded yet
+        """
+        with self._cond:
+            frame = self._cache.get(frame_number)
+            if frame is None:
+                return None
+            self._cache.move_to_end(frame_number)
+            return frame.copy()
+
+    def prefetch_around(self, frame_number: int):
+        """Decode the neighbours of frame_number next, dropping them after a jump."""
+        with self._cond:
+            if self._center is not None and abs(frame_number - self._center) > self.RADIUS:
+                for frame in self._cache.values():
+                    self._recycle(frame)
+                self._cache.clear()
+            self._center = frame_number
+            self._cond.notify()
+
+    def stop(self):
+        """Stop decoding and wait for the thread to finish."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self.wait()
+
+    def run(self):
+        cap = open_capture(self.video_path)
+        # Frame the next cap.read() returns, -1 if unknown
+        position = -1
+        try:
+            while True:
+                with self._cond:
+                    target = self._next_target()
+                    while self._running and target is None:
+                        self._cond.wait()
+                        target = self._next_target()
+                    if not self._running:
+                        return
+                    buffer = self._spare.pop() if self._spare else None
+
+                # Short forward gaps are bridged with grab(), like
+                # VideoAnalyzer.iter_frames_at; a seek decodes a whole GOP
+                gap = target - position
+                if position < 0 or gap < 0 or gap > 2 * self.RADIUS:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+                    gap = 0
+                ok = all(cap.grab() for _ in range(gap))
+                ret, frame = cap.read(buffer) if ok else (False, None)
+                position = target + 1 if ret else -1
+
+                with self._cond:
+                    if not ret:
+                        # Unreadable frame: don't try it again for this position
+                        self._center = None
+                    elif abs(target - self._center) <= self.RADIUS:
+                        self._cache[target] = frame
+                        while len(self._cache) > self.CAPACITY:
+                            self._recycle(self._cache.popitem(last=False)[1])
+                    else:
+                        self._recycle(frame)
+        finally:
+            cap.release()
+
+    def _next_target(self) -> Optional[int]:
+        """Next frame to decode: ahead first, then the frames behind in ascending order."""
+        if self._center is None:
+            return None
+        center = self._center
+        ahead = range(center + 1, center + self.RADIUS + 1)
+        behind = range(center - self.RADIUS, center)
+        for frame_number in (*ahead, *behind):
+            if 0 <= frame_number < self.frame_count and frame_number not in self._cache:
+                return frame_number
+        return None
+
+    def _recycle(self, frame: np.ndarray):
+        if len(self._spare) < self.RADIUS:
+            self._spare.append(frame)
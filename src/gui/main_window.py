@@ -2,6 +2,7 @@
 Main Window - Primary application window with responsive design
 """
 import os
+import threading
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -10,7 +11,7 @@ from PyQt6.QtWidgets import (
     QLineEdit, QApplication, QSlider,
     QFrame, QSizePolicy, QSplitter, QScrollArea
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QSettings
 from PyQt6.QtGui import QFont
 
 from .video_preview import VideoPreviewWidget
@@ -24,10 +25,44 @@ from ..utils.lut_processor import LUTProcessor
 from ..utils.image_formats import ImageFormats
 
 
+# Inline style for the LUT label once a LUT is loaded, formatted once
+LUT_LOADED_STYLE = f"color: {COLORS['accent_green']};"
+
+# File dialog filter for importable videos, built once
+VIDEO_FILE_FILTER = (
+    f"Video Dateien ({' '.join(f'*{ext}' for ext in VideoAnalyzer.SUPPORTED_FORMATS)})"
+)
+
+# Interval at which the UI polls worker progress (~30 Hz)
+PROGRESS_POLL_MS = 33
+
+
+class LoadVideoWorker(QThread):
+    """Worker thread for opening a video and probing its metadata."""
+
+    finished = pyqtSignal(bool, object)
+
+    def __init__(self, video_analyzer: VideoAnalyzer, filepath: str):
+        super().__init__()
+        self.video_analyzer = video_analyzer
+        self.filepath = filepath
+
+    def run(self):
+        try:
+            video_info = self.video_analyzer.load_video(self.filepath)
+        except Exception as e:
+            print(f"Error loading video: {e}")
+            video_info = None
+        self.finished.emit(video_info is not None, video_info)
+
+
 class AnalyzeWorker(QThread):
-    """Worker thread for video analysis."""
+    """
+    Worker thread for video analysis.
+
+    Progress is not signalled per frame; the UI polls current/total instead.
+    """
 
-    progress = pyqtSignal(int, int)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
@@ -36,6 +71,8 @@ class AnalyzeWorker(QThread):
         self.video_analyzer = video_analyzer
         self.num_frames = num_frames
         self.project_type = project_type
+        self.current = 0
+        self.total = 0
         self._cancelled = False
 
     def run(self):
@@ -43,14 +80,11 @@ class AnalyzeWorker(QThread):
             def progress_callback(current, total):
                 if self._cancelled:
                     raise InterruptedError("Cancelled")
-                self.progress.emit(current, total)
+                self.current = current
+                self.total = total
 
             settings = ProjectTypes.get_settings(self.project_type)
-            self.video_analyzer.frame_scorer.set_weights(
-                settings.face_weight,
-                settings.sharpness_weight,
-                settings.stability_weight
-            )
+            self.video_analyzer.frame_scorer.set_weights(*settings.weights)
 
             frames = self.video_analyzer.analyze_video(
                 num_frames=self.num_frames,
@@ -61,15 +95,21 @@ class AnalyzeWorker(QThread):
             self.finished.emit([])
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            # This thread ends here; don't keep its decoder open with the video
+            self.video_analyzer.release_thread_capture()
 
     def cancel(self):
         self._cancelled = True
 
 
 class ExportWorker(QThread):
-    """Worker thread for exporting screenshots."""
+    """
+    Worker thread for exporting screenshots.
+
+    Progress is not signalled per file; the UI polls current/total/filename.
+    """
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
@@ -78,28 +118,30 @@ class ExportWorker(QThread):
         self.exporter = exporter
         self.frames = frames
         self.settings = settings
-        self._cancelled = False
+        self.current = 0
+        self.total = 0
+        self.filename = ""
+        self._cancel_event = threading.Event()
 
     def run(self):
         try:
             def progress_callback(current, total, filename):
-                if self._cancelled:
-                    raise InterruptedError("Cancelled")
-                self.progress.emit(current, total, filename)
+                self.filename = filename
+                self.total = total
+                self.current = current
 
             files = self.exporter.export_frames(
                 self.frames,
                 self.settings,
-                progress_callback
+                progress_callback,
+                cancel_event=self._cancel_event
             )
-            self.finished.emit(files)
-        except InterruptedError:
-            self.finished.emit([])
+            self.finished.emit([] if self._cancel_event.is_set() else files)
         except Exception as e:
             self.error.emit(str(e))
 
     def cancel(self):
-        self._cancelled = True
+        self._cancel_event.set()
 
 
 class MainWindow(QMainWindow):
@@ -108,6 +150,19 @@ class MainWindow(QMainWindow):
     SETTINGS_ORG = "ScreenshotTool"
     SETTINGS_APP = "ScreenshotTool"
 
+    # Quality label texts, indexed by slider value
+    _QUALITY_TEXT = tuple(f"{value}%" for value in range(101))
+
+    # Persisted settings and their defaults (the default also fixes the type)
+    SETTINGS_DEFAULTS = {
+        "last_lut_path": "",
+        "last_output_folder": "",
+        "last_project_type": "Podcast",
+        "last_format": "PNG",
+        "last_quality": 95,
+        "last_screenshot_count": 5,
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Screenshot Tool")
@@ -118,6 +173,12 @@ class MainWindow(QMainWindow):
         self.exporter = ScreenshotExporter(self.lut_processor)
         self.output_folder = str(Path.home() / "Desktop")
 
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_POLL_MS)
+        self._progress_timer.timeout.connect(self._poll_progress)
+        self._progress_slot = None
+        self._last_quality = -1
+
         self._setup_ui()
         self._connect_signals()
         self._load_settings()
@@ -134,6 +195,13 @@ class MainWindow(QMainWindow):
         label.setProperty("class", "secondary")
         return label
 
+    def _create_separator(self) -> QFrame:
+        """Create a horizontal separator line."""
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setProperty("class", "separator")
+        return separator
+
     def _setup_ui(self):
         central = QWidget()
         self.setCentralWidget(central)
@@ -209,15 +277,13 @@ class MainWindow(QMainWindow):
         # Project type
         sidebar_layout.addWidget(self._create_section_title("Projekt"))
         self.project_type_combo = QComboBox()
-        self.project_type_combo.addItems(ProjectTypes.get_type_names())
+        project_type_names = ProjectTypes.get_type_names()
+        self.project_type_combo.addItems(project_type_names)
+        self._project_type_index = {name: i for i, name in enumerate(project_type_names)}
         self.project_type_combo.setToolTip(ProjectTypes.get_description("Podcast"))
         sidebar_layout.addWidget(self.project_type_combo)
 
-        # Separator
-        sep1 = QFrame()
-        sep1.setFrameShape(QFrame.Shape.HLine)
-        sep1.setStyleSheet("background-color: #E0E0E0; max-height: 1px;")
-        sidebar_layout.addWidget(sep1)
+        sidebar_layout.addWidget(self._create_separator())
 
         # Analysis
         sidebar_layout.addWidget(self._create_section_title("Analyse"))
@@ -237,11 +303,7 @@ class MainWindow(QMainWindow):
         self.analyze_btn.setEnabled(False)
         sidebar_layout.addWidget(self.analyze_btn)
 
-        # Separator
-        sep2 = QFrame()
-        sep2.setFrameShape(QFrame.Shape.HLine)
-        sep2.setStyleSheet("background-color: #E0E0E0; max-height: 1px;")
-        sidebar_layout.addWidget(sep2)
+        sidebar_layout.addWidget(self._create_separator())
 
         # LUT
         sidebar_layout.addWidget(self._create_section_title("Farbkorrektur"))
@@ -264,11 +326,7 @@ class MainWindow(QMainWindow):
         lut_checks.addStretch()
         sidebar_layout.addLayout(lut_checks)
 
-        # Separator
-        sep3 = QFrame()
-        sep3.setFrameShape(QFrame.Shape.HLine)
-        sep3.setStyleSheet("background-color: #E0E0E0; max-height: 1px;")
-        sidebar_layout.addWidget(sep3)
+        sidebar_layout.addWidget(self._create_separator())
 
         # Export
         sidebar_layout.addWidget(self._create_section_title("Export"))
@@ -282,7 +340,9 @@ class MainWindow(QMainWindow):
         format_row.addWidget(QLabel("Format:"))
         format_row.addStretch()
         self.format_combo = QComboBox()
-        self.format_combo.addItems(ImageFormats.get_format_list())
+        format_names = ImageFormats.get_format_list()
+        self.format_combo.addItems(format_names)
+        self._format_index = {name: i for i, name in enumerate(format_names)}
         self.format_combo.setCurrentText("PNG")
         format_row.addWidget(self.format_combo)
         sidebar_layout.addLayout(format_row)
@@ -343,12 +403,15 @@ class MainWindow(QMainWindow):
         self.preview_lut_check.toggled.connect(self._on_lut_preview_changed)
 
         self.frame_list.frame_removed.connect(self._on_frame_removed)
+        self.frame_list.frames_cleared.connect(self._on_frames_cleared)
         self.quality_slider.valueChanged.connect(self._on_quality_changed)
         self.format_combo.currentTextChanged.connect(self._on_format_changed)
         self.project_type_combo.currentTextChanged.connect(self._on_project_type_changed)
 
     def _on_quality_changed(self, value: int):
-        self.quality_label.setText(f"{value}%")
+        if value != self._last_quality:
+            self._last_quality = value
+            self.quality_label.setText(self._QUALITY_TEXT[value])
 
     def _on_format_changed(self, format_name: str):
         if format_name in ['JPG', 'WebP']:
@@ -364,35 +427,49 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(f"Projekttyp: {type_name} – {description}")
 
     def _import_video(self):
-        formats = " ".join(f"*{ext}" for ext in VideoAnalyzer.SUPPORTED_FORMATS)
         filepath, _ = QFileDialog.getOpenFileName(
             self,
             "Video importieren",
             str(Path.home()),
-            f"Video Dateien ({formats})"
+            VIDEO_FILE_FILTER
         )
 
         if filepath:
             self.statusBar().showMessage(f"Lade {Path(filepath).name}...")
-            QApplication.processEvents()
-
-            if self.video_preview.load_video(filepath):
-                video_info = self.video_preview.get_video_analyzer().video_info
-                self.video_info_label.setText(
-                    f"{video_info.width}×{video_info.height} | "
-                    f"{video_info.fps:.1f} fps | "
-                    f"{VideoAnalyzer.format_timestamp(video_info.duration)}"
-                )
-                self.analyze_btn.setEnabled(True)
-                self.frame_list.clear_all()
-
-                video_name = Path(filepath).stem
-                self.prefix_edit.setText(video_name)
-
-                self.statusBar().showMessage(f"Video geladen: {Path(filepath).name}")
-            else:
-                QMessageBox.warning(self, "Fehler", "Video konnte nicht geladen werden.")
-                self.statusBar().showMessage("Fehler beim Laden des Videos.")
+
+            self.load_dialog = ProgressDialog("Video laden...", self)
+            self.load_dialog.set_status(f"Lade {Path(filepath).name}...")
+            self.load_dialog.set_indeterminate(True)
+            self.load_dialog.cancel_btn.setEnabled(False)
+
+            self.load_worker = LoadVideoWorker(
+                self.video_preview.get_video_analyzer(), filepath
+            )
+            self.load_worker.finished.connect(self._on_video_loaded)
+            self.load_worker.start()
+            self.load_dialog.open()
+
+    def _on_video_loaded(self, ok: bool, video_info):
+        self.load_dialog.accept()
+        filepath = self.load_worker.filepath
+
+        if ok:
+            self.video_preview.show_video(video_info)
+            self.video_info_label.setText(
+                f"{video_info.width}×{video_info.height} | "
+                f"{video_info.fps:.1f} fps | "
+                f"{VideoAnalyzer.format_timestamp(video_info.duration)}"
+            )
+            self.analyze_btn.setEnabled(True)
+            self.frame_list.clear_all()
+
+            video_name = Path(filepath).stem
+            self.prefix_edit.setText(video_name)
+
+            self.statusBar().showMessage(f"Video geladen: {Path(filepath).name}")
+        else:
+            QMessageBox.warning(self, "Fehler", "Video konnte nicht geladen werden.")
+            self.statusBar().showMessage("Fehler beim Laden des Videos.")
 
     def _load_lut(self):
         filepath, _ = QFileDialog.getOpenFileName(
@@ -406,7 +483,7 @@ class MainWindow(QMainWindow):
             if self.lut_processor.load_cube(filepath):
                 lut_name = self.lut_processor.get_lut_name()
                 self.lut_label.setText(f"✓ {lut_name}")
-                self.lut_label.setStyleSheet(f"color: {COLORS['accent_green']};")
+                self.lut_label.setStyleSheet(LUT_LOADED_STYLE)
                 self.apply_lut_check.setEnabled(True)
                 self.preview_lut_check.setEnabled(True)
                 self.settings.setValue("last_lut_path", filepath)
@@ -436,7 +513,6 @@ class MainWindow(QMainWindow):
         self.progress_dialog = ProgressDialog("Video analysieren...", self)
 
         self.analyze_worker = AnalyzeWorker(video_analyzer, num_frames, project_type)
-        self.analyze_worker.progress.connect(self._on_analyze_progress)
         self.analyze_worker.finished.connect(self._on_analyze_finished)
         self.analyze_worker.error.connect(self._on_analyze_error)
 
@@ -444,12 +520,28 @@ class MainWindow(QMainWindow):
         self.progress_dialog.set_status(f"Analysiere als '{project_type}'...")
 
         self.analyze_worker.start()
+        self._start_progress_polling(self._on_analyze_progress)
         self.progress_dialog.exec()
 
-    def _on_analyze_progress(self, current: int, total: int):
-        self.progress_dialog.set_progress(current, total)
+    def _start_progress_polling(self, slot):
+        """Call slot at PROGRESS_POLL_MS intervals until _stop_progress_polling()."""
+        self._progress_slot = slot
+        self._progress_timer.start()
+
+    def _stop_progress_polling(self):
+        self._progress_timer.stop()
+        self._progress_slot = None
+
+    def _poll_progress(self):
+        if self._progress_slot is not None:
+            self._progress_slot()
+
+    def _on_analyze_progress(self):
+        worker = self.analyze_worker
+        self.progress_dialog.set_progress(worker.current, worker.total)
 
     def _on_analyze_finished(self, frames: list):
+        self._stop_progress_polling()
         if frames:
             self.frame_list.clear_all()
             self.frame_list.add_frames(frames)
@@ -460,6 +552,7 @@ class MainWindow(QMainWindow):
             self.progress_dialog.finish(False, "Keine Frames gefunden oder abgebrochen.")
 
     def _on_analyze_error(self, error: str):
+        self._stop_progress_polling()
         self.progress_dialog.finish(False, f"Fehler: {error}")
         QMessageBox.critical(self, "Fehler", f"Analyse fehlgeschlagen: {error}")
 
@@ -482,6 +575,9 @@ class MainWindow(QMainWindow):
         if self.frame_list.get_frame_count() == 0:
             self.export_btn.setEnabled(False)
 
+    def _on_frames_cleared(self):
+        self.export_btn.setEnabled(False)
+
     def _on_lut_setting_changed(self, checked: bool):
         pass
 
@@ -511,7 +607,6 @@ class MainWindow(QMainWindow):
         self.progress_dialog = ProgressDialog("Screenshots exportieren...", self)
 
         self.export_worker = ExportWorker(self.exporter, frames, settings)
-        self.export_worker.progress.connect(self._on_export_progress)
         self.export_worker.finished.connect(self._on_export_finished)
         self.export_worker.error.connect(self._on_export_error)
 
@@ -519,13 +614,15 @@ class MainWindow(QMainWindow):
         self.progress_dialog.set_status("Exportiere Screenshots...")
 
         self.export_worker.start()
+        self._start_progress_polling(self._on_export_progress)
         self.progress_dialog.exec()
 
-    def _on_export_progress(self, current: int, total: int, filename: str):
-        self.progress_dialog.set_progress(current, total)
-        self.progress_dialog.set_detail(filename)
+    def _on_export_progress(self):
+        worker = self.export_worker
+        self.progress_dialog.set_progress(worker.current, worker.total, worker.filename)
 
     def _on_export_finished(self, files: list):
+        self._stop_progress_polling()
         if files:
             self.progress_dialog.finish(True, f"{len(files)} Screenshots exportiert!")
             self.statusBar().showMessage(f"Export abgeschlossen – {len(files)} Dateien in {self.output_folder}")
@@ -533,6 +630,7 @@ class MainWindow(QMainWindow):
             self.progress_dialog.finish(False, "Export abgebrochen.")
 
     def _on_export_error(self, error: str):
+        self._stop_progress_polling()
         self.progress_dialog.finish(False, f"Fehler: {error}")
         QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen: {error}")
 
@@ -542,46 +640,53 @@ class MainWindow(QMainWindow):
         event.accept()
 
     def _load_settings(self):
-        last_lut = self.settings.value("last_lut_path", "")
+        # Read everything up front so widget updates don't interleave with backend reads
+        values = {
+            key: self.settings.value(key, default, type=type(default))
+            for key, default in self.SETTINGS_DEFAULTS.items()
+        }
+
+        last_lut = values["last_lut_path"]
         if last_lut and Path(last_lut).exists():
             if self.lut_processor.load_cube(last_lut):
                 lut_name = self.lut_processor.get_lut_name()
                 self.lut_label.setText(f"✓ {lut_name}")
-                self.lut_label.setStyleSheet(f"color: {COLORS['accent_green']};")
+                self.lut_label.setStyleSheet(LUT_LOADED_STYLE)
                 self.apply_lut_check.setEnabled(True)
                 self.preview_lut_check.setEnabled(True)
                 self.statusBar().showMessage(f"LUT automatisch geladen: {lut_name}")
 
-        last_folder = self.settings.value("last_output_folder", "")
+        last_folder = values["last_output_folder"]
         if last_folder and Path(last_folder).exists():
             self.output_folder = last_folder
             self.output_folder_edit.setText(last_folder)
 
-        last_project_type = self.settings.value("last_project_type", "Podcast")
-        index = self.project_type_combo.findText(last_project_type)
+        index = self._project_type_index.get(values["last_project_type"], -1)
         if index >= 0:
             self.project_type_combo.setCurrentIndex(index)
 
-        last_format = self.settings.value("last_format", "PNG")
-        index = self.format_combo.findText(last_format)
+        index = self._format_index.get(values["last_format"], -1)
         if index >= 0:
             self.format_combo.setCurrentIndex(index)
 
-        last_quality = self.settings.value("last_quality", 95, type=int)
-        self.quality_slider.setValue(last_quality)
-
-        last_count = self.settings.value("last_screenshot_count", 5, type=int)
-        self.num_screenshots_spin.setValue(last_count)
+        self.quality_slider.setValue(values["last_quality"])
+        self.num_screenshots_spin.setValue(values["last_screenshot_count"])
 
     def _save_settings(self):
+        values = {
+            "last_output_folder": self.output_folder,
+            "last_project_type": self.project_type_combo.currentText(),
+            "last_format": self.format_combo.currentText(),
+            "last_quality": self.quality_slider.value(),
+            "last_screenshot_count": self.num_screenshots_spin.value(),
+        }
         if self.lut_processor.is_loaded():
-            self.settings.setValue("last_lut_path", self.lut_processor.lut_path)
+            values["last_lut_path"] = self.lut_processor.lut_path
 
-        self.settings.setValue("last_output_folder", self.output_folder)
-        self.settings.setValue("last_project_type", self.project_type_combo.currentText())
-        self.settings.setValue("last_format", self.format_combo.currentText())
-        self.settings.setValue("last_quality", self.quality_slider.value())
-        self.settings.setValue("last_screenshot_count", self.num_screenshots_spin.value())
+        for key, value in values.items():
+            self.settings.setValue(key, value)
+        # Flush to the platform backend once
+        self.settings.sync()
 
 
 def run_app():
@@ -1,6 +1,8 @@
 """
 Progress Dialog - Shows progress for long-running operations
 """
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QProgressBar, QPushButton
 )
@@ -22,6 +24,9 @@ class ProgressDialog(QDialog):
         )
 
         self._cancelled = False
+        # Last values shown, so unchanged updates don't trigger repaints
+        self._last_percentage = -1
+        self._last_detail = ""
         self._setup_ui()
 
     def _setup_ui(self):
@@ -57,14 +62,19 @@ class ProgressDialog(QDialog):
 
     def set_detail(self, text: str):
         """Set the detail text."""
+        if text == self._last_detail:
+            return
+        self._last_detail = text
         self.detail_label.setText(text)
 
-    def set_progress(self, current: int, total: int):
-        """Set progress values."""
+    def set_progress(self, current: int, total: int, detail: Optional[str] = None):
+        """Set progress values (detail replaces the default "current / total" text)."""
         if total > 0:
-            percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
-            self.detail_label.setText(f"{current} / {total}")
+            percentage = (current * 100) // total
+            if percentage != self._last_percentage:
+                self._last_percentage = percentage
+                self.progress_bar.setValue(percentage)
+            self.set_detail(f"{current} / {total}" if detail is None else detail)
 
     def set_indeterminate(self, indeterminate: bool):
         """Set indeterminate mode."""
@@ -88,6 +98,7 @@ class ProgressDialog(QDialog):
         """Finish the dialog."""
         if success:
             self.set_status("Fertig!" if message is None else message)
+            self._last_percentage = 100
             self.progress_bar.setValue(100)
         else:
             self.set_status("Fehler!" if message is None else message)
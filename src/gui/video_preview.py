@@ -7,10 +7,12 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QSlider, QPushButton, QSizePolicy, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QCoreApplication, QTimer, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 
 from ..core.video_analyzer import VideoAnalyzer
+from ..core.frame_scorer import get_scorer
+from .frame_prefetcher import FramePrefetcher
 
 
 class AspectRatioWidget(QWidget):
@@ -47,16 +49,50 @@ class AspectRatioWidget(QWidget):
 class VideoPreviewWidget(QWidget):
     """Widget for video preview with timeline scrubbing."""
 
+    # Slider moves are coalesced into at most one redraw per interval (~60 Hz)
+    REDRAW_INTERVAL_MS = 16
+    # While resizing, the last pixmap is just scaled by Qt; the frame is
+    # rendered again once no resize came for this long
+    RESIZE_SETTLE_MS = 100
+
     frame_selected = pyqtSignal(int)
     position_changed = pyqtSignal(int, float)
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.video_analyzer = VideoAnalyzer()
+        self.video_analyzer = VideoAnalyzer(get_scorer(fast_mode=True))
         self.current_frame_number = 0
         self.lut_preview_enabled = False
         self.lut_processor = None
         self.aspect_ratio = 16 / 9
+        # Reused output buffer for the LUT preview
+        self._lut_buffer = None
+        # Last decoded frame, so resizes and LUT toggles don't seek again
+        self._cached_frame_number = -1
+        self._cached_frame = None
+        # Background decoder for the frames around the current one
+        self._prefetcher = None
+        # Scaled size for the current label and frame size, and the
+        # reused resize target (see _display_size)
+        self._display_key = None
+        self._display_dims = None
+        self._display_buffer = None
+
+        self._pending_frame = None
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(self.REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._flush_pending_seek)
+
+        # Last rendered pixmap, scaled as a stand-in while resizing
+        self._last_pixmap = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(self._update_display)
+
+        # A QThread still running at exit aborts the process
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_prefetcher)
 
         self._setup_ui()
 
@@ -133,6 +169,7 @@ class VideoPreviewWidget(QWidget):
             }
         """)
         self.timeline_slider.valueChanged.connect(self._on_slider_changed)
+        self.timeline_slider.sliderReleased.connect(self._on_slider_released)
         timeline_row.addWidget(self.timeline_slider, stretch=1)
 
         self.duration_label = QLabel("00:00.00")
@@ -235,6 +272,18 @@ class VideoPreviewWidget(QWidget):
         if video_info is None:
             return False
 
+        self.show_video(video_info)
+        return True
+
+    def show_video(self, video_info):
+        """
+        Show a video already loaded into the video analyzer.
+
+        Lets the (slow) video_analyzer.load_video() run off the UI thread.
+
+        Args:
+            video_info: VideoInfo returned by video_analyzer.load_video()
+        """
         # Update aspect ratio based on video
         self.aspect_ratio = video_info.width / video_info.height
 
@@ -244,11 +293,16 @@ class VideoPreviewWidget(QWidget):
             VideoAnalyzer.format_timestamp(video_info.duration)
         )
 
+        # Shown right away, not via the slider's coalesced redraw
+        self._redraw_timer.stop()
+        self._pending_frame = None
+        self._invalidate_frame_cache()
+        self._stop_prefetcher()
+        self._prefetcher = FramePrefetcher(video_info.path, video_info.frame_count)
+        self._prefetcher.start()
         self._seek_to_frame(0)
         self._set_controls_enabled(True)
 
-        return True
-
     def set_lut_processor(self, lut_processor):
         """Set the LUT processor for preview."""
         self.lut_processor = lut_processor
@@ -275,7 +329,25 @@ class VideoPreviewWidget(QWidget):
 
     def _on_slider_changed(self, value: int):
         """Handle timeline slider changes."""
-        self._seek_to_frame(value)
+        # Frame number is current right away; decoding waits for the timer,
+        # so intermediate values while dragging are dropped
+        self.current_frame_number = value
+        self._pending_frame = value
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _flush_pending_seek(self):
+        """Show the latest slider position."""
+        if self._pending_frame is not None:
+            frame_number = self._pending_frame
+            self._pending_frame = None
+            self._seek_to_frame(frame_number)
+
+    def _on_slider_released(self):
+        """Redraw at full quality once dragging stops."""
+        self._redraw_timer.stop()
+        self._pending_frame = None
+        self._seek_to_frame(self.timeline_slider.value())
 
     def _seek_to_frame(self, frame_number: int):
         """Seek to a specific frame."""
@@ -292,24 +364,78 @@ class VideoPreviewWidget(QWidget):
 
     def _update_display(self):
         """Update the video display with current frame."""
-        frame = self.video_analyzer.get_frame_at_position(self.current_frame_number)
-        if frame is None:
+        if self._cached_frame_number == self.current_frame_number:
+            frame = self._cached_frame
+        else:
+            frame = None
+            if self._prefetcher is not None:
+                frame = self._prefetcher.get(self.current_frame_number)
+                self._prefetcher.prefetch_around(self.current_frame_number)
+            if frame is None:
+                frame = self.video_analyzer.get_frame_at_position(self.current_frame_number)
+            if frame is None:
+                return
+            self._cached_frame = frame
+            self._cached_frame_number = self.current_frame_number
+
+        h, w = frame.shape[:2]
+        dims = self._display_size(w, h)
+        if dims is None:
             return
+        new_w, new_h = dims
 
-        if self.lut_preview_enabled and self.lut_processor and self.lut_processor.is_loaded():
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            rgb = self.lut_processor.apply_to_image(rgb)
+        # INTER_AREA only pays off when shrinking, and not while dragging
+        # (the release redraws); enlarging uses bilinear either way
+        if new_w < w and not self.timeline_slider.isSliderDown():
+            interpolation = cv2.INTER_AREA
         else:
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            interpolation = cv2.INTER_LINEAR
+        # Stays BGR throughout; Qt reads BGR888 directly. The LUT runs on
+        # whichever of the source and the scaled frame is smaller
+        use_lut = (
+            self.lut_preview_enabled and self.lut_processor and self.lut_processor.is_loaded()
+        )
+        if use_lut and new_w >= w:
+            frame = self._apply_lut(frame)
+        scaled = cv2.resize(
+            frame, (new_w, new_h), dst=self._display_buffer, interpolation=interpolation
+        )
+        if use_lut and new_w < w:
+            scaled = self._apply_lut(scaled)
+
+        # Wraps scaled without a copy; fromImage makes the only copy
+        qimage = QImage(
+            scaled.data,
+            new_w, new_h,
+            scaled.strides[0],
+            QImage.Format.Format_BGR888
+        )
+        pixmap = QPixmap.fromImage(qimage)
+        self.video_label.setPixmap(pixmap)
+        self._last_pixmap = pixmap
+
+    def _display_size(self, w: int, h: int):
+        """
+        Size to show a w×h frame at in the label, keeping its aspect ratio.
+
+        Recomputed only when the label or frame size changes; the resize
+        target buffer is reallocated along with it.
 
-        # Calculate display size maintaining aspect ratio
+        Returns:
+            (new_w, new_h), or None while the label has no size
+        """
         label_w = self.video_label.width()
         label_h = self.video_label.height()
+        key = (label_w, label_h, w, h)
+        if key == self._display_key:
+            return self._display_dims
+        self._display_key = key
 
         if label_w <= 0 or label_h <= 0:
-            return
+            self._display_dims = None
+            self._display_buffer = None
+            return None
 
-        h, w = rgb.shape[:2]
         video_ratio = w / h
         label_ratio = label_w / label_h
 
@@ -326,16 +452,23 @@ class VideoPreviewWidget(QWidget):
         new_w = max(100, new_w)
         new_h = max(56, new_h)
 
-        scaled = cv2.resize(rgb, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        self._display_dims = (new_w, new_h)
+        self._display_buffer = np.empty((new_h, new_w, 3), dtype=np.uint8)
+        return self._display_dims
 
-        qimage = QImage(
-            scaled.data,
-            new_w, new_h,
-            new_w * 3,
-            QImage.Format.Format_RGB888
-        )
-        pixmap = QPixmap.fromImage(qimage)
-        self.video_label.setPixmap(pixmap)
+    def _invalidate_frame_cache(self):
+        self._cached_frame_number = -1
+        self._cached_frame = None
+
+    def _stop_prefetcher(self):
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+
+    def _apply_lut(self, image: np.ndarray) -> np.ndarray:
+        """Apply the LUT preview into the reused buffer."""
+        self._lut_buffer = self.lut_processor.apply_to_bgr_image(image, out=self._lut_buffer)
+        return self._lut_buffer
 
     def _prev_frame(self):
         """Go to previous frame."""
@@ -354,10 +487,16 @@ class VideoPreviewWidget(QWidget):
         self.frame_selected.emit(self.current_frame_number)
 
     def resizeEvent(self, event):
-        """Handle resize to update video display."""
+        """Handle resize: scale the shown pixmap now, render properly once settled."""
         super().resizeEvent(event)
         if self.video_analyzer.video_info:
-            self._update_display()
+            if self._last_pixmap is not None:
+                self.video_label.setPixmap(self._last_pixmap.scaled(
+                    self.video_label.size(),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                ))
+            self._resize_timer.start()
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts."""
@@ -372,7 +511,13 @@ class VideoPreviewWidget(QWidget):
 
     def close_video(self):
         """Close the current video."""
+        self._redraw_timer.stop()
+        self._resize_timer.stop()
+        self._pending_frame = None
+        self._invalidate_frame_cache()
+        self._stop_prefetcher()
         self.video_analyzer.close()
+        self._last_pixmap = None
         self.video_label.clear()
         self.video_label.setStyleSheet("background-color: #000000; border-radius: 8px;")
         self._set_controls_enabled(False)
@@ -1,2 +1,4 @@
 from .lut_processor import LUTProcessor
 from .image_formats import ImageFormats
+from .thumbnail_cache import ThumbnailCache
+from .uring_writer import UringWriter
@@ -1,9 +1,11 @@
 """
 Image Formats - Handles image format conversion and export
 """
+import cv2
+import numpy as np
 from PIL import Image
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class ImageFormats:
@@ -13,30 +15,58 @@ class ImageFormats:
         'JPG': {
             'extension': '.jpg',
             'pillow_format': 'JPEG',
-            'options': {'quality': 95, 'optimize': True}
+            'options': {'quality': 95, 'optimize': True},
+            'cv2_params': [cv2.IMWRITE_JPEG_QUALITY, 95, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
         },
         'PNG': {
             'extension': '.png',
             'pillow_format': 'PNG',
-            'options': {'compress_level': 6}
+            'options': {'compress_level': 6},
+            'cv2_params': [cv2.IMWRITE_PNG_COMPRESSION, 6]
         },
         'TIFF': {
             'extension': '.tiff',
             'pillow_format': 'TIFF',
-            'options': {'compression': 'lzw'}
+            'options': {'compression': 'lzw'},
+            'cv2_params': [cv2.IMWRITE_TIFF_COMPRESSION, 5]  # 5 = LZW
         },
         'WebP': {
             'extension': '.webp',
             'pillow_format': 'WEBP',
-            'options': {'quality': 95, 'method': 4}
+            'options': {'quality': 95, 'method': 4},
+            'cv2_params': [cv2.IMWRITE_WEBP_QUALITY, 95]
         },
         'BMP': {
             'extension': '.bmp',
             'pillow_format': 'BMP',
-            'options': {}
+            'options': {},
+            'cv2_params': []
         }
     }
 
+    # Quality parameter per lossy format for cv2.imencode
+    CV2_QUALITY_PARAMS = {
+        'JPG': cv2.IMWRITE_JPEG_QUALITY,
+        'WebP': cv2.IMWRITE_WEBP_QUALITY,
+    }
+
+    # Overrides for fast=True: quicker encodes for larger files (same pixels).
+    # JPEG skips the Huffman optimization pass (~3x faster at 720p), PNG uses
+    # the lowest zlib level (~2.5x faster)
+    FAST_OPTIONS = {
+        'JPG': {'optimize': False},
+        'PNG': {'compress_level': 1},
+        'WebP': {'method': 0},
+    }
+    FAST_CV2_PARAMS = {
+        'JPG': {cv2.IMWRITE_JPEG_OPTIMIZE: 0},
+        'PNG': {cv2.IMWRITE_PNG_COMPRESSION: 1},
+    }
+
+    # Formats whose files still shrink noticeably with deflate (e.g. in a ZIP):
+    # BMP is raw (~17%), LZW TIFF a little (~4%); JPG, PNG and WebP gain nothing
+    DEFLATABLE_FORMATS = frozenset({'TIFF', 'BMP'})
+
     @classmethod
     def get_format_list(cls) -> list:
         """Get list of available format names."""
@@ -47,13 +77,19 @@ class ImageFormats:
         """Get file extension for a format."""
         return cls.FORMATS.get(format_name, {}).get('extension', '.png')
 
+    @classmethod
+    def is_deflatable(cls, format_name: str) -> bool:
+        """Check if compressing encoded files of a format again is worth the CPU."""
+        return format_name in cls.DEFLATABLE_FORMATS
+
     @classmethod
     def save_image(
         cls,
         image: Image.Image,
         filepath: str,
         format_name: str,
-        quality: Optional[int] = None
+        quality: Optional[int] = None,
+        fast: bool = False
     ) -> bool:
         """
         Save an image in the specified format.
@@ -63,6 +99,7 @@ class ImageFormats:
             filepath: Output file path
             format_name: Format name (JPG, PNG, etc.)
             quality: Optional quality override for lossy formats (1-100)
+            fast: Favor encoding speed over file size (see FAST_OPTIONS)
 
         Returns:
             True if saved successfully
@@ -79,6 +116,8 @@ class ImageFormats:
 
             # Build save options
             options = format_info['options'].copy()
+            if fast:
+                options.update(cls.FAST_OPTIONS.get(format_name, {}))
 
             # Override quality if specified
             if quality is not None and format_name in ['JPG', 'WebP']:
@@ -96,6 +135,127 @@ class ImageFormats:
             print(f"Error saving image: {e}")
             return False
 
+    @classmethod
+    def get_encoding_params(
+        cls,
+        format_name: str,
+        quality: Optional[int] = None,
+        fast: bool = False
+    ) -> List[int]:
+        """
+        Get cv2.imencode parameters for a format.
+
+        Args:
+            format_name: Format name (JPG, PNG, etc.)
+            quality: Optional quality override for lossy formats (1-100)
+            fast: Favor encoding speed over file size (see FAST_CV2_PARAMS)
+
+        Returns:
+            Flat list of cv2 IMWRITE_* parameter pairs
+        """
+        params = list(cls.FORMATS.get(format_name, cls.FORMATS['PNG'])['cv2_params'])
+
+        quality_param = cls.CV2_QUALITY_PARAMS.get(format_name)
+        if quality is not None and quality_param is not None:
+            params[params.index(quality_param) + 1] = max(1, min(100, quality))
+
+        if fast:
+            for param, value in cls.FAST_CV2_PARAMS.get(format_name, {}).items():
+                params[params.index(param) + 1] = value
+
+        return params
+
+    @classmethod
+    def encode_bgr_image(
+        cls,
+        image: np.ndarray,
+        format_name: str,
+        quality: Optional[int] = None,
+        fast: bool = False
+    ) -> Optional[np.ndarray]:
+        """
+        Encode a BGR frame in memory with OpenCV, bypassing PIL.
+
+        Args:
+            image: BGR image as numpy array
+            format_name: Format name (JPG, PNG, etc.)
+            quality: Optional quality override for lossy formats (1-100)
+            fast: Favor encoding speed over file size
+
+        Returns:
+            Encoded file contents, or None on failure
+        """
+        try:
+            format_info = cls.FORMATS.get(format_name)
+            if not format_info:
+                return None
+
+            ok, buffer = cv2.imencode(
+                format_info['extension'],
+                image,
+                cls.get_encoding_params(format_name, quality, fast)
+            )
+            return buffer if ok else None
+
+        except Exception as e:
+            print(f"Error encoding image: {e}")
+            return None
+
+    @classmethod
+    def write_encoded(cls, buffer: np.ndarray, filepath: str, format_name: str) -> bool:
+        """
+        Write an encoded image to disk.
+
+        Args:
+            buffer: Encoded file contents from encode_bgr_image()
+            filepath: Output file path
+            format_name: Format name (used to fix the extension)
+
+        Returns:
+            True if written successfully
+        """
+        try:
+            # Ensure correct extension
+            path = Path(filepath)
+            extension = cls.get_extension(format_name)
+            if path.suffix.lower() != extension:
+                path = path.with_suffix(extension)
+
+            with open(path, 'wb', buffering=1 << 20) as f:
+                f.write(buffer)
+            return True
+
+        except Exception as e:
+            print(f"Error saving image: {e}")
+            return False
+
+    @classmethod
+    def save_bgr_image(
+        cls,
+        image: np.ndarray,
+        filepath: str,
+        format_name: str,
+        quality: Optional[int] = None,
+        fast: bool = False
+    ) -> bool:
+        """
+        Encode a BGR frame with OpenCV and write it, bypassing PIL.
+
+        Args:
+            image: BGR image as numpy array
+            filepath: Output file path
+            format_name: Format name (JPG, PNG, etc.)
+            quality: Optional quality override for lossy formats (1-100)
+            fast: Favor encoding speed over file size
+
+        Returns:
+            True if saved successfully
+        """
+        buffer = cls.encode_bgr_image(image, format_name, quality, fast)
+        if buffer is None:
+            return False
+        return cls.write_encoded(buffer, filepath, format_name)
+
     @classmethod
     def get_format_description(cls, format_name: str) -> str:
         """Get a description of the format."""
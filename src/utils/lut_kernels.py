@@ -0,0 +1,160 @@
+"""
+LUT Kernels - Fused 3D LUT kernel (tetrahedral or trilinear) compiled with Numba
+Requires the optional Numba package (pip install numba)
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _apply_cube_lut(
+    image: np.ndarray,
+    lut_data: np.ndarray,
+    axis_offset: np.ndarray,
+    axis_frac: np.ndarray,
+    tetrahedral: bool,
+    out: np.ndarray
+):
+    """
+    Apply a cube indexed [ch2, ch1, ch0] to a uint8 image in one pass.
+
+    Inputs are 8-bit, so each channel's cell and fraction come from tables
+    (see axis_tables) instead of a per-pixel divide, clamp and floor. The
+    blend does the same float32 steps as LUTProcessor._interpolate, so
+    results are bit-identical; the corners stay in registers instead of
+    being gathered into full-size temporary arrays.
+
+    Args:
+        image: Input image (H, W, 3) uint8
+        lut_data: Cube (N, N, N, 3) float32
+        axis_offset: Flat-index offset of the cell per channel and value,
+                     at [channel * 256 + value] (int32)
+        axis_frac: Fraction within the cell, same layout (float32)
+        tetrahedral: Blend 4 corners of one of 6 tetrahedra instead of
+                     all 8 corners of the cell
+        out: Output image (H, W, 3) uint8, written in place
+    """
+    h = image.shape[0]
+    w = image.shape[1]
+    n = lut_data.shape[0]
+    flat = lut_data.reshape(-1, 3)
+    step_r = 1
+    step_g = n
+    step_b = n * n
+    zero = np.float32(0.0)
+    top = np.float32(255.0)
+
+    for y in prange(h):
+        for x in range(w):
+            r = int(image[y, x, 0])
+            g = int(image[y, x, 1]) + 256
+            b = int(image[y, x, 2]) + 512
+            i0 = axis_offset[r] + axis_offset[g] + axis_offset[b]
+            rf = axis_frac[r]
+            gf = axis_frac[g]
+            bf = axis_frac[b]
+
+            if tetrahedral:
+                # Walk from c000 to c111 along the axes in order of
+                # decreasing fraction; ties go to R before G before B
+                if rf >= gf:
+                    if gf >= bf:
+                        fa, fb, fc, s1, s2 = rf, gf, bf, step_r, step_r + step_g
+                    elif rf >= bf:
+                        fa, fb, fc, s1, s2 = rf, bf, gf, step_r, step_r + step_b
+                    else:
+                        fa, fb, fc, s1, s2 = bf, rf, gf, step_b, step_b + step_r
+                else:
+                    if rf >= bf:
+                        fa, fb, fc, s1, s2 = gf, rf, bf, step_g, step_g + step_r
+                    elif gf >= bf:
+                        fa, fb, fc, s1, s2 = gf, bf, rf, step_g, step_g + step_b
+                    else:
+                        fa, fb, fc, s1, s2 = bf, gf, rf, step_b, step_b + step_g
+
+                s3 = step_r + step_g + step_b
+                for k in range(3):
+                    v0 = flat[i0, k]
+                    v1 = flat[i0 + s1, k]
+                    v2 = flat[i0 + s2, k]
+                    v3 = flat[i0 + s3, k]
+                    result = (v0 + (v1 - v0) * fa + (v2 - v1) * fb + (v3 - v2) * fc) * top
+                    out[y, x, k] = min(max(result, zero), top)
+                continue
+
+            for k in range(3):
+                c000 = flat[i0, k]
+                c001 = flat[i0 + step_r, k]
+                c010 = flat[i0 + step_g, k]
+                c011 = flat[i0 + step_g + step_r, k]
+                c100 = flat[i0 + step_b, k]
+                c101 = flat[i0 + step_b + step_r, k]
+                c110 = flat[i0 + step_b + step_g, k]
+                c111 = flat[i0 + step_b + step_g + step_r, k]
+
+                # Interpolate along R, then G, then B
+                c00 = c000 + (c001 - c000) * rf
+                c01 = c010 + (c011 - c010) * rf
+                c10 = c100 + (c101 - c100) * rf
+                c11 = c110 + (c111 - c110) * rf
+                c0 = c00 + (c01 - c00) * gf
+                c1 = c10 + (c11 - c10) * gf
+                result = (c0 + (c1 - c0) * bf) * top
+
+                out[y, x, k] = min(max(result, zero), top)
+
+
+def axis_tables(n: int, domain_min: np.ndarray, domain_max: np.ndarray):
+    """
+    Cell offset and fraction for every 8-bit input value of each channel.
+
+    Runs the same float32 steps as LUTProcessor._interpolate does per
+    pixel, so looking them up gives bit-identical results.
+
+    Args:
+        n: Cube size
+        domain_min: Domain minimum per input channel (float32)
+        domain_max: Domain maximum per input channel (float32)
+
+    Returns:
+        (axis_offset, axis_frac): int32 and float32 arrays of 768 entries,
+        at [channel * 256 + value]
+    """
+    # Normalize to 0-1, map the domain to 0-1 and scale to LUT indices
+    pos = np.repeat(np.arange(256, dtype=np.float32)[:, np.newaxis], 3, axis=1)
+    pos /= 255.0
+    pos -= domain_min
+    pos /= domain_max - domain_min
+    np.clip(pos, 0.0, 1.0, out=pos)
+    pos *= n - 1
+
+    # Integer cell per channel, clamped to valid range, and the fraction
+    cell = np.clip(np.floor(pos).astype(np.int32), 0, n - 2)
+    frac = np.clip(np.subtract(pos, cell, dtype=np.float32), 0.0, 1.0)
+
+    # Channel 0 varies fastest in the flattened cube
+    offset = cell * np.array([1, n, n * n], dtype=np.int32)
+    return np.ascontiguousarray(offset.T).ravel(), np.ascontiguousarray(frac.T).ravel()
+
+
+# Contiguous arrays as passed by LUTProcessor._apply
+KERNEL_SIGNATURE = (
+    'void(uint8[:, :, ::1], float32[:, :, :, ::1], int32[::1], float32[::1], boolean, '
+    'uint8[:, :, ::1])'
+)
+
+if njit is not None:
+    # Compiled eagerly at import (and cached on disk), not on the first frame.
+    # Both release the GIL, so the UI keeps drawing while a frame is graded.
+    # Numba's default threading layer aborts if the parallel kernel is
+    # entered from two threads at once; callers must serialize it and can
+    # run the serial one concurrently instead (one frame per thread)
+    apply_cube_lut = njit(KERNEL_SIGNATURE, parallel=True, nogil=True, cache=True)(_apply_cube_lut)
+    apply_cube_lut_serial = njit(KERNEL_SIGNATURE, nogil=True, cache=True)(_apply_cube_lut)
+else:
+    apply_cube_lut = None
+    apply_cube_lut_serial = None
@@ -2,16 +2,205 @@
 LUT Processor - Loads and applies .cube LUT files to images
 Correctly handles the .cube file format where R varies fastest
 """
+import re
+import threading
+import warnings
+from functools import lru_cache
+import cv2
 import numpy as np
 from PIL import Image
 from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .lut_kernels import apply_cube_lut, apply_cube_lut_serial, axis_tables
+
+# Start of the first row of numbers in a .cube file
+_FIRST_DATA_LINE = re.compile(r'^[ \t]*[-+.\d]', re.MULTILINE)
+
+# Image rows per pass of the NumPy interpolation (bounds working memory)
+INTERP_STRIP_ROWS = 32
+
+_scratch = threading.local()
+
+# Held while a thread runs the parallel Numba kernel (see lut_kernels)
+_parallel_kernel_lock = threading.Lock()
+
+
+def _strip_buffers(rows: int, width: int) -> dict:
+    """
+    Working arrays for one strip of the NumPy interpolation.
+
+    Allocated once per thread and strip shape, then reused for every strip
+    and frame. Per thread because the bake runs alongside foreground frames.
+    """
+    buffers = getattr(_scratch, 'buffers', None)
+    if buffers is None or buffers['shape'] != (rows, width):
+        shape = (rows, width, 3)
+        buffers = {
+            'shape': (rows, width),
+            'pos': np.empty(shape, dtype=np.float32),
+            'cell': np.empty(shape, dtype=np.int32),
+            'frac': np.empty(shape, dtype=np.float32),
+            'index': np.empty((rows, width), dtype=np.int32),
+            'shifted': np.empty((rows, width), dtype=np.int32),
+            'offset': np.empty((rows, width), dtype=np.int32),
+            'case': np.empty((rows, width), dtype=np.int32),
+            'flag': np.empty((rows, width), dtype=bool),
+            'weights': np.empty(shape, dtype=np.float32),
+            'corner': [np.empty(shape, dtype=np.float32) for _ in range(3)],
+            'blend': [np.empty(shape, dtype=np.float32) for _ in range(3)],
+        }
+        _scratch.buffers = buffers
+    return buffers
+
+
+def _take_corner(flat: np.ndarray, buf: dict, offset, dst: np.ndarray) -> np.ndarray:
+    """Fetch the cube entry at the strip's base index plus offset (scalar or per pixel)."""
+    np.add(buf['index'], offset, out=buf['shifted'])
+    # Cells are clamped, so indices are always in range; mode='raise' would
+    # bounds-check every index and gather into a temporary copy of dst
+    return np.take(flat, buf['shifted'], axis=0, out=dst, mode='clip')
+
+
+def _blend_trilinear(flat: np.ndarray, offsets: '_CornerOffsets', buf: dict) -> np.ndarray:
+    """Blend all 8 corners of each pixel's cell: along R, then G, then B."""
+    frac = buf['frac']
+    rf = frac[:, :, 0:1]
+    gf = frac[:, :, 1:2]
+    bf = frac[:, :, 2:3]
+    step_g, step_b = offsets.step_g, offsets.step_b
+    lo, hi = buf['corner'][:2]
+
+    def lerp_r(offset: int, acc: np.ndarray) -> np.ndarray:
+        # acc = c[offset] + (c[offset + 1] - c[offset]) * rf
+        _take_corner(flat, buf, offset, lo)
+        _take_corner(flat, buf, offset + 1, hi)
+        np.subtract(hi, lo, out=hi)
+        np.multiply(hi, rf, out=acc)
+        acc += lo
+        return acc
+
+    def lerp(a: np.ndarray, b: np.ndarray, f: np.ndarray) -> np.ndarray:
+        # b = a + (b - a) * f
+        b -= a
+        b *= f
+        b += a
+        return b
+
+    c00 = lerp_r(0, buf['blend'][0])
+    c01 = lerp_r(step_g, buf['blend'][1])
+    c0 = lerp(c00, c01, gf)
+    c10 = lerp_r(step_b, buf['blend'][0])
+    c11 = lerp_r(step_b + step_g, buf['blend'][2])
+    c1 = lerp(c10, c11, gf)
+    return lerp(c0, c1, bf)
+
+
+# Tetrahedron per pixel, indexed by (R >= G) << 2 | (G >= B) << 1 | (R >= B)
+# on the fractions: the first two axes walked from c000 towards c111.
+# Ties go to R before G before B, like the Numba kernel.
+_TETRAHEDRA = np.array([
+    [2, 1], [1, 0], [1, 2], [1, 0],
+    [2, 0], [0, 2], [0, 1], [0, 1],
+])
+
+
+class _CornerOffsets(NamedTuple):
+    """Flat-index offsets from c000 to the other corners of a cell."""
+    step_g: int
+    step_b: int
+    far: int                # c111
+    first: np.ndarray       # 2nd tetrahedron vertex, per case
+    second: np.ndarray      # 3rd tetrahedron vertex, per case
+
+
+@lru_cache(maxsize=8)
+def _corner_offsets(n: int) -> _CornerOffsets:
+    """Corner offsets for a cube of size n, computed once per size."""
+    steps = np.array([1, n, n * n], dtype=np.int32)
+    first = steps[_TETRAHEDRA[:, 0]]
+    second = first + steps[_TETRAHEDRA[:, 1]]
+    first.flags.writeable = False
+    second.flags.writeable = False
+    return _CornerOffsets(n, n * n, 1 + n + n * n, first, second)
+
+
+def _blend_tetrahedral(flat: np.ndarray, offsets: _CornerOffsets, buf: dict) -> np.ndarray:
+    """Blend the 4 corners of the tetrahedron holding each pixel."""
+    frac = buf['frac']
+    rf, gf, bf = frac[:, :, 0], frac[:, :, 1], frac[:, :, 2]
+    weights, case, flag = buf['weights'], buf['case'], buf['flag']
+
+    # Fractions sorted descending: max, median, min
+    fa, fb, fc = weights[:, :, 0], weights[:, :, 1], weights[:, :, 2]
+    np.maximum(rf, gf, out=fa)
+    np.minimum(fa, bf, out=fb)
+    np.minimum(rf, gf, out=fc)
+    np.maximum(fc, fb, out=fb)
+    np.maximum(fa, bf, out=fa)
+    np.minimum(fc, bf, out=fc)
+
+    np.greater_equal(rf, gf, out=flag)
+    case[...] = flag
+    case <<= 1
+    np.greater_equal(gf, bf, out=flag)
+    case += flag
+    case <<= 1
+    np.greater_equal(rf, bf, out=flag)
+    case += flag
+
+    # result = v0 + (v1 - v0) * fa + (v2 - v1) * fb + (v3 - v2) * fc
+    acc, term = buf['blend'][:2]
+    a, b, diff = buf['corner']
+    _take_corner(flat, buf, 0, a)
+    _take_corner(flat, buf, np.take(offsets.first, case, out=buf['offset'], mode='clip'), b)
+    np.subtract(b, a, out=diff)
+    np.multiply(diff, weights[:, :, 0:1], out=acc)
+    acc += a
+    _take_corner(flat, buf, np.take(offsets.second, case, out=buf['offset'], mode='clip'), a)
+    np.subtract(a, b, out=diff)
+    np.multiply(diff, weights[:, :, 1:2], out=term)
+    acc += term
+    _take_corner(flat, buf, offsets.far, b)
+    np.subtract(b, a, out=diff)
+    np.multiply(diff, weights[:, :, 2:3], out=term)
+    acc += term
+    return acc
+
+
+# Supported values for LUTProcessor(interp=...)
+INTERPOLATIONS = ('tetrahedral', 'trilinear')
 
 
 class LUTProcessor:
     """Handles loading and applying .cube LUT files."""
 
-    def __init__(self):
+    def __init__(self, bake: bool = True, interp: str = 'tetrahedral'):
+        """
+        Initialize the processor.
+
+        Args:
+            bake: After the first interpolated frame, bake every 8-bit input
+                  into a 256³ table (48 MB) in the background, so later frames
+                  are a single gather. Disable for one-off use or low memory.
+            interp: 'tetrahedral' (4 corners per pixel, as in DaVinci Resolve
+                    and OCIO) or 'trilinear' (all 8 corners of the cell)
+        """
+        if interp not in INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation: {interp}")
+        self.bake = bake
+        self.interp = interp
         self.lut_data = None
+        self.lut_data_bgr = None
+        # Per-channel uint8 tables for cv2.LUT if the cube is separable
+        self.lut_table = None
+        self.lut_table_bgr = None
+        # 4096x4096 RGB image of outputs for every 8-bit input, once baked
+        # (see _bake_table for the layout)
+        self.lut_baked = None
+        self._bake_source = None
+        self._bake_thread = None
+        self._bake_lock = threading.Lock()
         self.lut_size = 0
         self.lut_path = None
         self.domain_min = np.array([0.0, 0.0, 0.0])
@@ -33,18 +222,18 @@ class LUTProcessor:
                 return False
 
             with open(filepath, 'r') as f:
-                lines = f.readlines()
+                text = f.read()
+
+            # Keywords precede the rows of numbers
+            body = _FIRST_DATA_LINE.search(text)
+            header = text[:body.start()] if body else text
 
             lut_size = 0
-            data_lines = []
             domain_min = [0.0, 0.0, 0.0]
             domain_max = [1.0, 1.0, 1.0]
 
-            for line in lines:
+            for line in header.splitlines():
                 line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
                 if line.startswith('LUT_3D_SIZE'):
                     lut_size = int(line.split()[-1])
                 elif line.startswith('DOMAIN_MIN'):
@@ -55,19 +244,14 @@ class LUTProcessor:
                     parts = line.split()
                     if len(parts) >= 4:
                         domain_max = [float(parts[1]), float(parts[2]), float(parts[3])]
-                elif line.startswith('TITLE') or line.startswith('LUT_1D_SIZE'):
-                    continue
-                else:
-                    values = line.split()
-                    if len(values) >= 3:
-                        try:
-                            rgb = [float(values[0]), float(values[1]), float(values[2])]
-                            data_lines.append(rgb)
-                        except ValueError:
-                            continue
-
-            if lut_size == 0 or len(data_lines) != lut_size ** 3:
-                print(f"LUT size mismatch: expected {lut_size**3}, got {len(data_lines)}")
+
+            data = (
+                self._parse_rows(text[body.start():], lut_size ** 3) if body
+                else np.empty((0, 3))
+            )
+
+            if lut_size == 0 or len(data) != lut_size ** 3:
+                print(f"LUT size mismatch: expected {lut_size**3}, got {len(data)}")
                 return False
 
             self.lut_size = lut_size
@@ -77,22 +261,64 @@ class LUTProcessor:
             # .cube format stores data with R changing fastest, then G, then B
             # So the order is: for each B, for each G, for each R
             # We reshape to [B, G, R, 3] for natural indexing
-            self.lut_data = np.array(data_lines, dtype=np.float32).reshape(
+            self.lut_data = data.astype(np.float32).reshape(
                 (lut_size, lut_size, lut_size, 3)
             )
+            # Same cube for BGR data: indexed [R, G, B], outputting BGR
+            self.lut_data_bgr = np.ascontiguousarray(
+                self.lut_data.transpose(2, 1, 0, 3)[..., ::-1]
+            )
             self.lut_path = filepath
+            self._build_tables()
             return True
 
         except Exception as e:
             print(f"Error loading LUT: {e}")
             return False
 
-    def apply_to_image(self, image: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _parse_rows(body: str, expected_rows: int) -> np.ndarray:
+        """
+        Parse the RGB rows of a .cube file.
+
+        Args:
+            body: File contents from the first data row on
+            expected_rows: Row count announced by LUT_3D_SIZE
+
+        Returns:
+            (rows, 3) float64 array
+        """
+        # Tokenize in C; plain 3-column rows are by far the common case.
+        # Depending on the NumPy version, text it can't parse either stops
+        # the parse with a warning or raises
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                values = np.fromstring(body, dtype=np.float64, sep=' ')
+            if values.size == expected_rows * 3:
+                return values.reshape(-1, 3)
+        except ValueError:
+            pass
+
+        # Comments, keywords or extra columns between rows: go line by line
+        data_lines = []
+        for line in body.splitlines():
+            values = line.split()
+            if len(values) >= 3 and not line.lstrip().startswith('#'):
+                try:
+                    data_lines.append([float(values[0]), float(values[1]), float(values[2])])
+                except ValueError:
+                    continue
+        return np.array(data_lines, dtype=np.float64).reshape(-1, 3)
+
+    def apply_to_image(self, image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        Apply the loaded LUT to an image using trilinear interpolation.
+        Apply the loaded LUT to an image (interpolation as set by interp).
 
         Args:
             image: Input image as numpy array (RGB, 0-255)
+            out: Optional uint8 buffer shaped like image to write the result
+                 into (lets per-frame callers reuse one allocation)
 
         Returns:
             Image with LUT applied
@@ -100,79 +326,282 @@ class LUTProcessor:
         if self.lut_data is None:
             return image
 
-        # Normalize to 0-1 and apply domain scaling
-        img_float = image.astype(np.float32) / 255.0
-
-        # Map from domain_min-domain_max to 0-1
-        # Most LUTs use 0-1 domain, but some use different ranges
-        img_normalized = (img_float - self.domain_min) / (self.domain_max - self.domain_min)
-        img_normalized = np.clip(img_normalized, 0.0, 1.0)
-
-        # Scale to LUT indices
-        scale = self.lut_size - 1
-        r = img_normalized[:, :, 0] * scale
-        g = img_normalized[:, :, 1] * scale
-        b = img_normalized[:, :, 2] * scale
-
-        # Get integer indices for trilinear interpolation
-        r0 = np.floor(r).astype(int)
-        g0 = np.floor(g).astype(int)
-        b0 = np.floor(b).astype(int)
-
-        # Clamp to valid range
-        r0 = np.clip(r0, 0, self.lut_size - 2)
-        g0 = np.clip(g0, 0, self.lut_size - 2)
-        b0 = np.clip(b0, 0, self.lut_size - 2)
-
-        r1 = r0 + 1
-        g1 = g0 + 1
-        b1 = b0 + 1
-
-        # Fractional parts
-        rf = r - r0
-        gf = g - g0
-        bf = b - b0
-
-        # Ensure fractions are in [0, 1]
-        rf = np.clip(rf, 0.0, 1.0)
-        gf = np.clip(gf, 0.0, 1.0)
-        bf = np.clip(bf, 0.0, 1.0)
-
-        # LUT is stored as [B, G, R, output_RGB]
-        # Get the 8 corner values for trilinear interpolation
-        c000 = self.lut_data[b0, g0, r0]  # (b0, g0, r0)
-        c001 = self.lut_data[b0, g0, r1]  # (b0, g0, r1)
-        c010 = self.lut_data[b0, g1, r0]  # (b0, g1, r0)
-        c011 = self.lut_data[b0, g1, r1]  # (b0, g1, r1)
-        c100 = self.lut_data[b1, g0, r0]  # (b1, g0, r0)
-        c101 = self.lut_data[b1, g0, r1]  # (b1, g0, r1)
-        c110 = self.lut_data[b1, g1, r0]  # (b1, g1, r0)
-        c111 = self.lut_data[b1, g1, r1]  # (b1, g1, r1)
-
-        # Add dimension for broadcasting
-        rf = rf[:, :, np.newaxis]
-        gf = gf[:, :, np.newaxis]
-        bf = bf[:, :, np.newaxis]
-
-        # Trilinear interpolation
-        # First interpolate along R
-        c00 = c000 + (c001 - c000) * rf
-        c01 = c010 + (c011 - c010) * rf
-        c10 = c100 + (c101 - c100) * rf
-        c11 = c110 + (c111 - c110) * rf
-
-        # Then interpolate along G
-        c0 = c00 + (c01 - c00) * gf
-        c1 = c10 + (c11 - c10) * gf
-
-        # Finally interpolate along B
-        result = c0 + (c1 - c0) * bf
-
-        # Clamp and convert back to 0-255
-        result = np.clip(result * 255.0, 0, 255).astype(np.uint8)
+        if self.lut_table is not None:
+            return cv2.LUT(image, self.lut_table, dst=out)
+
+        if self.lut_baked is not None:
+            return self._gather(image, out, rgb=True)
+
+        result = self._apply(image, self.lut_data, self.domain_min, self.domain_max, out)
+        self._start_bake()
+        return result
+
+    def apply_to_bgr_image(self, image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Apply the loaded LUT directly to a BGR image (no color conversion).
+
+        Args:
+            image: Input image as numpy array (BGR, 0-255)
+            out: Optional uint8 buffer shaped like image to write the result into
+
+        Returns:
+            BGR image with LUT applied
+        """
+        if self.lut_data_bgr is None:
+            return image
+
+        if self.lut_table_bgr is not None:
+            return cv2.LUT(image, self.lut_table_bgr, dst=out)
+
+        if self.lut_baked is not None:
+            return self._gather(image, out, rgb=False)
 
+        result = self._apply(
+            image, self.lut_data_bgr, self.domain_min[::-1], self.domain_max[::-1], out
+        )
+        self._start_bake()
         return result
 
+    def _build_tables(self):
+        """
+        Build per-channel uint8 tables if each output channel only depends
+        on its own input channel (e.g. curves or gamma exported as a cube).
+        """
+        self.lut_table = None
+        self.lut_table_bgr = None
+        self.lut_baked = None
+
+        # lut_data is [B, G, R, out]: out R may only vary along axis 2,
+        # out G along axis 1 and out B along axis 0
+        lut = self.lut_data
+        separable = (
+            np.array_equal(lut[..., 0], np.broadcast_to(lut[:1, :1, :, 0], lut.shape[:3])) and
+            np.array_equal(lut[..., 1], np.broadcast_to(lut[:1, :, :1, 1], lut.shape[:3])) and
+            np.array_equal(lut[..., 2], np.broadcast_to(lut[:, :1, :1, 2], lut.shape[:3]))
+        )
+        if not separable:
+            return
+
+        # Run every input level through the regular interpolation once
+        ramp = np.repeat(np.arange(256, dtype=np.uint8)[:, np.newaxis, np.newaxis], 3, axis=2)
+        self.lut_table = self._apply(ramp, lut, self.domain_min, self.domain_max)
+        self.lut_table_bgr = np.ascontiguousarray(self.lut_table[..., ::-1])
+
+    def _apply(
+        self,
+        image: np.ndarray,
+        lut_data: np.ndarray,
+        domain_min: np.ndarray,
+        domain_max: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Interpolate a cube indexed [ch2, ch1, ch0] as set by interp.
+
+        Channel names below refer to RGB input; for BGR the cube and
+        domain are pre-permuted so the same code applies.
+        """
+        if out is None or out.shape != image.shape or not out.flags.c_contiguous:
+            out = np.empty(image.shape, dtype=np.uint8)
+
+        if apply_cube_lut is not None:
+            # Fused Numba kernel: one pass, no full-size temporaries
+            axis_offset, axis_frac = axis_tables(
+                lut_data.shape[0],
+                domain_min.astype(np.float32),
+                domain_max.astype(np.float32)
+            )
+            # One thread gets the parallel kernel; concurrent callers (e.g.
+            # export workers) each run the serial one on their own frame
+            parallel = _parallel_kernel_lock.acquire(blocking=False)
+            kernel = apply_cube_lut if parallel else apply_cube_lut_serial
+            try:
+                kernel(
+                    np.ascontiguousarray(image),
+                    lut_data,
+                    axis_offset,
+                    axis_frac,
+                    self.interp == 'tetrahedral',
+                    out
+                )
+            finally:
+                if parallel:
+                    _parallel_kernel_lock.release()
+            return out
+
+        return self._interpolate(
+            image, lut_data, domain_min, domain_max, out, self.interp == 'tetrahedral'
+        )
+
+    @staticmethod
+    def _interpolate(
+        image: np.ndarray,
+        lut_data: np.ndarray,
+        domain_min: np.ndarray,
+        domain_max: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        tetrahedral: bool = True
+    ) -> np.ndarray:
+        """
+        NumPy interpolation; same math as the Numba kernel.
+
+        Works through the image in strips of INTERP_STRIP_ROWS rows with
+        preallocated per-thread buffers, so no full-size temporaries are
+        created. The dtype of every step matches the plain expression form
+        (all float32) to keep results bit-identical.
+        """
+        height, width = image.shape[:2]
+        if out is None:
+            out = np.empty((height, width, 3), dtype=np.uint8)
+
+        n = lut_data.shape[0]
+        scale = n - 1
+        domain_range = domain_max - domain_min
+        # Most cubes map 0-1: the domain step and clip would change nothing
+        identity_domain = not np.any(domain_min) and np.all(domain_max == 1)
+        # LUT is stored as [B, G, R, output_RGB]; gather the corners
+        # from the flattened cube with precomputed strides
+        flat = lut_data.reshape(-1, 3)
+        offsets = _corner_offsets(n)
+
+        for y0 in range(0, height, INTERP_STRIP_ROWS):
+            y1 = min(y0 + INTERP_STRIP_ROWS, height)
+            buf = _strip_buffers(y1 - y0, width)
+            pos, cell, frac, index = buf['pos'], buf['cell'], buf['frac'], buf['index']
+
+            # Normalize to 0-1, map the domain to 0-1 and scale to LUT indices
+            pos[...] = image[y0:y1]
+            pos /= 255.0
+            if not identity_domain:
+                pos -= domain_min
+                pos /= domain_range
+                np.clip(pos, 0.0, 1.0, out=pos)
+            pos *= scale
+
+            # Integer cell per channel, clamped to valid range
+            np.floor(pos, out=cell, casting='unsafe')
+            np.clip(cell, 0, n - 2, out=cell)
+
+            # Fractional parts, in [0, 1]
+            np.subtract(pos, cell, out=frac, dtype=np.float32)
+            np.clip(frac, 0.0, 1.0, out=frac)
+
+            # i000 = (b0 * n + g0) * n + r0
+            np.multiply(cell[:, :, 2], n, out=index)
+            index += cell[:, :, 1]
+            index *= n
+            index += cell[:, :, 0]
+
+            if tetrahedral:
+                result = _blend_tetrahedral(flat, offsets, buf)
+            else:
+                result = _blend_trilinear(flat, offsets, buf)
+
+            # Clamp and convert back to 0-255
+            result *= 255.0
+            np.clip(result, 0, 255, out=result)
+            out[y0:y1] = result
+
+        return out
+
+    def _start_bake(self):
+        """Bake the current cube in a background thread, once per cube."""
+        if not self.bake:
+            return
+        with self._bake_lock:
+            if self._bake_source is self.lut_data:
+                return
+            self._bake_source = self.lut_data
+            self._bake_thread = threading.Thread(
+                target=self._bake_table,
+                args=(self.lut_data, self.domain_min, self.domain_max),
+                daemon=True
+            )
+            self._bake_thread.start()
+
+    def bake_now(self):
+        """
+        Bake the current cube in the calling thread (or wait for a running
+        background bake), e.g. before a batch so that every frame gets the
+        gather, which releases the GIL and parallelizes across threads.
+
+        No-op if baking is disabled, nothing is loaded, the cube is
+        separable (already a cv2.LUT table) or the table exists.
+        """
+        if not self.bake or self.lut_data is None:
+            return
+        if self.lut_table is not None or self.lut_baked is not None:
+            return
+        lut_data = self.lut_data
+        with self._bake_lock:
+            running = self._bake_source is lut_data
+            self._bake_source = lut_data
+            thread = self._bake_thread
+        if running and thread is not None:
+            thread.join()
+        else:
+            self._bake_table(lut_data, self.domain_min, self.domain_max)
+
+    def _bake_table(self, lut_data: np.ndarray, domain_min: np.ndarray, domain_max: np.ndarray):
+        """
+        Interpolate every 8-bit RGB input once, one blue level at a time to
+        bound temporary memory. Uses the NumPy path so it never runs the
+        parallel Numba kernel concurrently with a foreground frame.
+
+        The table is a 2D image so cv2.remap can do the lookup: input
+        (R, G, B) lives at row B * 16 + G // 16, column (G % 16) * 256 + R.
+        """
+        try:
+            table = np.empty((4096, 4096, 3), dtype=np.uint8)
+            levels = np.arange(256, dtype=np.uint8)
+            plane = np.empty((256, 256, 3), dtype=np.uint8)
+            plane[..., 0] = levels[np.newaxis, :]
+            plane[..., 1] = levels[:, np.newaxis]
+
+            for blue in range(256):
+                if self.lut_data is not lut_data:
+                    return  # Replaced or cleared meanwhile
+                plane[..., 2] = blue
+                # Plane rows are G, so 16 G values fill one table row
+                table[blue * 16:(blue + 1) * 16] = self._interpolate(
+                    plane, lut_data, domain_min, domain_max,
+                    tetrahedral=self.interp == 'tetrahedral'
+                ).reshape(16, 4096, 3)
+
+            if self.lut_data is lut_data:
+                self.lut_baked = table
+
+        except MemoryError:
+            print("Not enough memory to bake LUT, interpolating per frame")
+
+    def _gather(self, image: np.ndarray, out: Optional[np.ndarray], rgb: bool) -> np.ndarray:
+        """
+        Look up every pixel in the baked table (bit-identical to interpolating).
+
+        cv2.remap with nearest-neighbour sampling is OpenCV's multithreaded
+        SIMD gather; the map holds each pixel's table coordinates.
+        """
+        red, green, blue = (
+            (image[..., 0], image[..., 1], image[..., 2]) if rgb
+            else (image[..., 2], image[..., 1], image[..., 0])
+        )
+        coords = np.empty(image.shape[:2] + (2,), dtype=np.int16)
+        x = coords[..., 0]
+        y = coords[..., 1]
+        np.bitwise_and(green, 15, out=x)
+        x <<= 8
+        x |= red
+        y[...] = blue
+        y <<= 4
+        y |= green >> 4
+
+        if out is None or out.shape != image.shape or not out.flags.c_contiguous:
+            out = np.empty(image.shape, dtype=np.uint8)
+        if rgb:
+            return cv2.remap(self.lut_baked, coords, None, cv2.INTER_NEAREST, dst=out)
+        looked_up = cv2.remap(self.lut_baked, coords, None, cv2.INTER_NEAREST)
+        return cv2.cvtColor(looked_up, cv2.COLOR_RGB2BGR, dst=out)
+
     def apply_to_pil_image(self, image: Image.Image) -> Image.Image:
         """
         Apply the loaded LUT to a PIL Image.
@@ -190,11 +619,13 @@ class LUTProcessor:
         if image.mode != 'RGB':
             image = image.convert('RGB')
 
-        # Apply LUT
-        img_array = np.array(image)
-        result_array = self.apply_to_image(img_array)
+        # Read-only view of the pixels (one copy), LUT into a new buffer,
+        # and wrap that as the result without copying it again
+        result_array = self.apply_to_image(np.asarray(image))
 
-        return Image.fromarray(result_array)
+        return Image.frombuffer(
+            'RGB', image.size, np.ascontiguousarray(result_array), 'raw', 'RGB', 0, 1
+        )
 
     def is_loaded(self) -> bool:
         """Check if a LUT is currently loaded."""
@@ -209,6 +640,10 @@ class LUTProcessor:
     def clear(self):
         """Clear the loaded LUT."""
         self.lut_data = None
+        self.lut_data_bgr = None
+        self.lut_table = None
+        self.lut_table_bgr = None
+        self.lut_baked = None
         self.lut_size = 0
         self.lut_path = None
         self.domain_min = np.array([0.0, 0.0, 0.0])
@@ -0,0 +1,117 @@
+"""
+Thumbnail Cache - Persists rendered frame thumbnails across runs
+"""
+import os
+import cv2
+import numpy as np
+from pathlib import Path
+from typing import Optional
+
+
+class ThumbnailCache:
+    """On-disk cache of thumbnails keyed by (video id, frame number)."""
+
+    DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory (default: see default_cache_dir())
+            max_bytes: Size limit enforced by prune()
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else self.default_cache_dir()
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def default_cache_dir() -> Path:
+        """$XDG_CACHE_HOME (or ~/.cache)/podcast-screenshot-tool/thumbs"""
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(base) / 'podcast-screenshot-tool' / 'thumbs'
+
+    def _path(self, video_id: str, frame_number: int) -> Path:
+        return self.cache_dir / video_id / f"{frame_number}.png"
+
+    def load(self, video_id: str, frame_number: int) -> Optional[np.ndarray]:
+        """
+        Load a cached thumbnail.
+
+        Args:
+            video_id: Video identifier (VideoAnalyzer.video_id)
+            frame_number: Frame number
+
+        Returns:
+            BGR thumbnail, or None if not cached
+        """
+        path = self._path(video_id, frame_number)
+        if not path.exists():
+            return None
+
+        image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if image is not None:
+            # Mark as recently used for prune()
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return image
+
+    def save(self, video_id: str, frame_number: int, image: np.ndarray) -> bool:
+        """
+        Store a thumbnail.
+
+        Args:
+            video_id: Video identifier (VideoAnalyzer.video_id)
+            frame_number: Frame number
+            image: BGR thumbnail
+
+        Returns:
+            True if stored successfully
+        """
+        path = self._path(video_id, frame_number)
+        try:
+            ok, buffer = cv2.imencode('.png', image)
+            if not ok:
+                return False
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so readers never see a partial file
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(buffer)
+            os.replace(tmp_path, path)
+            return True
+
+        except OSError as e:
+            print(f"Error caching thumbnail: {e}")
+            return False
+
+    def prune(self):
+        """Delete least recently used thumbnails until under max_bytes."""
+        if not self.cache_dir.exists():
+            return
+
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*/*.png'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+        # Drop directories of videos with no thumbnails left
+        for directory in self.cache_dir.iterdir():
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
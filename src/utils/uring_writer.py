@@ -0,0 +1,130 @@
+"""
+io_uring Writer - Writes many files with one batched submission on Linux
+Requires the optional liburing package (pip install liburing)
+"""
+import os
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+HAVE_LIBURING = liburing is not None and sys.platform == 'linux'
+
+# Files written per submission
+QUEUE_DEPTH = 32
+
+
+class UringWriter:
+    """Writes batches of encoded files through a single io_uring."""
+
+    def __init__(self, queue_depth: int = QUEUE_DEPTH):
+        """
+        Set up the ring.
+
+        Args:
+            queue_depth: Submission queue size (files per submission)
+
+        Raises:
+            OSError: If the kernel refuses io_uring (e.g. blocked by seccomp)
+        """
+        self.queue_depth = queue_depth
+        self._ring = liburing.Ring()
+        liburing.io_uring_queue_init(queue_depth, self._ring)
+
+    @classmethod
+    def create(cls, queue_depth: int = QUEUE_DEPTH) -> Optional['UringWriter']:
+        """
+        Set up a writer if io_uring is usable here.
+
+        Returns:
+            UringWriter, or None (callers fall back to plain writes)
+        """
+        if not HAVE_LIBURING:
+            return None
+        try:
+            return cls(queue_depth)
+        except OSError as e:
+            print(f"io_uring unavailable, using regular writes: {e}")
+            return None
+
+    def write_files(self, items: Sequence[Tuple[Optional[str], Optional[np.ndarray]]]) -> List[bool]:
+        """
+        Write encoded buffers to their files.
+
+        Args:
+            items: (filepath, buffer) pairs; pairs with a None entry are skipped
+
+        Returns:
+            Per item, True if written successfully
+        """
+        results = [False] * len(items)
+        for start in range(0, len(items), self.queue_depth):
+            chunk = range(start, min(start + self.queue_depth, len(items)))
+            self._write_chunk(items, chunk, results)
+        return results
+
+    def _write_chunk(self, items, indices, results: List[bool]):
+        opened = []
+        try:
+            for i in indices:
+                filepath, buffer = items[i]
+                if filepath is None or buffer is None:
+                    continue
+                try:
+                    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+                except OSError as e:
+                    print(f"Error saving image: {e}")
+                    continue
+                # liburing only accepts bytes-like objects it can pin
+                opened.append((i, fd, buffer.tobytes()))
+
+            if not opened:
+                return
+
+            for _, fd, data in opened:
+                sqe = liburing.io_uring_get_sqe(self._ring)
+                liburing.io_uring_prep_write(sqe, fd, data, 0)
+
+            # One syscall submits every write and waits for all of them
+            liburing.io_uring_submit_and_wait(self._ring, len(opened))
+            liburing.io_uring_cq_advance(self._ring, len(opened))
+
+            for i, fd, data in opened:
+                results[i] = self._verify(fd, data)
+        finally:
+            for _, fd, _ in opened:
+                os.close(fd)
+
+    @staticmethod
+    def _verify(fd: int, data: bytes) -> bool:
+        """Check a completed write by file size, redoing it if it fell short."""
+        try:
+            if os.fstat(fd).st_size == len(data):
+                return True
+            # Short or failed write: retry blocking to finish it (or get the error)
+            written = 0
+            view = memoryview(data)
+            while written < len(data):
+                written += os.pwrite(fd, view[written:], written)
+            return True
+        except OSError as e:
+            print(f"Error saving image: {e}")
+            return False
+
+    def close(self):
+        """Tear down the ring."""
+        if self._ring is not None:
+            liburing.io_uring_queue_exit(self._ring)
+            self._ring = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -2,12 +2,21 @@
 Web App for Screenshot Tool
 Flask backend with chunked upload support for large video files
 """
+import io
 import os
+import errno
 import uuid
 import json
+import zipfile
+import shutil
+import itertools
 import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file, render_template, send_from_directory
+import cv2
+from flask import Flask, Response, request, jsonify, render_template, send_from_directory
 from werkzeug.utils import secure_filename
 
 import sys
@@ -15,6 +24,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.video_analyzer import VideoAnalyzer
 from src.core.project_types import ProjectTypes
+from src.core.screenshot_exporter import BAKE_MIN_FRAMES
 from src.utils.lut_processor import LUTProcessor
 from src.utils.image_formats import ImageFormats
 
@@ -22,11 +32,91 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024 * 1024  # 10GB max
 app.config['UPLOAD_FOLDER'] = Path(__file__).parent / 'uploads'
 app.config['UPLOAD_FOLDER'].mkdir(exist_ok=True)
+# Memory for decoded frames kept across requests (scrubbing back and forth);
+# a 4K frame takes 25 MB, so tune it to the machine with FRAME_CACHE_MB
+app.config['FRAME_CACHE_BYTES'] = int(os.environ.get('FRAME_CACHE_MB', 512)) * 1024 * 1024
+
+# Upload chunk size bounds; large files get bigger chunks (see upload_chunk_size)
+MIN_UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024  # 5MB
+MAX_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024  # 64MB
+# Number of chunks aimed for between the bounds
+UPLOAD_TARGET_CHUNKS = 256
+# Buffer size for copying uploaded chunks
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Jobs untouched for this long are removed with their files (seconds)
+JOB_TTL = 24 * 60 * 60
+
+# Videos kept open across requests, so previews don't reinitialise the decoder
+MAX_OPEN_VIDEOS = 8
+# Preview frames are scaled down to this width
+PREVIEW_WIDTH = 800
+# Baseline JPEG without the Huffman optimization pass
+PREVIEW_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+# Memory for encoded preview JPEGs (~150 KB each)
+PREVIEW_CACHE_BYTES = 64 * 1024 * 1024
+# Browsers may reuse a preview this long without asking again
+PREVIEW_MAX_AGE = 3600
 
 # Store job status
 jobs = {}
 jobs_lock = threading.Lock()
 
+# job_id -> (VideoAnalyzer, lock for reading through it), least recently used first
+analyzers = OrderedDict()
+analyzers_lock = threading.Lock()
+
+
+class ByteLRU(OrderedDict):
+    """
+    LRU mapping bounded by the total size of its values in bytes, not by
+    their count (frame sizes range from KB to 25 MB at 4K).
+
+    Values are bytes-like (bytes, numpy arrays). Use the methods below,
+    which take the cache's own lock; plain item access doesn't.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Total bytes kept before the least recently used
+                values are evicted
+        """
+        super().__init__()
+        self.capacity = capacity
+        self.nbytes = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        """Get a value and mark it as recently used, or None."""
+        with self._lock:
+            value = OrderedDict.get(self, key)
+            if value is not None:
+                self.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Insert a value (keeping an existing one), evicting as needed."""
+        with self._lock:
+            if key in self:
+                return
+            self[key] = value
+            self.nbytes += memoryview(value).nbytes
+            while self.nbytes > self.capacity:
+                self.nbytes -= memoryview(self.popitem(last=False)[1]).nbytes
+
+    def discard_where(self, predicate):
+        """Remove every entry whose key matches predicate."""
+        with self._lock:
+            for key in [key for key in self if predicate(key)]:
+                self.nbytes -= memoryview(self.pop(key)).nbytes
+
+
+# (job_id, frame_number) -> read-only BGR frame
+frame_cache = ByteLRU(app.config['FRAME_CACHE_BYTES'])
+# (job_id, frame_number) -> preview JPEG bytes
+preview_cache = ByteLRU(PREVIEW_CACHE_BYTES)
+
 
 class AnalysisJob:
     def __init__(self, job_id, video_path):
@@ -40,6 +130,227 @@ class AnalysisJob:
         self.video_info = None
 
 
+def _write_at(fd, stream, offset):
+    """
+    Write a stream into a file at a fixed position.
+
+    Args:
+        fd: Descriptor of the target file
+        stream: Readable binary stream
+        offset: Byte position of the first byte
+
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    while True:
+        block = stream.read(COPY_BUFFER_SIZE)
+        if not block:
+            return written
+        view = memoryview(block)
+        while view:
+            n = os.pwrite(fd, view, offset + written)
+            written += n
+            view = view[n:]
+
+
+def upload_chunk_size(file_size):
+    """
+    Chunk size for an upload: about UPLOAD_TARGET_CHUNKS requests per file,
+    in whole MB, so a 10GB upload needs 256 requests instead of 2048.
+
+    Args:
+        file_size: Announced file size in bytes
+
+    Returns:
+        Chunk size in bytes; chunk i starts at byte i * chunk size
+    """
+    if not isinstance(file_size, int) or file_size <= 0:
+        return MIN_UPLOAD_CHUNK_SIZE
+    size = -(-file_size // UPLOAD_TARGET_CHUNKS)
+    size = -(-size // COPY_BUFFER_SIZE) * COPY_BUFFER_SIZE
+    return max(MIN_UPLOAD_CHUNK_SIZE, min(size, MAX_UPLOAD_CHUNK_SIZE))
+
+
+def get_job(job_id):
+    """
+    Look up a job and mark it as used, which keeps it from expiring.
+
+    Returns:
+        Job dict or None
+    """
+    job = jobs.get(job_id)
+    if job is not None:
+        job['last_access'] = time.monotonic()
+    return job
+
+
+def remove_job(job_id, job):
+    """Close a job's video, drop its caches and delete its uploads."""
+    release_job_video(job_id)
+
+    # Delete all files
+    shutil.rmtree(job['upload_path'], ignore_errors=True)
+
+    with jobs_lock:
+        jobs.pop(job_id, None)
+
+
+def purge_expired_jobs():
+    """Remove jobs that haven't been used for JOB_TTL (abandoned uploads and sessions)."""
+    deadline = time.monotonic() - JOB_TTL
+    with jobs_lock:
+        expired = [
+            (job_id, job) for job_id, job in jobs.items()
+            if job['last_access'] < deadline and job['status'] != 'analyzing'
+        ]
+    for job_id, job in expired:
+        remove_job(job_id, job)
+
+
+def get_analyzer(job_id):
+    """
+    Get the open analyzer of a job's video, loading it on first use.
+
+    Returns:
+        (VideoAnalyzer, lock to hold while reading frames), or
+        (None, None) if the video isn't uploaded or can't be loaded
+    """
+    with analyzers_lock:
+        entry = analyzers.get(job_id)
+        if entry is not None:
+            analyzers.move_to_end(job_id)
+            return entry
+
+    job = jobs.get(job_id)
+    if job is None or job['status'] == 'uploading':
+        return None, None
+    analyzer = VideoAnalyzer()
+    if analyzer.load_video(job['video_path']) is None:
+        return None, None
+
+    with analyzers_lock:
+        entry = analyzers.setdefault(job_id, (analyzer, threading.Lock()))
+        evicted = []
+        while len(analyzers) > MAX_OPEN_VIDEOS:
+            evicted.append(analyzers.popitem(last=False)[1])
+    if entry[0] is not analyzer:
+        # Another request loaded it meanwhile
+        analyzer.close()
+    for old_analyzer, old_lock in evicted:
+        with old_lock:
+            old_analyzer.close()
+    return entry
+
+
+def get_video_frame(job_id, frame_number, analyzer=None):
+    """
+    Get a frame of a job's video, from the frame cache if possible.
+
+    Args:
+        job_id: Job whose video to read
+        frame_number: Frame number
+        analyzer: Analyzer to decode with on a cache miss, e.g. one serving a
+            worker pool through its per-thread captures (default: the job's
+            shared analyzer)
+
+    Returns:
+        BGR frame (read-only, shared with the cache) or None
+    """
+    key = (job_id, frame_number)
+    frame = frame_cache.lookup(key)
+    if frame is not None:
+        return frame
+
+    if analyzer is not None:
+        frame = analyzer.get_frame_at_position(frame_number)
+    else:
+        analyzer, lock = get_analyzer(job_id)
+        if analyzer is None:
+            return None
+        with lock:
+            # Request threads come and go: borrow the analyzer's capture
+            # and hand it back, so no thread keeps a decoder of its own
+            try:
+                frame = analyzer.get_frame_at_position(frame_number)
+            finally:
+                analyzer.release_thread_capture()
+    if frame is None:
+        return None
+
+    frame.flags.writeable = False
+    frame_cache.put(key, frame)
+    return frame
+
+
+def get_preview_jpeg(job_id, frame_number):
+    """
+    Get the preview JPEG of a frame (max PREVIEW_WIDTH wide), encoding it on first use.
+
+    Returns:
+        JPEG bytes or None
+    """
+    key = (job_id, frame_number)
+    data = preview_cache.lookup(key)
+    if data is not None:
+        return data
+
+    frame = get_video_frame(job_id, frame_number)
+    if frame is None:
+        return None
+
+    # Resize for preview (max PREVIEW_WIDTH), area averaging for downscaling
+    h, w = frame.shape[:2]
+    if w > PREVIEW_WIDTH:
+        frame = cv2.resize(
+            frame, (PREVIEW_WIDTH, h * PREVIEW_WIDTH // w), interpolation=cv2.INTER_AREA
+        )
+
+    _, buffer = cv2.imencode('.jpg', frame, PREVIEW_JPEG_PARAMS)
+    data = buffer.tobytes()
+
+    preview_cache.put(key, data)
+    return data
+
+
+def release_job_video(job_id):
+    """Close a job's analyzer and drop its cached frames and previews."""
+    with analyzers_lock:
+        entry = analyzers.pop(job_id, None)
+    frame_cache.discard_where(lambda key: key[0] == job_id)
+    preview_cache.discard_where(lambda key: key[0] == job_id)
+    if entry is not None:
+        analyzer, lock = entry
+        with lock:
+            analyzer.close()
+
+
+class ZipStream(io.RawIOBase):
+    """
+    Write-only, unseekable sink for zipfile.ZipFile.
+
+    zipfile then writes sizes after each entry's data, so the archive can
+    be sent while it is produced; drain() hands out what was written so far.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        """Return and forget everything written since the last drain."""
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -70,9 +381,39 @@ def init_upload():
     filename = secure_filename(data.get('filename', 'video.mp4'))
     file_size = data.get('size', 0)
 
+    if not isinstance(file_size, int) or file_size <= 0:
+        return jsonify({'error': 'Invalid file size'}), 400
+    if file_size > app.config['MAX_CONTENT_LENGTH']:
+        return jsonify({'error': 'File too large'}), 413
+
+    # The jobs dict would otherwise grow for the lifetime of the server
+    purge_expired_jobs()
+
     job_id = str(uuid.uuid4())
     upload_path = app.config['UPLOAD_FOLDER'] / job_id
     upload_path.mkdir(exist_ok=True)
+    video_path = upload_path / filename
+
+    chunk_size = upload_chunk_size(file_size)
+    # Counted here, never taken from the client: it sizes the chunk bitmap
+    total_chunks = -(-file_size // chunk_size)
+
+    # Chunks are written straight to their place in the video file; each
+    # chunk request opens it, so abandoned uploads hold no descriptors
+    video_fd = os.open(video_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    # Reserve the whole file up front: chunks arriving in any order land in
+    # contiguous blocks, and a full disk fails here instead of mid-upload
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(video_fd, 0, file_size)
+    except OSError as e:
+        if e.errno == errno.ENOSPC:
+            shutil.rmtree(upload_path, ignore_errors=True)
+            return jsonify({'error': 'Not enough disk space'}), 507
+        # Filesystem without preallocation: the file grows as chunks arrive
+    finally:
+        os.close(video_fd)
 
     with jobs_lock:
         jobs[job_id] = {
@@ -80,57 +421,95 @@ def init_upload():
             'filename': filename,
             'file_size': file_size,
             'uploaded_size': 0,
-            'chunks_received': set(),
+            # Bit i of the bitmap is set once chunk i is written
+            'chunks_bitmap': bytearray((total_chunks + 7) // 8),
+            'chunks_received': 0,
+            'total_chunks': total_chunks,
             'upload_path': str(upload_path),
-            'video_path': str(upload_path / filename)
+            'video_path': str(video_path),
+            'chunk_size': chunk_size,
+            # Guards this job's fields; jobs_lock only guards the jobs dict
+            'lock': threading.Lock(),
+            'last_access': time.monotonic()
         }
 
     return jsonify({
         'job_id': job_id,
-        'chunk_size': 5 * 1024 * 1024  # 5MB chunks
+        'chunk_size': chunk_size
     })
 
 
 @app.route('/api/upload/chunk/<job_id>', methods=['POST'])
 def upload_chunk(job_id):
-    """Upload a chunk of the video file."""
-    if job_id not in jobs:
+    """
+    Upload a chunk of the video file.
+
+    The request body is the chunk as application/octet-stream, with
+    chunk_index and total_chunks as query parameters.
+    """
+    job = get_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
-    chunk_index = int(request.form.get('chunk_index', 0))
-    total_chunks = int(request.form.get('total_chunks', 1))
+    # The body is the raw chunk; no multipart parsing or temp file spooling
+    chunk_index = int(request.args.get('chunk_index', 0))
+    total_chunks = int(request.args.get('total_chunks', 1))
 
-    if 'chunk' not in request.files:
+    if not request.content_length:
         return jsonify({'error': 'No chunk provided'}), 400
 
-    chunk = request.files['chunk']
-    chunk_path = Path(job['upload_path']) / f'chunk_{chunk_index:06d}'
-    chunk.save(str(chunk_path))
+    if total_chunks != job['total_chunks']:
+        return jsonify({'error': 'Chunk count does not match the file size'}), 400
 
-    with jobs_lock:
-        job['chunks_received'].add(chunk_index)
-        job['uploaded_size'] += os.path.getsize(str(chunk_path))
-
-    # Check if all chunks received
-    if len(job['chunks_received']) == total_chunks:
-        # Combine chunks
-        video_path = Path(job['video_path'])
-        with open(video_path, 'wb') as outfile:
-            for i in range(total_chunks):
-                chunk_path = Path(job['upload_path']) / f'chunk_{i:06d}'
-                with open(chunk_path, 'rb') as infile:
-                    outfile.write(infile.read())
-                chunk_path.unlink()  # Delete chunk
-
-        job['status'] = 'uploaded'
+    if not 0 <= chunk_index < total_chunks:
+        return jsonify({'error': 'Invalid chunk index'}), 400
+
+    # A chunk never exceeds the negotiated size (instead of the 10GB app limit);
+    # request.stream is limited to content_length
+    if request.content_length > job['chunk_size']:
+        return jsonify({'error': 'Chunk too large'}), 413
+    offset = chunk_index * job['chunk_size']
+    if offset + request.content_length > job['file_size']:
+        return jsonify({'error': 'Chunk exceeds the file size'}), 400
+
+    if job['status'] != 'uploading':
+        return jsonify({'error': 'Upload already complete'}), 400
+
+    try:
+        video_fd = os.open(job['video_path'], os.O_WRONLY)
+    except FileNotFoundError:
+        # Cleaned up meanwhile
+        return jsonify({'error': 'Job not found'}), 404
+    try:
+        # The last chunk may be short, the stream length is what counts
+        size = _write_at(video_fd, request.stream, offset)
+    finally:
+        os.close(video_fd)
+
+    with job['lock']:
+        bitmap = job['chunks_bitmap']
+        mask = 1 << (chunk_index & 7)
+        if not bitmap[chunk_index >> 3] & mask:
+            bitmap[chunk_index >> 3] |= mask
+            job['chunks_received'] += 1
+            job['uploaded_size'] += size
+        received = job['chunks_received']
+
+        # Check if all chunks received
+        complete = received == job['total_chunks'] and job['status'] == 'uploading'
+        if complete:
+            # Drop any reserved space beyond the data if the announced size was off
+            os.truncate(job['video_path'], job['uploaded_size'])
+            job['status'] = 'uploaded'
+
+    if complete:
         return jsonify({'status': 'complete', 'job_id': job_id})
 
-    progress = len(job['chunks_received']) / total_chunks * 100
+    progress = received / total_chunks * 100
     return jsonify({
         'status': 'uploading',
         'progress': progress,
-        'chunks_received': len(job['chunks_received']),
+        'chunks_received': received,
         'total_chunks': total_chunks
     })
 
@@ -138,10 +517,10 @@ def upload_chunk(job_id):
 @app.route('/api/upload/status/<job_id>')
 def upload_status(job_id):
     """Get upload status."""
-    if job_id not in jobs:
+    job = get_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
     return jsonify({
         'status': job['status'],
         'uploaded_size': job.get('uploaded_size', 0),
@@ -153,71 +532,62 @@ def upload_status(job_id):
 @app.route('/api/video/info/<job_id>')
 def video_info(job_id):
     """Get video information."""
-    if job_id not in jobs:
+    job = get_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
     if job['status'] != 'uploaded' and job['status'] != 'analyzed':
         return jsonify({'error': 'Video not ready'}), 400
 
-    analyzer = VideoAnalyzer()
-    info = analyzer.load_video(job['video_path'])
-    analyzer.close()
+    # The uploaded video never changes, so the metadata is read once
+    cached = job.get('video_info')
+    if cached is not None:
+        return jsonify(cached)
+
+    analyzer, _ = get_analyzer(job_id)
+    info = analyzer.video_info if analyzer is not None else None
 
     if info is None:
         return jsonify({'error': 'Could not load video'}), 400
 
-    return jsonify({
+    job['video_info'] = {
         'width': info.width,
         'height': info.height,
         'fps': info.fps,
         'duration': info.duration,
         'frame_count': info.frame_count,
         'duration_formatted': VideoAnalyzer.format_timestamp(info.duration)
-    })
+    }
+    return jsonify(job['video_info'])
 
 
 @app.route('/api/video/frame/<job_id>/<int:frame_number>')
 def get_frame(job_id, frame_number):
     """Get a specific frame as JPEG."""
-    if job_id not in jobs:
+    if get_job(job_id) is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
+    data = get_preview_jpeg(job_id, frame_number)
 
-    analyzer = VideoAnalyzer()
-    analyzer.load_video(job['video_path'])
-
-    frame = analyzer.get_frame_at_position(frame_number)
-    analyzer.close()
-
-    if frame is None:
+    if data is None:
         return jsonify({'error': 'Could not get frame'}), 400
 
-    import cv2
-    import io
-
-    # Resize for preview (max 800px width)
-    h, w = frame.shape[:2]
-    if w > 800:
-        scale = 800 / w
-        frame = cv2.resize(frame, (800, int(h * scale)))
-
-    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-
-    return send_file(
-        io.BytesIO(buffer.tobytes()),
-        mimetype='image/jpeg'
-    )
+    # A job's video never changes, so the frame number identifies the image;
+    # revalidations are answered with 304
+    # The cached bytes are the body as is, no file wrapper copying them in blocks
+    response = Response(data, mimetype='image/jpeg')
+    response.set_etag(f'{job_id}:{frame_number}:v2')
+    response.headers['Cache-Control'] = f'private, max-age={PREVIEW_MAX_AGE}'
+    return response.make_conditional(request)
 
 
 @app.route('/api/analyze/<job_id>', methods=['POST'])
 def analyze_video(job_id):
     """Start video analysis."""
-    if job_id not in jobs:
+    job = get_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
     data = request.json or {}
 
     num_frames = data.get('num_frames', 5)
@@ -226,7 +596,7 @@ def analyze_video(job_id):
     # Start analysis in background thread
     def run_analysis():
         try:
-            with jobs_lock:
+            with job['lock']:
                 job['status'] = 'analyzing'
                 job['progress'] = 0
                 job['total'] = 100
@@ -235,20 +605,16 @@ def analyze_video(job_id):
             info = analyzer.load_video(job['video_path'])
 
             if info is None:
-                with jobs_lock:
+                with job['lock']:
                     job['status'] = 'error'
                     job['error'] = 'Could not load video'
                 return
 
             settings = ProjectTypes.get_settings(project_type)
-            analyzer.frame_scorer.set_weights(
-                settings.face_weight,
-                settings.sharpness_weight,
-                settings.stability_weight
-            )
+            analyzer.frame_scorer.set_weights(*settings.weights)
 
             def progress_callback(current, total):
-                with jobs_lock:
+                with job['lock']:
                     job['progress'] = current
                     job['total'] = total
 
@@ -266,14 +632,14 @@ def analyze_video(job_id):
                     'score': f.score
                 })
 
-            with jobs_lock:
+            with job['lock']:
                 job['status'] = 'analyzed'
                 job['frames'] = frame_data
 
             analyzer.close()
 
         except Exception as e:
-            with jobs_lock:
+            with job['lock']:
                 job['status'] = 'error'
                 job['error'] = str(e)
 
@@ -286,10 +652,10 @@ def analyze_video(job_id):
 @app.route('/api/analyze/status/<job_id>')
 def analysis_status(job_id):
     """Get analysis status."""
-    if job_id not in jobs:
+    job = get_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
     return jsonify({
         'status': job['status'],
         'progress': job.get('progress', 0),
@@ -302,10 +668,10 @@ def analysis_status(job_id):
 @app.route('/api/export/<job_id>', methods=['POST'])
 def export_frames(job_id):
     """Export selected frames."""
-    if job_id not in jobs:
+    job = get_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
     data = request.json or {}
 
     frame_numbers = data.get('frames', [])
@@ -314,72 +680,96 @@ def export_frames(job_id):
     apply_lut = data.get('apply_lut', False)
     lut_data = data.get('lut_data')  # Base64 encoded LUT file
 
-    import cv2
-    import io
-    import zipfile
     import base64
 
-    analyzer = VideoAnalyzer()
-    analyzer.load_video(job['video_path'])
-
     lut_processor = None
     if apply_lut and lut_data:
         # Save LUT temporarily
         lut_path = Path(job['upload_path']) / 'temp.cube'
         with open(lut_path, 'wb') as f:
             f.write(base64.b64decode(lut_data))
-        lut_processor = LUTProcessor()
-        lut_processor.load_cube(str(lut_path))
-
-    # Create ZIP with all frames
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for i, frame_num in enumerate(frame_numbers):
-            frame = analyzer.get_frame_at_position(frame_num)
-            if frame is None:
-                continue
-
-            # Apply LUT if enabled
-            if lut_processor and lut_processor.is_loaded():
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = lut_processor.apply_to_image(frame)
-                frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-
-            # Encode frame
-            ext = ImageFormats.get_extension(format_name)
-            params = ImageFormats.get_encoding_params(format_name, quality)
-            _, buffer = cv2.imencode(ext, frame, params)
-
-            filename = f'frame_{i+1:03d}_{frame_num}{ext}'
-            zf.writestr(filename, buffer.tobytes())
-
-    analyzer.close()
-    zip_buffer.seek(0)
-
-    return send_file(
-        zip_buffer,
+        # A handful of frames are interpolated directly; for bulk exports the
+        # baked table pays off and its gather parallelizes across the workers
+        bulk = len(frame_numbers) >= BAKE_MIN_FRAMES
+        lut_processor = LUTProcessor(bake=bulk)
+        if lut_processor.load_cube(str(lut_path)) and bulk:
+            lut_processor.bake_now()
+
+    # Frames are decoded, graded and encoded in parallel (OpenCV releases the
+    # GIL); this analyzer gives every worker thread its own capture
+    analyzer = VideoAnalyzer()
+    if analyzer.load_video(job['video_path']) is None:
+        return jsonify({'error': 'Could not load video'}), 400
+    num_workers = max(1, min(os.cpu_count() or 1, len(frame_numbers)))
+    ext = ImageFormats.get_extension(format_name)
+    params = ImageFormats.get_encoding_params(format_name, quality)
+
+    def render(i, frame_num):
+        frame = get_video_frame(job_id, frame_num, analyzer)
+        if frame is None:
+            return None, None
+
+        # Apply LUT if enabled
+        if lut_processor and lut_processor.is_loaded():
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame = lut_processor.apply_to_image(frame)
+            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+
+        # Encode frame
+        _, buffer = cv2.imencode(ext, frame, params)
+        return f'frame_{i+1:03d}_{frame_num}{ext}', buffer
+
+    # Already compressed images are stored as is; deflating them costs more
+    # CPU than the encode for no size gain
+    compression = (
+        zipfile.ZIP_DEFLATED if ImageFormats.is_deflatable(format_name) else zipfile.ZIP_STORED
+    )
+
+    def generate():
+        # Stream the ZIP frame by frame instead of building it in memory
+        sink = ZipStream()
+        executor = ThreadPoolExecutor(max_workers=num_workers)
+        pending = deque()
+        try:
+            with zipfile.ZipFile(sink, 'w', compression, compresslevel=1) as zf:
+                tasks = iter(enumerate(frame_numbers))
+                # Keep a couple of frames per worker in flight, so encoded frames
+                # don't pile up in memory when the client downloads slowly
+                for i, frame_num in itertools.islice(tasks, 2 * num_workers):
+                    pending.append(executor.submit(render, i, frame_num))
+                while pending:
+                    filename, buffer = pending.popleft().result()
+                    for i, frame_num in itertools.islice(tasks, 1):
+                        pending.append(executor.submit(render, i, frame_num))
+                    if buffer is None:
+                        continue
+
+                    # The encoder's buffer as is, without a bytes copy
+                    zf.writestr(filename, memoryview(buffer).cast('B'))
+                    yield sink.drain()
+            # Central directory
+            yield sink.drain()
+        finally:
+            executor.shutdown(cancel_futures=True)
+            analyzer.close()
+
+    return Response(
+        generate(),
         mimetype='application/zip',
-        as_attachment=True,
-        download_name=f'screenshots_{job_id[:8]}.zip'
+        headers={
+            'Content-Disposition': f'attachment; filename=screenshots_{job_id[:8]}.zip'
+        }
     )
 
 
 @app.route('/api/cleanup/<job_id>', methods=['DELETE'])
 def cleanup_job(job_id):
     """Clean up job files."""
-    if job_id not in jobs:
+    job = get_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
-    upload_path = Path(job['upload_path'])
-
-    # Delete all files
-    import shutil
-    if upload_path.exists():
-        shutil.rmtree(upload_path)
-
-    with jobs_lock:
-        del jobs[job_id]
+    remove_job(job_id, job)
 
     return jsonify({'status': 'cleaned'})
 
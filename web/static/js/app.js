@@ -133,6 +133,12 @@ class ScreenshotTool {
             })
         });
         const initData = await initRes.json();
+
+        if (initData.error) {
+            this.setStatus('Fehler: ' + initData.error);
+            return;
+        }
+
         this.jobId = initData.job_id;
         this.chunkSize = initData.chunk_size;
 
@@ -149,14 +155,11 @@ class ScreenshotTool {
             const end = Math.min(start + this.chunkSize, file.size);
             const chunk = file.slice(start, end);
 
-            const formData = new FormData();
-            formData.append('chunk', chunk);
-            formData.append('chunk_index', i);
-            formData.append('total_chunks', totalChunks);
-
-            await fetch(`/api/upload/chunk/${this.jobId}`, {
+            // Raw body, the server writes it straight into the video file
+            await fetch(`/api/upload/chunk/${this.jobId}?chunk_index=${i}&total_chunks=${totalChunks}`, {
                 method: 'POST',
-                body: formData
+                headers: { 'Content-Type': 'application/octet-stream' },
+                body: chunk
             });
 
             uploadedChunks++;